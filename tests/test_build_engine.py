@@ -0,0 +1,123 @@
+"""Tests for the shared parallel build engine."""
+
+import io
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from wireviz_yaml_generator.build_engine import BuildSummary, build_drawings
+from wireviz_yaml_generator.exceptions import ConfigurationError
+from wireviz_yaml_generator.rendering.diagrams import RenderPipeline, RenderResult
+
+
+def _summary(**kwargs):
+    defaults = {
+        "drawings_dir": "svg",
+        "yaml_files": [("W001", "src/W001.yaml"), ("W002", "src/W002.yaml"), ("W003", "src/W003.yaml")],
+        "rendered": True,
+        "seconds": 4.25,
+    }
+    return BuildSummary(**(defaults | kwargs))
+
+
+def _report(summary, verbose=False):
+    out = io.StringIO()
+    summary.report(verbose=verbose, stream=out)
+    return out.getvalue()
+
+
+# --- BuildSummary ---
+
+
+def test_report_names_slowest_renders():
+    summary = _summary(
+        renders=[
+            RenderResult("W001", "svg/W001.svg", seconds=0.5),
+            RenderResult("W002", "svg/W002.svg", seconds=3.0),
+            RenderResult("W003", "svg/W003.svg", "boom", seconds=9.0),
+        ]
+    )
+    out = _report(summary)
+    assert "❌ WireViz error for W003: boom" in out
+    assert "SVG diagrams generated for 2 cables in 4.2 s; slowest: W002 3.0 s, W001 0.5 s." in out
+    assert "✅" not in out
+
+
+def test_verbose_report_lists_each_cable_with_timing():
+    summary = _summary(
+        skipped_cables=["W010"],
+        cached=True,
+        renders=[RenderResult("W001", "svg/W001.svg", cached=True), RenderResult("W002", "svg/W002.svg", seconds=1.5)],
+    )
+    out = _report(summary, verbose=True)
+    assert "⚠️ Skipping W010. No data found." in out
+    assert "✅ Diagram generated for W001 (cached)" in out
+    assert "✅ Diagram generated for W002 (1.50 s)" in out
+    assert "(1 from cache, 1 rendered)" in out
+
+
+def test_without_backend_existing_svgs_are_used(tmp_path):
+    (tmp_path / "W002.svg").write_text("<svg/>")
+    summary = _summary(drawings_dir=str(tmp_path), rendered=False)
+    assert summary.svg_paths == [("W002", str(tmp_path / "W002.svg"))]
+    assert "Skipping diagram generation" in _report(summary)
+
+
+# --- build_drawings ---
+
+
+def test_build_drawings_skips_missing_cables_and_renders_the_rest(tmp_path):
+    source = MagicMock()
+    source.load_net_table_by_cable.return_value = {"W001": ["row"]}
+    workflow = MagicMock()
+    workflow.run_yaml_workflow.side_effect = lambda cable, path, *a, **k: Path(path).write_text("{}\n") > 0
+    workflow.render_costs = {}
+    attachments = MagicMock()
+
+    with (
+        patch("wireviz_yaml_generator.rendering.diagrams.resolve_backend", return_value="cli"),
+        patch(
+            "wireviz_yaml_generator.rendering.diagrams._render_with_cli",
+            side_effect=lambda exe, cable, path, out: RenderResult(cable, f"{out}/{cable}.svg", seconds=0.1),
+        ),
+    ):
+        summary = build_drawings(
+            workflow,
+            source,
+            ["W001", "W002"],
+            yaml_dir=str(tmp_path / "src"),
+            drawings_dir=str(tmp_path / "svg"),
+            attachments=attachments,
+        )
+
+    attachments.assert_called_once_with()
+    source.load_net_table_by_cable.assert_called_once_with()
+    source.existing_cables.assert_not_called()
+    assert workflow.run_yaml_workflow.call_args.kwargs["net_rows"] == ["row"]
+    assert summary.skipped_cables == ["W002"]
+    assert summary.changed_cables == ["W001"]
+    assert summary.svg_paths == [("W001", f"{tmp_path / 'svg'}/W001.svg")]
+
+
+def test_build_drawings_passes_workflow_costs_without_reparsing(tmp_path):
+    source = MagicMock()
+    source.load_net_table_by_cable.return_value = {"W001": []}
+    workflow = MagicMock()
+    workflow.run_yaml_workflow.side_effect = lambda cable, path, *a, **k: Path(path).write_text("{}\n") > 0
+    workflow.render_costs = {"W001": 42}
+
+    with (
+        patch("wireviz_yaml_generator.rendering.diagrams.resolve_backend", return_value="cli"),
+        patch("wireviz_yaml_generator.rendering.diagrams.estimate_cost", side_effect=AssertionError("re-parsed")),
+        patch.object(RenderPipeline, "submit", autospec=True) as submit,
+    ):
+        build_drawings(workflow, source, ["W001"], yaml_dir=str(tmp_path / "src"), drawings_dir=str(tmp_path / "svg"))
+
+    assert submit.call_args.kwargs["cost"] == 42
+
+
+def test_build_drawings_rejects_invalid_worker_count(tmp_path):
+    source = MagicMock()
+    source.load_net_table_by_cable.return_value = {}
+    with pytest.raises(ConfigurationError, match="at least 1"):
+        build_drawings(MagicMock(), source, [], yaml_dir=str(tmp_path), drawings_dir=str(tmp_path), max_workers=0)
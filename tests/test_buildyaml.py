@@ -1,13 +1,22 @@
 """Unit Tests for BuildYaml Module."""
 
+import math
+import os
+from unittest.mock import patch
+
+import pytest
 import yaml
 from wireviz_yaml_generator.BuildYaml import (
     _clean_dict,
+    _emit_schema,
     build_yaml_file,
     cable_to_dict,
     connection_to_list,
     connector_to_dict,
+    render_yaml,
+    write_if_changed,
 )
+from wireviz_yaml_generator.exceptions import ConfigurationError
 from wireviz_yaml_generator.models import Cable, Connection, Connector
 
 
@@ -219,3 +228,157 @@ def test_build_yaml_file_round_trip(tmp_path):
 
     assert len(data["connections"]) == 2
     assert len(data["connections"][0]) == 3
+
+
+# --- Write skipping ---
+
+SIMPLE = (
+    [Connector(designator="J1", pincount=1), Connector(designator="J2", pincount=1)],
+    [Cable(designator="W001", wire_count=1, wire_labels=["Sig"])],
+    [Connection("J1", "1", "J2", "1", "W001", 1, "Sig")],
+)
+
+
+def test_render_yaml_matches_written_file(tmp_path):
+    yaml_path = tmp_path / "W001.yaml"
+    assert build_yaml_file(*SIMPLE, str(yaml_path)) is True
+    assert yaml_path.read_text(encoding="utf-8") == render_yaml(*SIMPLE)
+
+
+def test_unchanged_yaml_is_not_rewritten(tmp_path):
+    yaml_path = tmp_path / "W001.yaml"
+    build_yaml_file(*SIMPLE, str(yaml_path))
+    os.utime(yaml_path, ns=(0, 0))
+
+    assert build_yaml_file(*SIMPLE, str(yaml_path)) is False
+    assert yaml_path.stat().st_mtime_ns == 0
+
+
+def test_changed_yaml_is_replaced(tmp_path):
+    yaml_path = tmp_path / "W001.yaml"
+    build_yaml_file(*SIMPLE, str(yaml_path))
+
+    connectors, cables, connections = SIMPLE
+    renamed = [Cable(designator="W001", wire_count=1, wire_labels=["Renamed"])]
+    assert build_yaml_file(connectors, renamed, connections, str(yaml_path)) is True
+    assert "Renamed" in yaml_path.read_text(encoding="utf-8")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["W001.yaml"]
+
+
+def test_failed_write_keeps_old_file(tmp_path):
+    yaml_path = tmp_path / "W001.yaml"
+    write_if_changed(str(yaml_path), "old: 1\n")
+
+    with (
+        patch("wireviz_yaml_generator.BuildYaml.os.replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError),
+    ):
+        write_if_changed(str(yaml_path), "new: 2\n")
+
+    assert yaml_path.read_text(encoding="utf-8") == "old: 1\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["W001.yaml"]
+
+
+# --- Emitters ---
+
+TRICKY_STRINGS = [
+    "yes",
+    "No",
+    "ON",
+    "off",
+    "true",
+    "null",
+    "~",
+    "",
+    " lead",
+    "trail ",
+    "1",
+    "1.0",
+    "0x1F",
+    "1_000",
+    "1:20",
+    "2001-01-01",
+    ".inf",
+    "-",
+    "- item",
+    "#comment",
+    "a: b",
+    "a #b",
+    "'single'",
+    '"double"',
+    "back\\slash",
+    "tab\there",
+    "line\nbreak",
+    "sep\u2028",
+    "del\x7f",
+    "bom\ufeff",
+    "ÆØÅ µ Ω",
+    "emoji 🔌",
+    "<<",
+    "=",
+    "+24V",
+    "J1-X1",
+    "../resources/X.png",
+    "@at",
+    "%pct",
+    "!tag",
+    "&anchor",
+    "*alias",
+    "{flow}",
+    "[seq]",
+]
+
+
+def _tricky_model():
+    connectors = [
+        Connector(designator=s or "empty", mpn=s, pincount=4, notes=s, pins=[1, "2", s], loops=[[1, s]])
+        for s in TRICKY_STRINGS
+    ]
+    connectors.append(Connector(designator="J9", image_src="../resources/a b.png", image_caption="ISO view"))
+    cables = [
+        Cable(designator="W001", wire_count=3, wire_labels=TRICKY_STRINGS, gauge=0.5, length=1e20, colors=["RD"]),
+        Cable(designator="W002", wire_count=1, wire_labels=["x"], gauge=1e-05, notes="1.5"),
+    ]
+    connections = [Connection(s or "empty", s, "J2", "1", "W001", i, s) for i, s in enumerate(TRICKY_STRINGS, 1)]
+    return connectors, cables, connections
+
+
+@pytest.mark.parametrize("emitter", ["schema", "libyaml", "auto"])
+def test_emitters_round_trip_like_reference(emitter):
+    if emitter == "libyaml" and not yaml.__with_libyaml__:
+        pytest.skip("PyYAML built without libyaml")
+    model = _tricky_model()
+
+    reference = render_yaml(*model, emitter="pyyaml")
+    result = render_yaml(*model, emitter=emitter)
+
+    assert result.startswith("# WireViz YAML file")
+    assert yaml.safe_load(result) == yaml.safe_load(reference)
+
+
+def test_schema_emitter_keeps_line_separators():
+    """NEL/LS/PS are escaped; the pure-Python reference dumper folds NEL into a space."""
+    for text in ("nel\x85end", "ls\u2028end", "ps\u2029end"):
+        assert yaml.safe_load(_emit_schema({"k": text})) == {"k": text}
+
+
+def test_schema_emitter_layout_matches_reference_for_plain_data():
+    """For ordinary designators and numbers the schema emitter writes the same text as PyYAML."""
+    assert render_yaml(*SIMPLE, emitter="schema") == render_yaml(*SIMPLE, emitter="pyyaml")
+
+
+def test_schema_emitter_special_floats():
+    data = {"values": [float("inf"), float("-inf"), 1e20, 0.1, -2.5, 3.0]}
+    assert yaml.safe_load(_emit_schema(data)) == data
+    assert math.isnan(yaml.safe_load(_emit_schema({"nan": float("nan")}))["nan"])
+
+
+def test_empty_document():
+    assert yaml.safe_load(render_yaml([], [], [], emitter="schema")) == yaml.safe_load(
+        render_yaml([], [], [], emitter="pyyaml")
+    )
+
+
+def test_unknown_emitter_raises():
+    with pytest.raises(ConfigurationError, match="emitter"):
+        render_yaml(*SIMPLE, emitter="fast")
@@ -0,0 +1,87 @@
+"""Tests for the catalog snapshot cache."""
+
+import threading
+
+from wireviz_yaml_generator.catalog_cache import CatalogCache
+
+
+def _counting_loader(rows):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return list(rows)
+
+    return loader, calls
+
+
+def test_hit_returns_same_snapshot():
+    cache = CatalogCache()
+    loader, calls = _counting_loader(["a", "b"])
+
+    first = cache.get("src", 1, "T", loader)
+    second = cache.get("src", 1, "T", loader)
+
+    assert first == ("a", "b")
+    assert second is first
+    assert len(calls) == 1
+
+
+def test_version_change_reloads_every_table():
+    cache = CatalogCache()
+    loader_a, calls_a = _counting_loader(["a"])
+    loader_b, calls_b = _counting_loader(["b"])
+
+    cache.get("src", 1, "A", loader_a)
+    cache.get("src", 1, "B", loader_b)
+    cache.get("src", 2, "A", loader_a)
+    cache.get("src", 2, "B", loader_b)
+
+    assert len(calls_a) == 2
+    assert len(calls_b) == 2
+
+
+def test_sources_are_independent():
+    cache = CatalogCache()
+    loader, calls = _counting_loader(["x"])
+
+    cache.get("one", 1, "T", loader)
+    cache.get("two", 1, "T", loader)
+    cache.get("one", 1, "T", loader)
+
+    assert len(calls) == 2
+
+
+def test_invalidate_and_clear():
+    cache = CatalogCache()
+    loader, calls = _counting_loader(["x"])
+
+    cache.get("src", 1, "T", loader)
+    cache.invalidate("src")
+    cache.get("src", 1, "T", loader)
+    cache.clear()
+    cache.get("src", 1, "T", loader)
+
+    assert len(calls) == 3
+
+
+def test_concurrent_loads_share_one_snapshot():
+    cache = CatalogCache()
+    barrier = threading.Barrier(4)
+    results = []
+
+    def loader():
+        return ["x"]
+
+    def worker():
+        barrier.wait()
+        results.append(cache.get("src", 1, "T", loader))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results[0] == ("x",)
+    assert all(r is results[0] for r in results)
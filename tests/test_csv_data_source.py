@@ -1,5 +1,8 @@
 """Tests for CsvDataSource."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 import yaml
 from wireviz_yaml_generator.csv_data_source import CsvDataSource
@@ -72,6 +75,31 @@ def test_load_net_table_filtered(tmp_path):
     assert rows[0].cable_des == "W001"
 
 
+def test_load_net_table_by_cable(tmp_path):
+    """Partitions match per-cable filtered loads and keep row order."""
+    csv = _write_csv(
+        tmp_path,
+        f"{REQUIRED_HEADER}\nW001,J1,X1,1,J2,,1,A\nW002,J3,,1,J4,,1,B\nW001,J1,X1,2,J2,,2,C\n",
+    )
+    ds = CsvDataSource(csv)
+    partitions = ds.load_net_table_by_cable()
+    assert list(partitions) == ["W001", "W002"]
+    assert [r.net_name for r in partitions["W001"]] == ["A", "C"]
+    assert partitions["W002"] == ds.load_net_table("W002")
+
+
+def test_iter_net_rows(tmp_path):
+    """Streaming rows match load_net_table; ordered=True sorts by cable then endpoint."""
+    csv = _write_csv(
+        tmp_path,
+        f"{REQUIRED_HEADER}\nW002,J3,,1,J4,,1,B\nW001,J1,X1,2,J2,,2,C\nW001,J1,X1,1,J2,,1,A\n",
+    )
+    ds = CsvDataSource(csv)
+    assert list(ds.iter_net_rows()) == ds.load_net_table()
+    assert [r.net_name for r in ds.iter_net_rows(ordered=True)] == ["A", "C", "B"]
+    assert [r.net_name for r in ds.iter_net_rows("W001")] == ["C", "A"]
+
+
 # --- Cable existence ---
 
 
@@ -83,6 +111,13 @@ def test_check_cable_existence(tmp_path):
     assert ds.check_cable_existence("W999") is False
 
 
+def test_list_and_existing_cables(tmp_path):
+    csv = _write_csv(tmp_path, f"{REQUIRED_HEADER}\nW002,J1,X1,1,J2,,1,Sig\nW001,J3,,1,J4,,1,Other\n")
+    ds = CsvDataSource(csv)
+    assert ds.list_cables() == ["W001", "W002"]
+    assert ds.existing_cables(["W000", "W002", "W001", "W003"]) == ["W002", "W001"]
+
+
 # --- Designator table ---
 
 
@@ -128,7 +163,7 @@ def test_load_connector_table_missing_catalog(tmp_path):
     csv = _write_csv(tmp_path, f"{REQUIRED_HEADER},conn_mpn_1\nW001,J1,X1,1,J2,,1,Sig,MPN-A\n")
     ds = CsvDataSource(csv)
     result = ds.load_connector_table()
-    assert result == []
+    assert result == ()
 
 
 # --- Cable table ---
@@ -151,7 +186,142 @@ def test_load_cable_table_missing_columns(tmp_path):
     csv = _write_csv(tmp_path, f"{REQUIRED_HEADER}\nW001,J1,X1,1,J2,,1,Sig\n")
     ds = CsvDataSource(csv)
     result = ds.load_cable_table()
-    assert result == []
+    assert result == ()
+
+
+# --- Per-cable index ---
+
+
+def test_filtered_load_uses_cable_index(tmp_path):
+    """Filtered loads read only the cable's indexed rows, in file order."""
+    csv = _write_csv(
+        tmp_path,
+        f"{REQUIRED_HEADER}\nW001,J1,X1,1,J2,,1,A\nW002,J3,,1,J4,,1,B\nW001,J1,X1,2,J2,,2,C\n",
+    )
+    ds = CsvDataSource(csv)
+    assert [r.net_name for r in ds.load_net_table("W001")] == ["A", "C"]
+    assert ds.load_net_table("W999") == []
+    assert ds._net_rows_by_cable["W002"][0].net_name == "B"
+
+
+def test_catalog_loads_return_same_immutable_tuple(tmp_path):
+    """Repeated catalog loads are O(1): the same precomputed tuple every time."""
+    csv = _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row() + "\n")
+    ds = CsvDataSource(csv)
+    for load in (ds.load_designator_table, ds.load_connector_table, ds.load_cable_table):
+        first = load()
+        assert isinstance(first, tuple)
+        assert load() is first
+
+
+# --- Catalog snapshot cache ---
+
+
+def test_catalog_reused_for_identical_content(tmp_path):
+    """Re-opening an unchanged CSV serves catalog tables from the snapshot cache."""
+    csv = _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row() + "\n")
+    first = CsvDataSource(csv).load_connector_table()
+
+    with patch.object(CsvDataSource, "_build_connector_table", side_effect=AssertionError("re-parsed")):
+        assert CsvDataSource(csv).load_connector_table() == first
+
+
+def test_catalog_invalidated_when_content_changes(tmp_path):
+    csv = _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row(gauge="0.5") + "\n")
+    assert CsvDataSource(csv).load_cable_table()[0].wire_gauge == 0.5
+
+    _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row(gauge="1.5") + "\n")
+    assert CsvDataSource(csv).load_cable_table()[0].wire_gauge == 1.5
+
+
+# --- Sidecar cache ---
+
+
+def test_sidecar_written_and_reused(tmp_path):
+    """A warm start loads the sidecar without parsing the CSV."""
+    csv = _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row() + "\n" + _full_row(p1="2", p2="2") + "\n")
+    cold = CsvDataSource(csv, sidecar_cache=True)
+    assert (tmp_path / "test.csv.wvcache").exists()
+
+    with patch.object(CsvDataSource, "_parse", side_effect=AssertionError("re-parsed")):
+        warm = CsvDataSource(csv, sidecar_cache=True)
+
+    assert warm.load_net_table() == cold.load_net_table()
+    assert warm.load_net_table("W001") == cold.load_net_table("W001")
+    assert warm.load_designator_table() == cold.load_designator_table()
+    assert warm.load_connector_table() == cold.load_connector_table()
+    assert warm.load_cable_table() == cold.load_cable_table()
+
+
+def test_sidecar_ignored_when_content_changes(tmp_path):
+    csv = _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row(gauge="0.5") + "\n")
+    CsvDataSource(csv, sidecar_cache=True)
+
+    _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row(gauge="10.5") + "\n")
+    assert CsvDataSource(csv, sidecar_cache=True).load_cable_table()[0].wire_gauge == 10.5
+
+
+def test_sidecar_reused_when_only_mtime_changes(tmp_path):
+    """A touched but unchanged file is recognized by its content hash."""
+    csv = _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row() + "\n")
+    CsvDataSource(csv, sidecar_cache=True)
+    stat = (tmp_path / "test.csv").stat()
+    os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    with patch.object(CsvDataSource, "_parse", side_effect=AssertionError("re-parsed")):
+        assert len(CsvDataSource(csv, sidecar_cache=True).load_net_table()) == 1
+
+
+def test_sidecar_not_stale_when_csv_rewritten_during_parse(tmp_path):
+    """A same-size rewrite while the CSV is parsed is picked up on the next load."""
+    csv = _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row(gauge="0.5") + "\n")
+    parse = CsvDataSource._parse
+
+    def parse_then_rewrite(self, path, options):
+        parsed = parse(self, path, options)
+        stat = path.stat()
+        _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row(gauge="0.7") + "\n")
+        os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        return parsed
+
+    with patch.object(CsvDataSource, "_parse", parse_then_rewrite):
+        assert CsvDataSource(csv, sidecar_cache=True).load_cable_table()[0].wire_gauge == 0.5
+
+    assert CsvDataSource(csv, sidecar_cache=True).load_cable_table()[0].wire_gauge == 0.7
+
+
+def test_corrupt_sidecar_falls_back_to_parsing(tmp_path):
+    csv = _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row() + "\n")
+    CsvDataSource(csv, sidecar_cache=True)
+    (tmp_path / "test.csv.wvcache").write_bytes(b"\x00garbage")
+
+    assert len(CsvDataSource(csv, sidecar_cache=True).load_net_table()) == 1
+    with patch.object(CsvDataSource, "_parse", side_effect=AssertionError("re-parsed")):
+        CsvDataSource(csv, sidecar_cache=True)
+
+
+def test_sidecar_not_reused_with_different_options(tmp_path):
+    content = f"{FULL_HEADER}\n" + _full_row(cable="") + "\n"
+    csv = _write_csv(tmp_path, content)
+    CsvDataSource(csv, auto_generate_cable_des=True, sidecar_cache=True)
+
+    ds = CsvDataSource(csv, auto_generate_cable_des=True, cable_prefix="C", sidecar_cache=True)
+    assert ds.list_cables() == ["C001"]
+
+
+def test_sidecar_in_cache_dir(tmp_path):
+    csv = _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row() + "\n")
+    cache_dir = tmp_path / "cache"
+    CsvDataSource(csv, sidecar_cache=True, cache_dir=str(cache_dir))
+
+    assert not (tmp_path / "test.csv.wvcache").exists()
+    assert len(list(cache_dir.glob("test.csv.*.wvcache"))) == 1
+
+
+def test_no_sidecar_by_default(tmp_path):
+    csv = _write_csv(tmp_path, f"{FULL_HEADER}\n" + _full_row() + "\n")
+    CsvDataSource(csv)
+    assert not (tmp_path / "test.csv.wvcache").exists()
 
 
 # --- Error handling ---
@@ -185,9 +355,9 @@ def test_minimal_csv_only_required(tmp_path):
     csv = _write_csv(tmp_path, f"{REQUIRED_HEADER}\nW001,J1,X1,1,J2,,1,Sig\n")
     ds = CsvDataSource(csv)
     assert len(ds.load_net_table()) == 1
-    assert ds.load_designator_table() == []
-    assert ds.load_connector_table() == []
-    assert ds.load_cable_table() == []
+    assert ds.load_designator_table() == ()
+    assert ds.load_connector_table() == ()
+    assert ds.load_cable_table() == ()
 
 
 # --- End-to-end with WorkflowManager ---
@@ -0,0 +1,275 @@
+"""Tests for SqliteDataSource."""
+
+import os
+import sqlite3
+import threading
+from unittest.mock import patch
+
+import pytest
+from wireviz_yaml_generator.data_access import SqliteDataSource
+from wireviz_yaml_generator.exceptions import DatabaseError
+
+SCHEMA = """
+CREATE TABLE NetTable (
+    cable_des TEXT, comp_des_1 TEXT, conn_des_1 TEXT, pin_1 TEXT,
+    comp_des_2 TEXT, conn_des_2 TEXT, pin_2 TEXT, net_name TEXT
+);
+CREATE TABLE DesignatorTable (comp_des TEXT, conn_des TEXT, conn_mpn TEXT);
+CREATE TABLE ConnectorTable (
+    mpn TEXT, pincount INTEGER, mate_mpn TEXT, pin_mpn TEXT, description TEXT, manufacturer TEXT
+);
+CREATE TABLE CableTable (cable_des TEXT, wire_gauge REAL, length REAL, note TEXT);
+"""
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "master.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO NetTable VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            ("W001", "J1", "X1", "1", "J2", "", "1", "SigA"),
+            ("W001", "J1", "X1", "2", "J2", "", "2", "+24V"),
+            ("W002", "J3", "", "1", "J4", "", "1", "gnd"),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO DesignatorTable VALUES (?, ?, ?)",
+        [("J1", "X1", "MPN-A"), ("J2", "", "MPN-B")],
+    )
+    conn.execute("INSERT INTO ConnectorTable VALUES ('MPN-A', 4, 'MATE-A', 'PIN-A', 'Desc', 'Mfg')")
+    conn.execute("INSERT INTO CableTable VALUES ('W001', 0.5, 1000.0, 'Note')")
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+# --- Loaders ---
+
+
+def test_load_net_table_filtered(db_path):
+    with SqliteDataSource(db_path) as ds:
+        rows = ds.load_net_table("W001")
+    assert [r.net_name for r in rows] == ["SigA", "+24V"]
+
+
+def test_load_net_table_by_cable(db_path):
+    with SqliteDataSource(db_path) as ds:
+        partitions = ds.load_net_table_by_cable()
+        assert sorted(partitions) == ["W001", "W002"]
+        assert partitions["W001"] == ds.load_net_table("W001")
+        assert partitions["W002"] == ds.load_net_table("W002")
+
+
+def test_iter_net_rows_streams_in_batches(db_path):
+    with SqliteDataSource(db_path) as ds:
+        rows = ds.iter_net_rows(batch_size=1)
+        assert next(rows).net_name == "SigA"
+        assert [r.net_name for r in rows] == ["+24V", "gnd"]
+
+
+def test_iter_net_rows_ordered_matches_python_sort(db_path):
+    writer = sqlite3.connect(db_path)
+    writer.execute("INSERT INTO NetTable VALUES ('W001', 'J0', 'X9', '3', 'J2', '', '3', 'Early')")
+    writer.execute("INSERT INTO NetTable VALUES ('W001', 'J1', 'X1', '1', 'J5', '', '1', 'Dup')")
+    writer.commit()
+    writer.close()
+
+    with SqliteDataSource(db_path) as ds:
+        expected = sorted(ds.load_net_table(), key=lambda r: (r.cable_des, r.comp_des_1, r.conn_des_1, r.pin_1))
+        assert list(ds.iter_net_rows(ordered=True)) == expected
+        assert [r.net_name for r in ds.iter_net_rows("W002", ordered=True)] == ["gnd"]
+
+
+def test_load_catalog_tables(db_path):
+    with SqliteDataSource(db_path) as ds:
+        assert len(ds.load_designator_table()) == 2
+        assert ds.load_connector_table()[0].mate_mpn == "MATE-A"
+        assert ds.load_cable_table()[0].wire_gauge == 0.5
+
+
+def test_check_cable_existence(db_path):
+    with SqliteDataSource(db_path) as ds:
+        assert ds.check_cable_existence("W001") is True
+        assert ds.check_cable_existence("W999") is False
+
+
+def test_list_and_existing_cables(db_path):
+    with SqliteDataSource(db_path) as ds:
+        assert ds.list_cables() == ["W001", "W002"]
+        assert ds.existing_cables(["W003", "W002", "W000", "W001"]) == ["W002", "W001"]
+
+
+def test_check_cable_existence_quotes_are_parameters(db_path):
+    """Designators are bound as parameters, not spliced into SQL."""
+    with SqliteDataSource(db_path) as ds:
+        assert ds.check_cable_existence("W001' OR '1'='1") is False
+
+
+def test_missing_database_raises(tmp_path):
+    ds = SqliteDataSource(str(tmp_path / "missing.db"))
+    with pytest.raises(DatabaseError):
+        ds.load_net_table()
+
+
+# --- Column projection ---
+
+
+def test_extra_columns_are_ignored(tmp_path):
+    """Customer databases with additional columns still load."""
+    path = tmp_path / "extra.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.execute("ALTER TABLE NetTable ADD COLUMN harness_rev TEXT")
+    conn.execute("INSERT INTO NetTable VALUES ('W001', 'J1', 'X1', '1', 'J2', '', '1', 'Sig', 'B')")
+    conn.commit()
+    conn.close()
+
+    statements: list[str] = []
+    with SqliteDataSource(str(path)) as ds:
+        ds._connection().set_trace_callback(statements.append)
+        rows = ds.load_net_table()
+
+    assert rows[0].net_name == "Sig"
+    assert not any("harness_rev" in q or "SELECT *" in q for q in statements)
+
+
+def test_absent_optional_columns_use_model_defaults(tmp_path):
+    path = tmp_path / "minimal.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE ConnectorTable (mpn TEXT, pincount INTEGER, mate_mpn TEXT, pin_mpn TEXT)")
+    conn.execute("INSERT INTO ConnectorTable VALUES ('MPN-A', 4, 'MATE-A', 'PIN-A')")
+    conn.execute("CREATE TABLE CableTable (cable_des TEXT, wire_gauge REAL, length REAL, note TEXT, colors TEXT)")
+    conn.execute("INSERT INTO CableTable VALUES ('W001', 0.5, 1000.0, 'Note', 'RD:BK')")
+    conn.commit()
+    conn.close()
+
+    with SqliteDataSource(str(path)) as ds:
+        connector = ds.load_connector_table()[0]
+        cable = ds.load_cable_table()[0]
+
+    assert (connector.description, connector.manufacturer) == ("", "")
+    assert cable.category == "bundle"
+    assert cable.colors == "RD:BK"
+
+
+def test_missing_required_column_raises(tmp_path):
+    path = tmp_path / "broken.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE DesignatorTable (comp_des TEXT, conn_des TEXT)")
+    conn.commit()
+    conn.close()
+
+    with SqliteDataSource(str(path)) as ds, pytest.raises(DatabaseError, match="conn_mpn"):
+        ds.load_designator_table()
+
+
+def test_missing_table_raises(tmp_path):
+    path = tmp_path / "empty.db"
+    sqlite3.connect(path).close()
+
+    with SqliteDataSource(str(path)) as ds, pytest.raises(DatabaseError, match="no such table"):
+        ds.load_net_table()
+
+
+# --- Connection lifecycle ---
+
+
+def test_connection_reused_across_calls(db_path):
+    ds = SqliteDataSource(db_path)
+    first = ds._connection()
+    ds.load_net_table("W001")
+    ds.check_cable_existence("W002")
+    assert ds._connection() is first
+    ds.close()
+
+
+def test_connection_is_read_only(db_path):
+    with SqliteDataSource(db_path) as ds, pytest.raises(sqlite3.OperationalError, match="readonly"):
+        ds._connection().execute("DELETE FROM NetTable")
+
+
+def test_close_releases_and_reopens(db_path):
+    ds = SqliteDataSource(db_path)
+    first = ds._connection()
+    ds.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
+    assert ds._connection() is not first
+    assert len(ds.load_net_table()) == 3
+    ds.close()
+
+
+def test_one_connection_per_thread(db_path):
+    ds = SqliteDataSource(db_path)
+    seen: list[sqlite3.Connection] = []
+
+    def worker():
+        seen.append(ds._connection())
+        assert len(ds.load_net_table("W002")) == 1
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(c) for c in seen}) == 3
+    assert len(ds._pool) == 3
+    ds.close()
+    assert ds._pool == []
+
+
+# --- Catalog snapshot cache ---
+
+
+def test_catalog_reused_across_instances(db_path):
+    """A second data source on the same unchanged file skips catalog parsing."""
+    with SqliteDataSource(db_path) as ds:
+        first = ds.load_connector_table()
+
+    with (
+        SqliteDataSource(db_path) as ds,
+        patch.object(SqliteDataSource, "_read_connector_table", side_effect=AssertionError("re-read")),
+    ):
+        assert ds.load_connector_table() == first
+
+
+def test_catalog_returns_shared_immutable_snapshot(db_path):
+    """Repeated loads return the same tuple rather than copying the table."""
+    with SqliteDataSource(db_path) as ds:
+        rows = ds.load_designator_table()
+        assert isinstance(rows, tuple)
+        assert ds.load_designator_table() is rows
+
+
+def test_catalog_invalidated_by_external_commit(db_path):
+    with SqliteDataSource(db_path) as ds:
+        assert [c.cable_des for c in ds.load_cable_table()] == ["W001"]
+
+        writer = sqlite3.connect(db_path)
+        writer.execute("INSERT INTO CableTable VALUES ('W002', 1.5, 500.0, '')")
+        writer.commit()
+        writer.close()
+
+        assert [c.cable_des for c in ds.load_cable_table()] == ["W001", "W002"]
+
+
+def test_catalog_follows_replaced_database_file(db_path, tmp_path):
+    """Replacing the file (new inode) must not serve or cache the old file's rows."""
+    replacement = tmp_path / "new.db"
+    writer = sqlite3.connect(replacement)
+    writer.executescript(SCHEMA)
+    writer.executemany("INSERT INTO CableTable VALUES (?, 1.0, 100.0, '')", [(f"W00{i}",) for i in range(1, 6)])
+    writer.commit()
+    writer.close()
+
+    with SqliteDataSource(db_path) as ds:
+        assert len(ds.load_cable_table()) == 1
+        os.replace(replacement, db_path)
+        assert len(ds.load_cable_table()) == 5
+
+    with SqliteDataSource(db_path) as ds:
+        assert len(ds.load_cable_table()) == 5
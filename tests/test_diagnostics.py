@@ -0,0 +1,83 @@
+"""Tests for the Diagnostics collector."""
+
+import io
+import json
+import threading
+
+from wireviz_yaml_generator.diagnostics import Diagnostic, Diagnostics
+
+
+def test_warnings_deduplicated_per_code_and_subject():
+    diagnostics = Diagnostics()
+    diagnostics.warn("missing-mpn", "J1-X1", "first message")
+    diagnostics.warn("missing-mpn", "J2", "other subject")
+    diagnostics.warn("missing-mpn", "J1-X1", "repeat with different text")
+    diagnostics.warn("other-code", "J1-X1", "other code")
+
+    assert list(diagnostics) == [
+        Diagnostic("missing-mpn", "J1-X1", "first message", 2),
+        Diagnostic("missing-mpn", "J2", "other subject", 1),
+        Diagnostic("other-code", "J1-X1", "other code", 1),
+    ]
+
+
+def test_report_prints_each_warning_once():
+    diagnostics = Diagnostics()
+    for _ in range(3):
+        diagnostics.warn("missing-mpn", "J1-X1", "MPN 'A' not found.")
+    diagnostics.warn("missing-mpn", "J2", "MPN 'B' not found.")
+
+    out = io.StringIO()
+    diagnostics.report(out)
+    assert out.getvalue().splitlines() == [
+        "⚠️  Warning: MPN 'A' not found. (3x)",
+        "⚠️  Warning: MPN 'B' not found.",
+    ]
+
+
+def test_to_json():
+    diagnostics = Diagnostics()
+    diagnostics.warn("missing-mpn", "J1-X1", "msg")
+    diagnostics.warn("missing-mpn", "J1-X1", "msg")
+
+    assert json.loads(diagnostics.to_json()) == [
+        {"code": "missing-mpn", "subject": "J1-X1", "message": "msg", "count": 2, "details": []}
+    ]
+
+
+def test_details_collected_once_each():
+    diagnostics = Diagnostics()
+    for detail in ("J1-X1", "J2", "J1-X1"):
+        diagnostics.warn("missing-mpn", "ABC", "MPN 'ABC' not found.", detail=detail)
+
+    assert list(diagnostics) == [Diagnostic("missing-mpn", "ABC", "MPN 'ABC' not found.", 3, ("J1-X1", "J2"))]
+    out = io.StringIO()
+    diagnostics.report(out)
+    assert out.getvalue() == "⚠️  Warning: MPN 'ABC' not found. Affected: J1-X1, J2. (3x)\n"
+
+
+def test_empty_and_clear():
+    diagnostics = Diagnostics()
+    assert len(diagnostics) == 0
+    assert json.loads(diagnostics.to_json()) == []
+
+    diagnostics.warn("code", "subject", "msg")
+    assert len(diagnostics) == 1
+    diagnostics.clear()
+    assert list(diagnostics) == []
+
+
+def test_concurrent_warnings_are_all_counted():
+    diagnostics = Diagnostics()
+
+    def worker():
+        for _ in range(1000):
+            diagnostics.warn("code", "subject", "msg")
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert next(iter(diagnostics)).count == 4000
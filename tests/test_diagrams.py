@@ -0,0 +1,285 @@
+"""Tests for the WireViz rendering backends."""
+
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from wireviz_yaml_generator.exceptions import ConfigurationError
+from wireviz_yaml_generator.rendering import diagrams
+from wireviz_yaml_generator.rendering.diagrams import RenderPipeline, RenderResult, render_svgs, resolve_backend
+from wireviz_yaml_generator.rendering.svg_cache import SvgCache
+
+
+def _which(available):
+    return lambda name: f"/usr/bin/{name}" if name in available else None
+
+
+# --- Backend selection ---
+
+
+def test_auto_uses_cli_even_when_python_backend_is_available():
+    # The process pool re-imports __main__ in its workers; it must be asked for
+    with patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", side_effect=_which({"dot", "wireviz"})):
+        assert resolve_backend("auto") == "cli"
+
+
+def test_auto_without_cli_renders_nothing():
+    with (
+        patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", side_effect=_which({"dot"})),
+        patch("wireviz_yaml_generator.rendering.diagrams.importlib.util.find_spec", return_value=object()),
+    ):
+        assert resolve_backend("auto") is None
+
+
+def test_auto_without_any_backend():
+    with patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", return_value=None):
+        assert resolve_backend("auto") is None
+        assert render_svgs([("W001", "W001.yaml")], "out") == []
+
+
+def test_python_backend_requires_wireviz_package():
+    with (
+        patch("wireviz_yaml_generator.rendering.diagrams.importlib.util.find_spec", return_value=None),
+        pytest.raises(ConfigurationError, match="wireviz package"),
+    ):
+        resolve_backend("python")
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ConfigurationError, match="render_backend"):
+        resolve_backend("graphviz")
+
+
+# --- Python backend ---
+
+
+def test_render_yaml_text_passes_yaml_in_memory(tmp_path):
+    with patch("wireviz.wireviz.parse") as mock_parse:
+        result = diagrams._render_yaml_text("W001", "connectors: {}\n", str(tmp_path), "/yaml/dir")
+
+    assert (result.cable_des, result.svg_path, result.error) == ("W001", str(tmp_path / "W001.svg"), None)
+    assert result.seconds >= 0
+    args, kwargs = mock_parse.call_args
+    assert args == ("connectors: {}\n",)
+    assert kwargs["output_formats"] == ("svg",)
+    assert kwargs["output_name"] == "W001"
+    assert kwargs["image_paths"] == ["/yaml/dir"]
+
+
+def test_render_yaml_text_reports_errors(tmp_path):
+    with patch("wireviz.wireviz.parse", side_effect=Exception("W001 is an unknown template")):
+        result = diagrams._render_yaml_text("W001", "", str(tmp_path), str(tmp_path))
+
+    assert result.error == "Exception: W001 is an unknown template"
+
+
+def test_worker_pool_reports_failures_per_cable(tmp_path):
+    """Runs the real process pool; a non-mapping document fails inside WireViz."""
+    bad = tmp_path / "W002.yaml"
+    bad.write_text("- not a harness\n", encoding="utf-8")
+    worse = tmp_path / "W001.yaml"
+    worse.write_text("[]\n", encoding="utf-8")
+
+    results = render_svgs([("W002", str(bad)), ("W001", str(worse))], str(tmp_path / "out"), backend="python")
+
+    assert [r.cable_des for r in results] == ["W001", "W002"]
+    assert all(r.error and r.error.startswith("TypeError") for r in results)
+
+
+def test_worker_pool_does_not_fork():
+    """Workers must not be forked from the multi-threaded build."""
+    pool = diagrams._process_pool(1)
+    try:
+        assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+    finally:
+        pool.shutdown()
+
+
+# --- CLI backend ---
+
+
+def test_cli_backend_runs_one_process_per_cable(tmp_path):
+    a, b = tmp_path / "a.yaml", tmp_path / "b.yaml"
+    a.write_text("connectors: {}\n")
+    b.write_text("connectors: {}\n")
+    out = str(tmp_path / "out")
+    failure = subprocess.CalledProcessError(1, "wireviz", stderr="boom")
+    with (
+        patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", side_effect=_which({"wireviz"})),
+        patch("wireviz_yaml_generator.rendering.diagrams.subprocess.run", side_effect=[None, failure]) as mock_run,
+    ):
+        results = render_svgs([("W001", str(a)), ("W002", str(b))], out, backend="cli", max_workers=1)
+
+    assert mock_run.call_count == 2
+    assert mock_run.call_args_list[0].args[0] == ["/usr/bin/wireviz", str(a), "--format", "s", "--output-dir", out]
+    assert [(r.cable_des, r.svg_path, r.error) for r in results] == [
+        ("W001", f"{out}/W001.svg", None),
+        ("W002", f"{out}/W002.svg", "boom"),
+    ]
+
+
+# --- Scheduling ---
+
+
+def _harness(connections, connectors=1, images=0):
+    lines = ["connectors:"]
+    for i in range(connectors):
+        lines.append(f"  X{i}:")
+        lines.append("    pincount: 1")
+        if i < images:
+            lines.append("    image:")
+            lines.append(f"      src: ../resources/X{i}.png")
+    lines.append("connections:")
+    lines += ["- - X0: 1", "  - W: 1", "  - X0: 1"] * connections
+    return "\n".join(lines) + "\n"
+
+
+def test_estimate_cost_counts_connections_connectors_and_images():
+    assert diagrams.estimate_cost(_harness(0, connectors=0)) == 0
+    assert diagrams.estimate_cost(_harness(3, connectors=2, images=1)) == (
+        3 * diagrams.COST_PER_CONNECTION + 2 * diagrams.COST_PER_CONNECTOR + diagrams.COST_PER_IMAGE
+    )
+    assert diagrams.estimate_cost("- not a harness\n") == 0
+
+
+def test_largest_cables_are_submitted_first(tmp_path):
+    sizes = {"W001": 2, "W002": 50, "W003": 10, "W004": 50}
+    yaml_files = []
+    for cable_des, connections in sizes.items():
+        path = tmp_path / f"{cable_des}.yaml"
+        path.write_text(_harness(connections))
+        yaml_files.append((cable_des, str(path)))
+
+    with (
+        patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", side_effect=_which({"wireviz"})),
+        patch("wireviz_yaml_generator.rendering.diagrams.subprocess.run") as mock_run,
+    ):
+        results = render_svgs(yaml_files, str(tmp_path / "out"), backend="cli", max_workers=1)
+
+    submitted = [call.args[0][1] for call in mock_run.call_args_list]
+    assert [Path(p).stem for p in submitted] == ["W002", "W004", "W003", "W001"]
+    assert [r.cable_des for r in results] == ["W001", "W002", "W003", "W004"]
+
+
+def test_invalid_worker_count_raises():
+    with pytest.raises(ConfigurationError, match="at least 1"):
+        render_svgs([("W001", "W001.yaml")], "out", max_workers=0)
+
+
+def test_default_workers_is_not_capped_at_eight():
+    with patch("wireviz_yaml_generator.rendering.diagrams.os.sched_getaffinity", return_value=set(range(32))):
+        assert diagrams.default_workers() == 32
+
+
+def test_pipeline_renders_while_jobs_are_still_submitted(tmp_path):
+    """A free worker takes the largest waiting job, even for jobs submitted later."""
+    release = threading.Event()
+    order: list[str] = []
+
+    def fake_cli(executable, cable_des, yaml_path, output_dir):
+        order.append(cable_des)
+        if cable_des == "W001":
+            assert release.wait(timeout=5)
+        return RenderResult(cable_des, f"{output_dir}/{cable_des}.svg")
+
+    paths = {}
+    for cable_des, connections in {"W001": 1, "W002": 2, "W003": 40}.items():
+        paths[cable_des] = tmp_path / f"{cable_des}.yaml"
+        paths[cable_des].write_text(_harness(connections))
+
+    with (
+        patch.object(diagrams, "resolve_backend", return_value="cli"),
+        patch.object(diagrams, "_render_with_cli", side_effect=fake_cli),
+        RenderPipeline(str(tmp_path / "out"), max_workers=1) as pipeline,
+    ):
+        pipeline.submit("W001", str(paths["W001"]))
+        while not order:  # W001 is running before the others are produced
+            time.sleep(0.001)
+        pipeline.submit("W002", str(paths["W002"]))
+        pipeline.submit("W003", str(paths["W003"]))
+        release.set()
+
+    assert order == ["W001", "W003", "W002"]
+    assert [r.cable_des for r in pipeline.results()] == ["W001", "W002", "W003"]
+
+
+def _render_with_timeout(render, timeout=10):
+    """Runs ``render`` on a thread; fails instead of hanging the suite if it never returns."""
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.setdefault("results", render()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "render pipeline hung"
+    return outcome["results"]
+
+
+def test_broken_pool_fails_remaining_jobs_instead_of_hanging(tmp_path):
+    """A pool that refuses work (a worker died) fails that job and every queued one."""
+
+    class BreaksAfterFirstJob(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, *args, **kwargs):
+            self.submitted += 1
+            if self.submitted > 1:
+                raise BrokenProcessPool("A child process terminated abruptly")
+            return super().submit(*args, **kwargs)
+
+    yaml_files = []
+    for cable_des, connections in {"W001": 3, "W002": 2, "W003": 1}.items():
+        path = tmp_path / f"{cable_des}.yaml"
+        path.write_text(_harness(connections))
+        yaml_files.append((cable_des, str(path)))
+
+    def fake_render(cable_des, yaml_text, output_dir, image_dir):
+        return RenderResult(cable_des, f"{output_dir}/{cable_des}.svg")
+
+    with (
+        patch.object(diagrams, "resolve_backend", return_value="python"),
+        patch.object(diagrams, "_process_pool", lambda workers: BreaksAfterFirstJob(max_workers=workers)),
+        patch.object(diagrams, "_render_yaml_text", side_effect=fake_render),
+    ):
+        results = _render_with_timeout(lambda: render_svgs(yaml_files, str(tmp_path / "out"), max_workers=1))
+
+    assert [(r.cable_des, r.error) for r in results] == [
+        ("W001", None),
+        ("W002", "BrokenProcessPool: A child process terminated abruptly"),
+        ("W003", "BrokenProcessPool: A child process terminated abruptly"),
+    ]
+
+
+def test_cache_store_failure_is_logged_not_hung(tmp_path, caplog):
+    """A cache that cannot store (read-only, full) must not wedge the pipeline."""
+    path = tmp_path / "W001.yaml"
+    path.write_text(_harness(1))
+
+    def fake_cli(executable, cable_des, yaml_path, output_dir):
+        svg_path = Path(output_dir) / f"{cable_des}.svg"
+        svg_path.write_text("<svg/>")
+        return RenderResult(cable_des, str(svg_path))
+
+    cache = SvgCache(tmp_path / "cache")
+    with (
+        patch.object(diagrams, "resolve_backend", return_value="cli"),
+        patch.object(diagrams, "_render_with_cli", side_effect=fake_cli),
+        patch.object(cache, "store", side_effect=PermissionError("read-only cache")),
+    ):
+        results = _render_with_timeout(lambda: render_svgs([("W001", str(path))], str(tmp_path / "out"), cache=cache))
+
+    assert [(r.cable_des, r.error) for r in results] == [("W001", None)]
+    assert "Could not cache the diagram for W001: read-only cache" in caplog.text
+
+
+def test_pipeline_without_backend_ignores_submissions(tmp_path):
+    with (
+        patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", return_value=None),
+        RenderPipeline(str(tmp_path)) as pipeline,
+    ):
+        pipeline.submit("W001", "missing.yaml")
+    assert not pipeline.available
+    assert pipeline.results() == []
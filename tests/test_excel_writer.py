@@ -0,0 +1,189 @@
+"""Tests for the Excel writer."""
+
+import math
+import subprocess
+import sys
+
+import openpyxl
+import pytest
+from wireviz_yaml_generator.excel_writer import (
+    XLSX_ENGINES,
+    add_misc_bom_items,
+    write_attachments,
+    write_csv,
+    write_workbook,
+    write_xlsx,
+)
+from wireviz_yaml_generator.exceptions import ConfigurationError
+
+ENGINES = [engine for engine in XLSX_ENGINES if engine != "auto"]
+
+
+def _read(path):
+    sheet = openpyxl.load_workbook(path).active
+    return sheet.title, [[cell.value for cell in row] for row in sheet.iter_rows()]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_header_and_rows(tmp_path, engine):
+    data = [{"MPN": "X1", "Qty": 2}, {"MPN": "X2", "Qty": 0.5}]
+    write_xlsx(data, "BOM", str(tmp_path), engine=engine)
+
+    assert _read(tmp_path / "BOM.xlsx") == ("Sheet1", [["MPN", "Qty"], ["X1", 2], ["X2", 0.5]])
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_columns_are_union_of_keys_in_first_seen_order(tmp_path, engine):
+    data = [{"B": 1, "A": "a"}, {"C": "c", "A": "a2"}, {"B": math.nan, "A": "a3"}]
+    write_xlsx(data, "out", str(tmp_path), engine=engine)
+
+    _, rows = _read(tmp_path / "out.xlsx")
+    assert rows == [["B", "A", "C"], [1, "a", None], [None, "a2", "c"], [None, "a3", None]]
+
+
+def test_engines_write_the_same_cells(tmp_path):
+    data = [{"Label": "Cable Labels:"}, {"MPN": "M-1", "Quantity": 3.0, "Label": None}]
+    results = []
+    for engine in ENGINES:
+        (tmp_path / engine).mkdir()
+        write_xlsx(data, "out", str(tmp_path / engine), engine=engine)
+        results.append(_read(tmp_path / engine / "out.xlsx"))
+
+    assert results[0] == results[1]
+
+
+def test_streams_rows_from_a_generator(tmp_path):
+    consumed = []
+
+    def rows():
+        for i in range(3):
+            consumed.append(i)
+            yield {"Label": f"L{i}"}
+
+    generator = rows()
+    write_xlsx(generator, "labels", str(tmp_path))
+
+    assert consumed == [0, 1, 2]
+    assert _read(tmp_path / "labels.xlsx")[1] == [["Label"], ["L0"], ["L1"], ["L2"]]
+
+
+def test_generator_header_comes_from_first_row(tmp_path):
+    rows = iter([{"A": 1}, {"B": 2}])
+    with pytest.raises(ValueError, match="'B'"):
+        write_xlsx(rows, "out", str(tmp_path))
+
+
+def test_explicit_columns(tmp_path):
+    rows = iter([{"A": 1}, {"B": 2}])
+    write_xlsx(rows, "out", str(tmp_path), columns=["B", "A"])
+
+    assert _read(tmp_path / "out.xlsx")[1] == [["B", "A"], [None, 1], [2, None]]
+
+
+@pytest.mark.parametrize("data", [[], iter([])])
+def test_empty_data_writes_nothing(tmp_path, capsys, data):
+    write_xlsx(data, "BOM", str(tmp_path))
+
+    assert not (tmp_path / "BOM.xlsx").exists()
+    assert "No data to write for BOM" in capsys.readouterr().out
+
+
+def test_unknown_engine(tmp_path):
+    with pytest.raises(ConfigurationError, match="xlsx engine"):
+        write_xlsx([{"A": 1}], "out", str(tmp_path), engine="xlsxwriter")
+
+
+def test_openpyxl_engine_does_not_import_pandas(tmp_path):
+    code = (
+        "import sys\n"
+        "from wireviz_yaml_generator.excel_writer import write_xlsx\n"
+        f"write_xlsx(({{'A': i}} for i in range(10)), 'out', {str(tmp_path)!r}, engine='openpyxl')\n"
+        "print('pandas' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
+    assert (tmp_path / "out.xlsx").exists()
+
+
+def _read_sheets(path):
+    workbook = openpyxl.load_workbook(path)
+    return {sheet.title: [[cell.value for cell in row] for row in sheet.iter_rows()] for sheet in workbook}
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_workbook_has_a_sheet_per_table(tmp_path, engine, capsys):
+    sheets = {
+        "BOM": [{"MPN": "X1", "Quantity": 2}],
+        "Empty": [],
+        "WireLabels": ({"Label": f"L{i}"} for i in range(2)),
+    }
+    write_workbook(sheets, "Attachments", str(tmp_path), engine=engine)
+
+    assert _read_sheets(tmp_path / "Attachments.xlsx") == {
+        "BOM": [["MPN", "Quantity"], ["X1", 2]],
+        "WireLabels": [["Label"], ["L0"], ["L1"]],
+    }
+    assert "No data to write for Empty" in capsys.readouterr().out
+
+
+def test_workbook_with_only_empty_tables_writes_nothing(tmp_path, capsys):
+    write_workbook({"BOM": [], "WireLabels": iter([])}, "Attachments", str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
+    assert "No data to write for Attachments" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_bad_row_leaves_no_workbook(tmp_path, engine):
+    sheets = {"A": [{"A": 1}], "B": iter([{"B": 1}, {"C": 2}])}
+    with pytest.raises(ValueError, match="'C'"):
+        write_workbook(sheets, "out", str(tmp_path), engine=engine)
+
+    assert not (tmp_path / "out.xlsx").exists()
+
+
+def test_write_csv(tmp_path):
+    rows = [{"MPN": "X", "Qty": 1}, {"MPN": "A, B", "Qty": math.nan}]
+    write_csv(rows, "BOM", str(tmp_path))
+
+    assert (tmp_path / "BOM.csv").read_bytes() == b'MPN,Qty\r\nX,1\r\n"A, B",\r\n'
+
+
+def test_write_tsv(tmp_path):
+    rows = ({"Label": label} for label in ("Wire Labels:", "J1 : 1"))
+    write_csv(rows, "WireLabels", str(tmp_path), delimiter="\t")
+
+    assert (tmp_path / "WireLabels.tsv").read_bytes() == b"Label\r\nWire Labels:\r\nJ1 : 1\r\n"
+
+
+def test_write_attachments_formats(tmp_path):
+    attachments = {"BOM": [{"MPN": "X"}], "WireLabels": [{"Label": "L"}]}
+    for attachment_format in ("xlsx", "workbook", "csv", "tsv"):
+        (tmp_path / attachment_format).mkdir()
+        write_attachments(attachments, str(tmp_path / attachment_format), attachment_format)
+
+    assert sorted(p.name for p in (tmp_path / "xlsx").iterdir()) == ["BOM.xlsx", "WireLabels.xlsx"]
+    assert [p.name for p in (tmp_path / "workbook").iterdir()] == ["Attachments.xlsx"]
+    assert sorted(p.name for p in (tmp_path / "csv").iterdir()) == ["BOM.csv", "WireLabels.csv"]
+    assert sorted(p.name for p in (tmp_path / "tsv").iterdir()) == ["BOM.tsv", "WireLabels.tsv"]
+
+
+def test_write_attachments_unknown_format(tmp_path):
+    with pytest.raises(ConfigurationError, match="attachment format"):
+        write_attachments({"BOM": [{"MPN": "X"}]}, str(tmp_path), "ods")
+
+
+def test_add_misc_bom_items(tmp_path):
+    (tmp_path / "MiscBOM.csv").write_text("﻿MPN,Quantity\nTIE-1,10\n", encoding="utf-8")
+
+    combined = add_misc_bom_items([{"MPN": "X1", "Quantity": 1}], "MiscBOM", str(tmp_path))
+
+    assert combined == [{"MPN": "X1", "Quantity": 1}, {"MPN": "TIE-1", "Quantity": "10"}]
+
+
+def test_add_misc_bom_items_missing_file(tmp_path, capsys):
+    bom = [{"MPN": "X1"}]
+
+    assert add_misc_bom_items(bom, "MiscBOM", str(tmp_path)) is bom
+    assert "Misc BOM file not found" in capsys.readouterr().out
@@ -0,0 +1,73 @@
+"""Tests for lazy package imports and import time."""
+
+import subprocess
+import sys
+
+import pytest
+import wireviz_yaml_generator
+
+HEAVY_MODULES = ("pandas", "numpy", "yaml", "openpyxl", "typst")
+
+# Cold ``import wireviz_yaml_generator`` must stay under this (best of a few runs)
+IMPORT_BUDGET_SECONDS = 0.3
+
+
+def _run(code: str) -> str:
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def _loaded_heavy_modules(statement: str) -> list[str]:
+    out = _run(f"import sys\n{statement}\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    return [m for m in out.split(",") if m]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import wireviz_yaml_generator",
+        "from wireviz_yaml_generator import Project, CsvDataSource, NetTable",
+        "from wireviz_yaml_generator import ConfigurationError",
+        "from wireviz_yaml_generator.BuildYaml import render_yaml",
+        "from wireviz_yaml_generator.build_engine import build_drawings",
+    ],
+)
+def test_import_does_not_load_heavy_dependencies(statement):
+    assert _loaded_heavy_modules(statement) == []
+
+
+def test_schema_emitter_does_not_load_pyyaml():
+    statement = "from wireviz_yaml_generator.BuildYaml import render_yaml\nrender_yaml([], [], [], emitter='schema')"
+    assert _loaded_heavy_modules(statement) == []
+
+
+def test_excel_writer_import_does_not_load_pandas():
+    statement = "from wireviz_yaml_generator import excel_writer"
+    assert "pandas" not in _loaded_heavy_modules(statement)
+
+
+def test_import_time_within_budget():
+    code = "import time\nstart = time.perf_counter()\nimport wireviz_yaml_generator\nprint(time.perf_counter() - start)"
+    best = min(float(_run(code)) for _ in range(3))
+    assert best < IMPORT_BUDGET_SECONDS, f"import took {best:.3f} s"
+
+
+def test_lazy_exports_resolve_to_submodule_objects():
+    from wireviz_yaml_generator.csv_data_source import CsvDataSource
+    from wireviz_yaml_generator.models import NetTable
+    from wireviz_yaml_generator.project import Project
+
+    assert wireviz_yaml_generator.Project is Project
+    assert wireviz_yaml_generator.CsvDataSource is CsvDataSource
+    assert wireviz_yaml_generator.NetTable is NetTable
+
+
+def test_every_public_name_resolves():
+    for name in wireviz_yaml_generator.__all__:
+        assert getattr(wireviz_yaml_generator, name) is not None
+    assert set(wireviz_yaml_generator.__all__) <= set(dir(wireviz_yaml_generator))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="no_such_name"):
+        wireviz_yaml_generator.no_such_name  # noqa: B018
@@ -0,0 +1,117 @@
+"""Tests for the domain models and the columnar NetTable."""
+
+import tracemalloc
+from dataclasses import fields
+
+import pytest
+from wireviz_yaml_generator import models
+from wireviz_yaml_generator.models import NetRow, NetTable
+from wireviz_yaml_generator.transformations import process_cables, process_connections
+
+from conftest import make_net_row
+
+ROWS = [
+    make_net_row(cable_des="W001", pin_1="1", net_name="SigA"),
+    make_net_row(cable_des="W002", pin_1="1", net_name="gnd"),
+    make_net_row(cable_des="W001", pin_1="2", net_name="+24V"),
+]
+
+
+# --- Slots ---
+
+
+@pytest.mark.parametrize(
+    "model",
+    [models.Connector, models.Wire, models.Cable, models.Connection, models.BomItem, NetRow, models.CableRow],
+)
+def test_models_are_slotted(model):
+    values = {f.name: None for f in fields(model)}
+    assert not hasattr(model(**values), "__dict__")
+
+
+# --- NetTable ---
+
+
+def test_net_table_is_sequence_of_rows():
+    table = NetTable(ROWS)
+    assert len(table) == 3
+    assert table[2] == ROWS[2]
+    assert table[-1] == ROWS[-1]
+    assert list(table) == ROWS
+    assert table == ROWS
+    assert ROWS[0] in table
+
+
+def test_net_table_slice_returns_table():
+    table = NetTable(ROWS)
+    assert isinstance(table[1:], NetTable)
+    assert table[1:] == ROWS[1:]
+
+
+def test_net_table_take():
+    table = NetTable(ROWS)
+    assert table.take([2, 0]) == [ROWS[2], ROWS[0]]
+    assert table.take(range(0)) == []
+
+
+def test_net_table_concat():
+    table = NetTable(ROWS)
+    joined = NetTable.concat([table.for_cable("W002"), [ROWS[0]]])
+    assert isinstance(joined, NetTable)
+    assert joined == [ROWS[1], ROWS[0]]
+    assert NetTable.concat([]) == []
+
+
+def test_net_table_cable_index():
+    table = NetTable(ROWS)
+    assert table.cables() == ["W001", "W002"]
+    assert table.for_cable("W001") == [ROWS[0], ROWS[2]]
+    assert table.for_cable("W999") == []
+    assert {k: list(v) for k, v in table.partition().items()} == {"W001": [ROWS[0], ROWS[2]], "W002": [ROWS[1]]}
+
+
+def test_net_table_columns_round_trip():
+    table = NetTable(ROWS)
+    assert table.column("net_name") == ("SigA", "gnd", "+24V")
+    assert NetTable.from_columns(table.columns()) == table
+    with pytest.raises(KeyError):
+        table.column("nope")
+    with pytest.raises(ValueError):
+        NetTable.from_columns([("W001",)])
+
+
+def test_net_table_interns_strings():
+    """Equal values read from different rows share one string object."""
+    rows = [make_net_row(comp_des_1="".join(["J", "1"])) for _ in range(2)]
+    assert rows[0].comp_des_1 is not rows[1].comp_des_1
+    column = NetTable(rows).column("comp_des_1")
+    assert column[0] is column[1]
+
+
+def test_net_table_accepted_by_transformations():
+    table = NetTable(ROWS)
+    assert process_connections(table) == process_connections(ROWS)
+    assert process_cables(table, []) == process_cables(ROWS, [])
+
+
+def test_net_table_is_compact():
+    """Repetitive net data takes several times less memory than a list of rows."""
+
+    def rows():
+        # Fresh string objects per row, as a database driver or CSV reader produces
+        for i in range(5000):
+            yield NetRow(*(f"{name}{i % 7}" for name in models.NET_FIELDS))
+
+    tracemalloc.start()
+    as_list = list(rows())
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    del as_list
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    table = NetTable(rows())
+    table_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(table) == 5000
+    assert table_bytes * 3 < list_bytes
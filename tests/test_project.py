@@ -1,10 +1,23 @@
 """Tests for the Project high-level API."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from wireviz_yaml_generator.build_engine import _summarize_changed
+from wireviz_yaml_generator.diagnostics import Diagnostics
 from wireviz_yaml_generator.exceptions import ConfigurationError
 from wireviz_yaml_generator.project import Project
+from wireviz_yaml_generator.rendering import diagrams
+
+
+def _mock_source(*cables: str) -> MagicMock:
+    """A mock data source whose NetTable has (empty) partitions for ``cables``."""
+    source = MagicMock()
+    source.load_net_table_by_cable.return_value = {cable: [] for cable in cables}
+    return source
 
 
 class TestConstructorValidation:
@@ -66,11 +79,10 @@ class TestPageRegistration:
 
 class TestBuildOrchestration:
     @patch("wireviz_yaml_generator.project.WorkflowManager")
-    @patch("wireviz_yaml_generator.project.shutil.which", return_value=None)
+    @patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", return_value=None)
     def test_build_without_pdf(self, mock_which, mock_wf_cls, tmp_path):
         """build() without pdf_path skips PDF generation."""
-        mock_source = MagicMock()
-        mock_source.check_cable_existence.return_value = True
+        mock_source = _mock_source("W001", "W002", "W003")
 
         mock_wf = MagicMock()
         mock_wf_cls.return_value = mock_wf
@@ -96,12 +108,21 @@ class TestBuildOrchestration:
         mock_wf.run_attachment_workflow.assert_called_once()
         assert mock_wf.run_yaml_workflow.call_count == 2
 
+    @pytest.mark.parametrize(
+        ("render_cache_dir", "expected"),
+        [("auto", "out/.wireviz_cache"), ("shared/cache", "shared/cache"), (None, None)],
+    )
+    def test_render_cache_location(self, render_cache_dir, expected):
+        """The default cache sits beside drawings_dir, not in the current directory."""
+        p = Project(title="Test", db="test.db", drawings_dir="out/harness", render_cache_dir=render_cache_dir)
+        cache = p._render_cache()
+        assert (cache.directory if cache else None) == (Path(expected) if expected else None)
+
     @patch("wireviz_yaml_generator.project.WorkflowManager")
-    @patch("wireviz_yaml_generator.project.shutil.which", return_value=None)
+    @patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", return_value=None)
     def test_build_skips_nonexistent_cables(self, mock_which, mock_wf_cls, tmp_path):
-        """build() skips cables where check_cable_existence returns False."""
-        mock_source = MagicMock()
-        mock_source.check_cable_existence.side_effect = lambda c: c == "W001"
+        """build() skips cables that have no NetTable rows."""
+        mock_source = _mock_source("W001")
 
         mock_wf = MagicMock()
         mock_wf_cls.return_value = mock_wf
@@ -120,19 +141,111 @@ class TestBuildOrchestration:
         with patch.object(p, "_create_data_source", return_value=mock_source):
             p.build(pdf_path=None)
 
-        # Only W001 should be processed
+        # Only W001 should be processed, filtered by the one NetTable read
         assert mock_wf.run_yaml_workflow.call_count == 1
         assert mock_wf.run_yaml_workflow.call_args[0][0] == "W001"
+        mock_source.existing_cables.assert_not_called()
+        mock_source.check_cable_existence.assert_not_called()
+
+    @patch("wireviz_yaml_generator.project.WorkflowManager")
+    @patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", return_value=None)
+    def test_build_loads_net_table_once(self, mock_which, mock_wf_cls, tmp_path):
+        """build() reads NetTable once and hands each cable its partition."""
+        w001_rows = [MagicMock()]
+        w002_rows = [MagicMock(), MagicMock()]
+        mock_source = MagicMock()
+        mock_source.load_net_table_by_cable.return_value = {"W001": w001_rows, "W002": w002_rows}
+
+        mock_wf = MagicMock()
+        mock_wf_cls.return_value = mock_wf
+
+        p = Project(
+            title="Test",
+            db="test.db",
+            cable_start=1,
+            cable_end=2,
+            yaml_dir=str(tmp_path / "yaml"),
+            drawings_dir=str(tmp_path / "drawings"),
+            attachments_dir=str(tmp_path / "attachments"),
+            resources_dir=str(tmp_path / "resources"),
+        )
+
+        with patch.object(p, "_create_data_source", return_value=mock_source):
+            p.build(pdf_path=None, create_bom=False, create_labels=False)
+
+        mock_source.load_net_table_by_cable.assert_called_once_with()
+        mock_source.load_net_table.assert_not_called()
+        passed = {c.args[0]: c.kwargs["net_rows"] for c in mock_wf.run_yaml_workflow.call_args_list}
+        assert passed == {"W001": w001_rows, "W002": w002_rows}
+        mock_source.close.assert_called_once()
+
+    @patch("wireviz_yaml_generator.project.WorkflowManager")
+    @patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", return_value=None)
+    def test_build_reports_changed_yaml(self, mock_which, mock_wf_cls, tmp_path, capsys):
+        """build() reports which cables' YAML content actually changed."""
+        mock_source = _mock_source("W001", "W002", "W003")
+        mock_wf_cls.return_value.run_yaml_workflow.side_effect = lambda cable, *a, **kw: cable == "W002"
+
+        p = Project(
+            title="Test",
+            db="test.db",
+            cable_start=1,
+            cable_end=3,
+            yaml_dir=str(tmp_path / "yaml"),
+            drawings_dir=str(tmp_path / "drawings"),
+            attachments_dir=str(tmp_path / "attachments"),
+            resources_dir=str(tmp_path / "resources"),
+        )
+
+        with patch.object(p, "_create_data_source", return_value=mock_source):
+            p.build(create_bom=False, create_labels=False)
+
+        assert "YAML generated for 3 cables (1 changed: W002)." in capsys.readouterr().out
+
+    @patch("wireviz_yaml_generator.project.WorkflowManager")
+    @patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", return_value=None)
+    def test_build_reports_diagnostics_once(self, mock_which, mock_wf_cls, tmp_path, capsys):
+        """Warnings go to the collector handed to WorkflowManager and are printed at the end."""
+        mock_source = _mock_source("W001", "W002", "W003")
+
+        def run_yaml_workflow(*args, **kwargs):
+            diagnostics.warn("missing-mpn", "J1-X1", "MPN 'X' not found.")
+
+        mock_wf_cls.return_value.run_yaml_workflow.side_effect = run_yaml_workflow
+
+        p = Project(
+            title="Test",
+            db="test.db",
+            cable_start=1,
+            cable_end=3,
+            yaml_dir=str(tmp_path / "yaml"),
+            drawings_dir=str(tmp_path / "drawings"),
+            attachments_dir=str(tmp_path / "attachments"),
+            resources_dir=str(tmp_path / "resources"),
+        )
+
+        with patch.object(p, "_create_data_source", return_value=mock_source):
+            diagnostics = Diagnostics()
+            p.build(create_bom=False, create_labels=False, diagnostics=diagnostics)
+            assert mock_wf_cls.call_args.args == (mock_source, diagnostics)
+            assert "Warning" not in capsys.readouterr().out
+            assert next(iter(diagnostics)).count == 3
+
+            diagnostics = Diagnostics()
+            with patch("wireviz_yaml_generator.project.Diagnostics", return_value=diagnostics):
+                p.build(create_bom=False, create_labels=False)
+            assert capsys.readouterr().out.count("MPN 'X' not found. (3x)") == 1
 
     @patch("wireviz_yaml_generator.project.WorkflowManager")
-    @patch("wireviz_yaml_generator.project.shutil.which", return_value="/usr/bin/wireviz")
-    @patch("wireviz_yaml_generator.project.subprocess.run")
+    @patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", return_value="/usr/bin/wireviz")
+    @patch("wireviz_yaml_generator.rendering.diagrams.subprocess.run")
     def test_build_with_wireviz(self, mock_run, mock_which, mock_wf_cls, tmp_path):
         """build() invokes wireviz subprocess for each cable."""
-        mock_source = MagicMock()
-        mock_source.check_cable_existence.return_value = True
+        mock_source = _mock_source("W001", "W002", "W003")
 
         mock_wf = MagicMock()
+        mock_wf.run_yaml_workflow.side_effect = lambda cable, path, *args, **kwargs: Path(path).write_text("{}\n")
+        mock_wf.render_costs = {}
         mock_wf_cls.return_value = mock_wf
 
         p = Project(
@@ -144,6 +257,8 @@ class TestBuildOrchestration:
             drawings_dir=str(tmp_path / "drawings"),
             attachments_dir=str(tmp_path / "attachments"),
             resources_dir=str(tmp_path / "resources"),
+            render_backend="cli",
+            render_cache_dir=None,
         )
 
         with patch.object(p, "_create_data_source", return_value=mock_source):
@@ -156,6 +271,120 @@ class TestBuildOrchestration:
         assert "s" in call_args[0][0]
 
 
+def _write_yaml(cable, path, *args, **kwargs):
+    Path(path).write_text("connectors: {}\n")
+    return True
+
+
+def _fake_parse(yaml_text, output_dir, output_name, **kwargs):
+    if output_name == "W002":
+        raise TypeError("bad")
+    (Path(output_dir) / f"{output_name}.svg").write_text(f"<svg>{output_name}</svg>")
+
+
+def _render_project(tmp_path, **kwargs):
+    return Project(
+        title="Test",
+        db="test.db",
+        cable_start=1,
+        cable_end=kwargs.pop("cable_end", 2),
+        yaml_dir=str(tmp_path / "yaml"),
+        drawings_dir=str(tmp_path / "drawings"),
+        attachments_dir=str(tmp_path / "attachments"),
+        render_backend="python",
+        **kwargs,
+    )
+
+
+class TestRenderPipeline:
+    """Project.build rendering, with the process pool swapped for threads."""
+
+    @pytest.fixture(autouse=True)
+    def _threads_for_processes(self):
+        with patch(
+            "wireviz_yaml_generator.rendering.diagrams._process_pool",
+            lambda workers: ThreadPoolExecutor(max_workers=workers),
+        ):
+            yield
+
+    @patch("wireviz_yaml_generator.project.WorkflowManager")
+    @patch("wireviz.wireviz.parse", side_effect=_fake_parse)
+    def test_build_with_python_backend(self, mock_parse, mock_wf_cls, tmp_path, capsys):
+        """The in-process backend's results become the SVG list; failures are printed."""
+        mock_source = _mock_source("W001", "W002", "W003")
+        mock_wf_cls.return_value.run_yaml_workflow.side_effect = _write_yaml
+        mock_wf_cls.return_value.render_costs = {}
+
+        p = _render_project(tmp_path, render_cache_dir=None)
+        svg_paths = p._generate(mock_source, create_bom=False, create_labels=False)
+
+        assert svg_paths == [("W001", str(tmp_path / "drawings" / "W001.svg"))]
+        assert mock_parse.call_args.args == ("connectors: {}\n",)
+        assert "WireViz error for W002: TypeError: bad" in capsys.readouterr().out
+
+    @patch("wireviz_yaml_generator.project.WorkflowManager")
+    @patch("wireviz.wireviz.parse", side_effect=_fake_parse)
+    def test_build_reports_render_cache_hits(self, mock_parse, mock_wf_cls, tmp_path, capsys):
+        mock_source = _mock_source("W001", "W002", "W003")
+        mock_wf_cls.return_value.run_yaml_workflow.side_effect = _write_yaml
+        mock_wf_cls.return_value.render_costs = {}
+
+        p = _render_project(tmp_path, cable_end=1, render_cache_dir=str(tmp_path / "cache"), render_workers=24)
+        p._generate(mock_source, create_bom=False, create_labels=False)
+        with patch.object(diagrams, "RenderPipeline", wraps=diagrams.RenderPipeline) as pipeline:
+            p._generate(mock_source, create_bom=False, create_labels=False)
+
+        assert mock_parse.call_count == 1
+        assert pipeline.call_args.kwargs["max_workers"] == 1  # never more workers than cables
+        out = capsys.readouterr().out
+        assert "SVG diagrams generated for 1 cables (0 from cache, 1 rendered) in " in out
+        assert "SVG diagrams generated for 1 cables (1 from cache, 0 rendered) in " in out
+
+    @patch("wireviz_yaml_generator.project.WorkflowManager")
+    def test_rendering_and_attachments_overlap_yaml_generation(self, mock_wf_cls, tmp_path):
+        """The first render starts, and attachments run, while later YAML is still being generated."""
+        first_rendered = threading.Event()
+        yaml_started = threading.Event()
+        seen: dict[str, bool] = {}
+
+        def parse(yaml_text, output_dir, output_name, **kwargs):
+            (Path(output_dir) / f"{output_name}.svg").write_text("<svg/>")
+            first_rendered.set()
+
+        def run_yaml(cable, path, *args, **kwargs):
+            yaml_started.set()
+            if cable == "W003":
+                seen["render_before_last_yaml"] = first_rendered.wait(timeout=5)
+            return _write_yaml(cable, path)
+
+        def run_attachments(*args, **kwargs):
+            seen["attachments_during_yaml"] = yaml_started.wait(timeout=5)
+
+        mock_source = _mock_source("W001", "W002", "W003")
+        mock_wf = mock_wf_cls.return_value
+        mock_wf.run_yaml_workflow.side_effect = run_yaml
+        mock_wf.render_costs = {}
+        mock_wf.run_attachment_workflow.side_effect = run_attachments
+
+        p = _render_project(tmp_path, cable_end=3, render_cache_dir=None)
+        with patch("wireviz.wireviz.parse", side_effect=parse):
+            svg_paths = p._generate(mock_source, create_bom=True, create_labels=True)
+
+        assert seen == {"render_before_last_yaml": True, "attachments_during_yaml": True}
+        assert [cable for cable, _ in svg_paths] == ["W001", "W002", "W003"]
+
+    @patch("wireviz_yaml_generator.project.WorkflowManager")
+    def test_attachment_errors_propagate(self, mock_wf_cls, tmp_path):
+        mock_source = _mock_source("W001", "W002", "W003")
+        mock_wf_cls.return_value.run_yaml_workflow.side_effect = _write_yaml
+        mock_wf_cls.return_value.render_costs = {}
+        mock_wf_cls.return_value.run_attachment_workflow.side_effect = ConfigurationError("bad bom_engine")
+
+        p = _render_project(tmp_path, render_cache_dir=None)
+        with patch("wireviz.wireviz.parse", side_effect=_fake_parse), pytest.raises(ConfigurationError):
+            p._generate(mock_source, create_bom=True, create_labels=False)
+
+
 class TestAutoGenerateCableDes:
     def test_csv_with_auto_generate(self):
         p = Project(title="Test", csv="test.csv", auto_generate_cable_des=True)
@@ -164,11 +393,10 @@ class TestAutoGenerateCableDes:
 
 class TestBuildPdf:
     @patch("wireviz_yaml_generator.project.WorkflowManager")
-    @patch("wireviz_yaml_generator.project.shutil.which", return_value=None)
+    @patch("wireviz_yaml_generator.rendering.diagrams.shutil.which", return_value=None)
     def test_build_calls_pdf(self, mock_which, mock_wf_cls, tmp_path):
         """build() with pdf_path calls _build_pdf."""
-        mock_source = MagicMock()
-        mock_source.check_cable_existence.return_value = False
+        mock_source = _mock_source()
 
         mock_wf = MagicMock()
         mock_wf_cls.return_value = mock_wf
@@ -190,3 +418,9 @@ class TestBuildPdf:
         ):
             p.build(pdf_path="output.pdf")
             mock_pdf.assert_called_once_with("output.pdf", [])
+
+
+def test_summarize_changed():
+    assert _summarize_changed([]) == "none changed"
+    assert _summarize_changed(["W001", "W002"]) == "2 changed: W001, W002"
+    assert _summarize_changed([f"W{i:03d}" for i in range(12)], limit=2) == "12 changed: W000, W001, ... 10 more"
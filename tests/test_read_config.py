@@ -0,0 +1,36 @@
+"""Tests for ConfigLoader."""
+
+import pytest
+from wireviz_yaml_generator.exceptions import ConfigurationError
+from wireviz_yaml_generator.ReadConfig import ConfigLoader
+
+
+def _config(**values):
+    config = ConfigLoader()
+    config._config = {"base_repo_path": "/repo", **values}
+    return config
+
+
+def test_paths_are_anchored_at_base_repo():
+    assert str(_config(db_path="data/master.db").db_path) == "/repo/data/master.db"
+
+
+def test_max_workers_is_optional():
+    assert _config().max_workers is None
+    assert _config(max_workers=12).max_workers == 12
+
+
+@pytest.mark.parametrize("value", [0, -2, "4", True])
+def test_invalid_max_workers_raises(value):
+    with pytest.raises(ConfigurationError, match="max_workers"):
+        _ = _config(max_workers=value).max_workers
+
+
+def test_attachment_format_defaults_to_xlsx():
+    assert _config().attachment_format == "xlsx"
+    assert _config(attachment_format="tsv").attachment_format == "tsv"
+
+
+def test_invalid_attachment_format_raises():
+    with pytest.raises(ConfigurationError, match="attachment_format"):
+        _ = _config(attachment_format="ods").attachment_format
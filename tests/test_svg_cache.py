@@ -0,0 +1,167 @@
+"""Tests for the persistent SVG render cache."""
+
+import os
+from unittest.mock import patch
+
+from wireviz_yaml_generator.rendering import diagrams, svg_cache
+from wireviz_yaml_generator.rendering.diagrams import RenderResult, render_svgs
+from wireviz_yaml_generator.rendering.svg_cache import SvgCache
+
+YAML = """connectors:
+  X1:
+    pincount: 2
+    image:
+      src: ../resources/MATE-A.png
+      caption: ISO view
+"""
+
+
+def _project(tmp_path):
+    (tmp_path / "resources").mkdir()
+    (tmp_path / "resources" / "MATE-A.png").write_bytes(b"png-1")
+    (tmp_path / "src").mkdir()
+    yaml_path = tmp_path / "src" / "W001.yaml"
+    yaml_path.write_text(YAML, encoding="utf-8")
+    return yaml_path
+
+
+# --- Keys ---
+
+
+def test_key_is_stable(tmp_path):
+    yaml_path = _project(tmp_path)
+    cache = SvgCache(tmp_path / "cache")
+    assert cache.key(yaml_path) == cache.key(yaml_path)
+
+
+def test_key_changes_with_yaml(tmp_path):
+    yaml_path = _project(tmp_path)
+    cache = SvgCache(tmp_path / "cache")
+    before = cache.key(yaml_path)
+    yaml_path.write_text(YAML.replace("pincount: 2", "pincount: 3"), encoding="utf-8")
+    assert cache.key(yaml_path) != before
+
+
+def test_key_changes_with_referenced_image(tmp_path):
+    yaml_path = _project(tmp_path)
+    cache = SvgCache(tmp_path / "cache")
+    before = cache.key(yaml_path)
+    (tmp_path / "resources" / "MATE-A.png").write_bytes(b"png-2")
+    assert cache.key(yaml_path) != before
+
+
+def test_key_changes_with_wireviz_version(tmp_path):
+    yaml_path = _project(tmp_path)
+    cache = SvgCache(tmp_path / "cache")
+    before = cache.key(yaml_path)
+    with patch.object(svg_cache, "_wireviz_version", return_value="99.0"):
+        assert cache.key(yaml_path) != before
+
+
+def test_image_sources_handles_quoted_paths():
+    assert svg_cache._image_sources("image:\n  src: '../resources/a b.png'\n") == ["../resources/a b.png"]
+
+
+# --- Store / fetch / eviction ---
+
+
+def test_fetch_miss_then_hit(tmp_path):
+    cache = SvgCache(tmp_path / "cache")
+    rendered = tmp_path / "W001.svg"
+    rendered.write_text("<svg/>")
+    out = tmp_path / "out.svg"
+
+    assert cache.fetch("k", out) is False
+    cache.store("k", rendered)
+    assert cache.fetch("k", out) is True
+    assert out.read_text() == "<svg/>"
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = SvgCache(tmp_path / "cache", max_bytes=25)
+    svg = tmp_path / "x.svg"
+    svg.write_text("0123456789")  # 10 bytes per entry
+
+    cache.store("a", svg)
+    cache.store("b", svg)
+    os.utime(cache.directory / "a.svg", (0, 0))
+    os.utime(cache.directory / "b.svg", (1, 1))
+    assert cache.fetch("a", tmp_path / "out.svg")  # a becomes most recent
+    cache.store("c", svg)
+
+    assert sorted(p.stem for p in cache.directory.glob("*.svg")) == ["a", "c"]
+
+
+def test_directory_scanned_once_until_eviction(tmp_path):
+    cache = SvgCache(tmp_path / "cache", max_bytes=1000)
+    svg = tmp_path / "x.svg"
+    svg.write_text("0123456789")
+
+    with patch.object(SvgCache, "_entries", wraps=cache._entries) as scans:
+        for key in "abcde":
+            cache.store(key, svg)
+        cache.store("a", svg)  # replacing an entry does not grow the total
+
+    assert scans.call_count == 1
+    assert cache._total == 50
+
+
+def test_fetch_io_error_is_a_miss(tmp_path):
+    cache = SvgCache(tmp_path / "cache")
+    svg = tmp_path / "x.svg"
+    svg.write_text("<svg/>")
+    cache.store("k", svg)
+
+    with patch.object(svg_cache.os, "utime", side_effect=PermissionError("read-only")):
+        assert cache.fetch("k", tmp_path / "out.svg") is False
+
+
+def test_store_io_error_is_ignored(tmp_path):
+    cache = SvgCache(tmp_path / "cache")
+    svg = tmp_path / "x.svg"
+    svg.write_text("<svg/>")
+
+    with patch.object(svg_cache.shutil, "copyfile", side_effect=OSError(28, "No space left on device")):
+        cache.store("k", svg)
+
+    assert not any(cache.directory.iterdir())
+    assert cache.fetch("k", tmp_path / "out.svg") is False
+
+
+# --- render_svgs ---
+
+
+def test_render_svgs_reuses_cached_svg(tmp_path):
+    yaml_path = _project(tmp_path)
+    out_dir = tmp_path / "harness"
+    cache = SvgCache(tmp_path / "cache")
+
+    def fake_render(executable, cable_des, yaml_path, output_dir):
+        (out_dir / f"{cable_des}.svg").write_text("<svg>W001</svg>")
+        return RenderResult(cable_des, str(out_dir / f"{cable_des}.svg"))
+
+    with (
+        patch.object(diagrams, "resolve_backend", return_value="cli"),
+        patch.object(diagrams, "_render_with_cli", side_effect=fake_render) as mock_render,
+    ):
+        first = render_svgs([("W001", str(yaml_path))], str(out_dir), cache=cache)
+        (out_dir / "W001.svg").unlink()
+        second = render_svgs([("W001", str(yaml_path))], str(out_dir), cache=cache)
+
+    assert mock_render.call_count == 1
+    assert [r.cached for r in first + second] == [False, True]
+    assert (out_dir / "W001.svg").read_text() == "<svg>W001</svg>"
+
+
+def test_failed_renders_are_not_cached(tmp_path):
+    yaml_path = _project(tmp_path)
+    cache = SvgCache(tmp_path / "cache")
+    failure = RenderResult("W001", str(tmp_path / "W001.svg"), "boom")
+
+    with (
+        patch.object(diagrams, "resolve_backend", return_value="cli"),
+        patch.object(diagrams, "_render_with_cli", return_value=failure),
+    ):
+        render_svgs([("W001", str(yaml_path))], str(tmp_path), cache=cache)
+
+    assert not cache.directory.exists() or not any(cache.directory.iterdir())
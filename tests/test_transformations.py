@@ -1,13 +1,24 @@
 """Unit Tests for Transformations Module."""
 
+import time
+from unittest.mock import patch
+
 import pytest
+from wireviz_yaml_generator.diagnostics import Diagnostics
+from wireviz_yaml_generator.models import NetTable
 from wireviz_yaml_generator.transformations import (
+    ConnectorIndex,
+    SortedNetView,
+    _natural_sort_key,
     generate_bom_data,
     generate_cable_labels,
     generate_wire_labels,
+    iter_wire_labels,
+    natural_sort_cache_info,
     process_cables,
     process_connections,
     process_connectors,
+    sort_net_rows,
 )
 
 from conftest import make_cable_row, make_connector_row, make_designator_row, make_net_row
@@ -155,6 +166,42 @@ def test_cable_connection_ordering_multi_cable():
         assert cable.wire_labels[conn.via_pin - 1] == conn.net_name
 
 
+def test_sorted_net_view_groups():
+    net_rows = [
+        make_net_row(cable_des="W002", pin_1="1", net_name="C"),
+        make_net_row(cable_des="W001", pin_1="2", net_name="B"),
+        make_net_row(cable_des="W001", pin_1="1", net_name="A"),
+    ]
+    view = SortedNetView(net_rows)
+
+    assert [r.net_name for r in view] == ["A", "B", "C"]
+    assert [(cable, [r.net_name for r in rows]) for cable, rows in view.groups()] == [
+        ("W001", ["A", "B"]),
+        ("W002", ["C"]),
+    ]
+    assert list(SortedNetView([]).groups()) == []
+
+
+def test_sort_net_rows_reuses_existing_view():
+    view = sort_net_rows([make_net_row()])
+    assert sort_net_rows(view) is view
+
+
+def test_sorted_view_is_not_resorted_by_consumers():
+    """Cables, connections and wire labels all read one pre-sorted view."""
+    view = sort_net_rows(
+        [make_net_row(pin_1="2", net_name="B"), make_net_row(pin_1="1", net_name="A")],
+    )
+    with patch("wireviz_yaml_generator.transformations.sorted", side_effect=AssertionError("re-sorted"), create=True):
+        cables = process_cables(view, [])
+        connections = process_connections(view)
+        labels = generate_wire_labels(view)
+
+    assert cables[0].wire_labels == ["A", "B"]
+    assert [c.net_name for c in connections] == ["A", "B"]
+    assert labels[2] == {"Label": "X1 : 1"}
+
+
 # --- process_connectors edge cases ---
 
 
@@ -187,6 +234,36 @@ def test_process_connectors_mpn_not_found():
     assert c.pincount == 99
 
 
+def test_process_connectors_missing_mpn_goes_to_diagnostics(capsys):
+    """Missing MPNs are recorded, not printed, and counted per occurrence."""
+    designator_rows = [make_designator_row(comp_des="J1", conn_des="X1", conn_mpn="MISSING")]
+    diagnostics = Diagnostics()
+
+    for pin in ("1", "2"):
+        net_rows = [make_net_row(comp_des_1="J1", conn_des_1="X1", pin_1=pin)]
+        process_connectors(net_rows, designator_rows, [], set(), filter_active=True, diagnostics=diagnostics)
+
+    assert capsys.readouterr().out == ""
+    [warning] = diagnostics
+    assert (warning.code, warning.subject, warning.count, warning.details) == ("missing-mpn", "MISSING", 2, ("J1-X1",))
+    assert "MISSING" in warning.message
+
+
+def test_process_connectors_shared_missing_mpn_warns_once():
+    """Two connectors using the same missing MPN produce one warning naming both."""
+    designator_rows = [
+        make_designator_row(comp_des="J1", conn_des="X1", conn_mpn="MISSING"),
+        make_designator_row(comp_des="J2", conn_des="X1", conn_mpn="MISSING"),
+    ]
+    net_rows = [make_net_row(comp_des_1="J1", conn_des_1="X1", comp_des_2="J2", conn_des_2="X1")]
+    diagnostics = Diagnostics()
+
+    process_connectors(net_rows, designator_rows, [], set(), filter_active=True, diagnostics=diagnostics)
+
+    [warning] = diagnostics
+    assert (warning.subject, warning.count, warning.details) == ("MISSING", 2, ("J1-X1", "J2-X1"))
+
+
 def test_process_connectors_filter_active_false():
     """filter_active=False returns ALL designators, not just those in net_rows."""
     net_rows = [make_net_row(comp_des_1="J1", conn_des_1="X1")]
@@ -204,6 +281,20 @@ def test_process_connectors_filter_active_false():
     assert len(result) == 2
 
 
+def test_process_connectors_accepts_immutable_catalog():
+    """Catalog rows may be shared tuples; process_connectors must not sort them in place."""
+    designator_rows = (
+        make_designator_row(comp_des="J2", conn_des="X1", conn_mpn="MPN-123"),
+        make_designator_row(comp_des="J1", conn_des="X1", conn_mpn="MPN-123"),
+    )
+    connector_rows = (make_connector_row(mpn="MPN-123"),)
+
+    result = process_connectors([], designator_rows, connector_rows, set(), filter_active=False)
+
+    assert [c.designator for c in result] == ["J1-X1", "J2-X1"]
+    assert designator_rows[0].comp_des == "J2"
+
+
 def test_process_connectors_natural_sort_order():
     """Connectors must sort naturally: J1, J2, J10 (not J1, J10, J2)."""
     net_rows = [
@@ -238,6 +329,46 @@ def test_process_connectors_image_resolution():
     assert result_without[0].image_caption is None
 
 
+def test_natural_sort_key_orders_numbers_numerically():
+    names = ["X10", "x2", "X1", None]
+    assert sorted(names, key=_natural_sort_key) == [None, "X1", "x2", "X10"]
+    assert _natural_sort_key("J12-X3") == ("j", 12, "-x", 3, "")
+
+
+def test_natural_sort_keys_are_memoized():
+    before = natural_sort_cache_info()
+    first = _natural_sort_key("memo-J7")
+    second = _natural_sort_key("memo-J7")
+    after = natural_sort_cache_info()
+
+    assert second is first
+    assert after.hits - before.hits == 1
+    assert after.misses - before.misses == 1
+    assert after.maxsize is not None
+
+
+def test_connector_index_lookups_match_full_scan():
+    designators = [
+        make_designator_row(comp_des="J10", conn_des="X1", conn_mpn="MPN-A"),
+        make_designator_row(comp_des="J2", conn_des="X1", conn_mpn="MPN-B"),
+        make_designator_row(comp_des="J2", conn_des="X1", conn_mpn="MPN-DUP"),
+        make_designator_row(comp_des="J3", conn_des="", conn_mpn="MPN-C"),
+    ]
+    index = ConnectorIndex(designators, [make_connector_row(mpn="MPN-A")])
+
+    assert [d.conn_mpn for d in index.designators_for(["J10-X1", "J2-X1", "J9-X9"])] == ["MPN-B", "MPN-DUP", "MPN-A"]
+    assert [d.comp_des for d in index.all_designators()] == ["J2", "J2", "J3", "J10"]
+    assert set(index.connectors) == {"MPN-A"}
+
+
+def test_process_connectors_with_prebuilt_index(sample_data):
+    index = ConnectorIndex(sample_data["designator_rows"], sample_data["connector_rows"])
+    args = (sample_data["net_rows"], sample_data["designator_rows"], sample_data["connector_rows"], set())
+
+    assert process_connectors(*args, filter_active=True, index=index) == process_connectors(*args, filter_active=True)
+    assert process_connectors(*args, filter_active=False, index=index) == process_connectors(*args, filter_active=False)
+
+
 # --- Designator format ---
 
 
@@ -348,6 +479,54 @@ def test_generate_cable_labels_deduplication():
     assert labels.count("J1-X1 : W001") == 1
 
 
+def _reference_cable_labels(net_rows):
+    """The original list-scanning implementation (cables in first-appearance order)."""
+    cable_dict = {r.cable_des: [] for r in net_rows}
+    for row in net_rows:
+        c1, c2 = row.conn_des_1, row.conn_des_2
+        label_1 = f"{row.comp_des_1}-{c1} : {row.cable_des}" if c1 else f"{row.comp_des_1} : {row.cable_des}"
+        label_2 = f"{row.comp_des_2}-{c2} : {row.cable_des}" if c2 else f"{row.comp_des_2} : {row.cable_des}"
+        if label_1 not in cable_dict[row.cable_des]:
+            cable_dict[row.cable_des].append(label_1)
+        if label_2 not in cable_dict[row.cable_des]:
+            cable_dict[row.cable_des].append(label_2)
+    return [
+        {"Label": item} for item in ["Cable Labels:", *(label for labels in cable_dict.values() for label in labels)]
+    ]
+
+
+def test_generate_cable_labels_matches_reference():
+    net_rows = [
+        make_net_row(cable_des="W002", comp_des_1="J3", conn_des_1="", comp_des_2="J1", conn_des_2="X1"),
+        make_net_row(cable_des="W001", comp_des_1="J1", conn_des_1="X1", comp_des_2="J2", conn_des_2=""),
+        make_net_row(cable_des="W001", comp_des_1="J1-X1", conn_des_1="", comp_des_2="J2", conn_des_2=""),
+        make_net_row(cable_des="W002", comp_des_1="J1", conn_des_1="X1", comp_des_2="J4", conn_des_2="X2"),
+        make_net_row(cable_des="W001", comp_des_1="J5", conn_des_1="X1", comp_des_2="J1", conn_des_2="X1"),
+    ]
+    assert generate_cable_labels(net_rows) == _reference_cable_labels(net_rows)
+
+
+def _best_time(func, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_label_generation_scales_linearly():
+    """4x the endpoints in one bundle costs about 4x, not 16x (list scanning did)."""
+
+    def bundle(n):
+        return [make_net_row(comp_des_1=f"A{i}", conn_des_1="X1", comp_des_2=f"B{i}", pin_1=str(i)) for i in range(n)]
+
+    small, large = bundle(2500), bundle(10000)
+    for func in (generate_cable_labels, generate_wire_labels):
+        ratio = _best_time(func, large) / _best_time(func, small)
+        assert ratio < 10, f"{func.__name__}: {ratio:.1f}x time for 4x rows"
+
+
 # --- Wire labels ---
 
 
@@ -381,6 +560,65 @@ def test_generate_wire_labels_grouped_by_cable():
     assert w1_idx < w2_idx
 
 
+# --- Streaming consumers ---
+
+
+def test_iter_wire_labels_matches_generate_for_sorted_stream():
+    """iter_wire_labels on a pre-sorted generator equals generate_wire_labels."""
+    net_rows = [
+        make_net_row(cable_des="W002", comp_des_1="J3", conn_des_1="", pin_1="1"),
+        make_net_row(cable_des="W001", comp_des_1="J1", conn_des_1="X1", pin_1="2"),
+        make_net_row(cable_des="W001", comp_des_1="J1", conn_des_1="X1", pin_1="1"),
+    ]
+    ordered = sorted(net_rows, key=lambda r: (r.cable_des, r.comp_des_1, r.conn_des_1, r.pin_1))
+
+    streamed = list(iter_wire_labels(row for row in ordered))
+    assert streamed == generate_wire_labels(net_rows)
+
+
+def test_generate_bom_data_accepts_single_pass_iterator(sample_data):
+    """BOM generation consumes net_rows once, so a generator gives the same result."""
+    expected = generate_bom_data(
+        sample_data["net_rows"],
+        sample_data["designator_rows"],
+        sample_data["connector_rows"],
+        sample_data["cable_rows"],
+    )
+    streamed = generate_bom_data(
+        (row for row in sample_data["net_rows"]),
+        sample_data["designator_rows"],
+        sample_data["connector_rows"],
+        sample_data["cable_rows"],
+    )
+    assert streamed == expected
+
+
+def test_net_table_input_matches_list_without_building_rows(sample_data):
+    """A NetTable is read column-wise: same output as a list, and no NetRow per wire."""
+    net_rows = [
+        *sample_data["net_rows"],
+        make_net_row(cable_des="W002", comp_des_1="J3", conn_des_1="", pin_1="2", net_name="gnd"),
+        make_net_row(cable_des="W002", comp_des_1="J3", conn_des_1="", pin_1="1", net_name="SigB"),
+    ]
+    catalog = (sample_data["designator_rows"], sample_data["connector_rows"])
+
+    def outputs(rows):
+        view = sort_net_rows(rows)
+        return (
+            generate_bom_data(rows, *catalog, sample_data["cable_rows"]),
+            generate_cable_labels(rows),
+            list(iter_wire_labels(view)),
+            process_cables(view, sample_data["cable_rows"]),
+            process_connections(view),
+            process_connectors(rows, *catalog, set(), filter_active=True),
+        )
+
+    expected = outputs(net_rows)
+    table = NetTable(net_rows)
+    with patch("wireviz_yaml_generator.models.NetRow", side_effect=AssertionError("row built")):
+        assert outputs(table) == expected
+
+
 # --- Empty input ---
 
 
@@ -1,9 +1,15 @@
 """Unit Tests for WorkflowManager orchestration."""
 
 import os
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pandas as pd
+import pytest
 import yaml
+from wireviz_yaml_generator.exceptions import ConfigurationError
+from wireviz_yaml_generator.models import NetTable
+from wireviz_yaml_generator.rendering.diagrams import estimate_cost
+from wireviz_yaml_generator.transformations import ConnectorIndex
 from wireviz_yaml_generator.workflow_manager import WorkflowManager
 
 from conftest import make_cable_row, make_connector_row, make_designator_row, make_net_row
@@ -13,6 +19,10 @@ def _build_mock_source(net_rows, designator_rows, connector_rows, cable_rows):
     """Create a mock SqliteDataSource that returns the given data."""
     source = MagicMock()
     source.load_net_table.return_value = net_rows
+    partitions: dict[str, list] = {}
+    for row in net_rows:
+        partitions.setdefault(row.cable_des, []).append(row)
+    source.load_net_table_by_cable.return_value = partitions
     source.load_designator_table.return_value = designator_rows
     source.load_connector_table.return_value = connector_rows
     source.load_cable_table.return_value = cable_rows
@@ -59,6 +69,29 @@ def test_run_yaml_workflow_creates_valid_yaml(tmp_path):
     assert "W001" in data["cables"]
 
 
+def test_run_yaml_workflow_records_render_cost(tmp_path):
+    """The recorded cost equals what estimate_cost reads back from the written YAML."""
+    net_rows = [
+        make_net_row(cable_des="W001", comp_des_1="J1", conn_des_1="X1", comp_des_2="J2", conn_des_2="", pin_1=pin)
+        for pin in ("1", "2")
+    ]
+    designator_rows = [
+        make_designator_row(comp_des="J1", conn_des="X1", conn_mpn="MPN-A"),
+        make_designator_row(comp_des="J2", conn_des="", conn_mpn="MPN-B"),
+    ]
+    connector_rows = [
+        make_connector_row(mpn="MPN-A", mate_mpn="MATE-A"),
+        make_connector_row(mpn="MPN-B", mate_mpn="MATE-B"),
+    ]
+    source = _build_mock_source(net_rows, designator_rows, connector_rows, [make_cable_row(cable_des="W001")])
+    wm = WorkflowManager(source)
+
+    yaml_path = tmp_path / "W001.yaml"
+    wm.run_yaml_workflow("W001", str(yaml_path), {"MATE-A.png"})
+
+    assert wm.render_costs["W001"] == estimate_cost(yaml_path.read_text(encoding="utf-8")) > 0
+
+
 def test_run_yaml_workflow_calls_data_source(tmp_path):
     """run_yaml_workflow calls all four data source methods."""
     source = _build_mock_source(
@@ -78,6 +111,25 @@ def test_run_yaml_workflow_calls_data_source(tmp_path):
     source.load_cable_table.assert_called_once()
 
 
+def test_run_yaml_workflow_uses_preloaded_net_rows(tmp_path):
+    """Passing net_rows skips the per-cable NetTable query."""
+    source = _build_mock_source(
+        [],
+        [make_designator_row()],
+        [make_connector_row()],
+        [make_cable_row()],
+    )
+    wm = WorkflowManager(source)
+
+    yaml_path = str(tmp_path / "W001.yaml")
+    wm.run_yaml_workflow("W001", yaml_path, set(), net_rows=[make_net_row(cable_des="W001")])
+
+    source.load_net_table.assert_not_called()
+    with open(yaml_path, encoding="utf-8") as f:
+        data = yaml.safe_load(f.read())
+    assert data["cables"]["W001"]["wirecount"] == 1
+
+
 def test_run_attachment_workflow_creates_bom_file(tmp_path):
     """run_attachment_workflow creates BOM.xlsx when create_bom=True."""
     net_rows = [
@@ -146,3 +198,80 @@ def test_run_attachment_workflow_filters_cables(tmp_path):
     all_text = " ".join(str(cell.value) for row in ws.iter_rows() for cell in row if cell.value)
     assert "W001" in all_text
     assert "W002" not in all_text
+
+
+def test_run_attachment_workflow_reads_selected_partitions_as_columns(tmp_path):
+    """Attachments come from the selected cables' partitions, joined into one NetTable."""
+    net_rows = [
+        make_net_row(cable_des="W002", net_name="Sig2"),
+        make_net_row(cable_des="W001", net_name="Sig1", pin_1="2"),
+        make_net_row(cable_des="W001", net_name="+24V", pin_1="1"),
+    ]
+    source = _build_mock_source(net_rows, [make_designator_row()], [make_connector_row()], [make_cable_row()])
+    wm = WorkflowManager(source)
+
+    with (
+        patch("wireviz_yaml_generator.transformations.generate_bom_data", return_value=[]) as bom,
+        patch("wireviz_yaml_generator.transformations.generate_cable_labels", return_value=[]) as labels,
+    ):
+        wm.run_attachment_workflow(["W001"], str(tmp_path))
+
+    source.load_net_table.assert_not_called()
+    selected = bom.call_args.kwargs["net_rows"]
+    assert isinstance(selected, NetTable)
+    assert selected == net_rows[1:]
+    assert labels.call_args.args[0] is selected
+
+
+def test_run_attachment_workflow_single_workbook(tmp_path):
+    """attachment_format="workbook" writes one Attachments.xlsx with a sheet per attachment."""
+    source = _build_mock_source(
+        [make_net_row(cable_des="W001")], [make_designator_row()], [make_connector_row()], [make_cable_row()]
+    )
+    wm = WorkflowManager(source)
+
+    wm.run_attachment_workflow(["W001"], str(tmp_path), attachment_format="workbook")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Attachments.xlsx"]
+    sheets = pd.read_excel(tmp_path / "Attachments.xlsx", sheet_name=None)
+    assert list(sheets) == ["BOM", "Cablelabels", "WireLabels"]
+
+
+def test_run_attachment_workflow_formats_agree(tmp_path):
+    """The same rows are written as separate workbooks, one workbook and TSV."""
+    net_rows = [make_net_row(cable_des="W001", pin_1="1"), make_net_row(cable_des="W001", pin_1="2")]
+    source = _build_mock_source(net_rows, [make_designator_row()], [make_connector_row()], [make_cable_row()])
+    wm = WorkflowManager(source)
+    for attachment_format in ("xlsx", "workbook", "tsv"):
+        (tmp_path / attachment_format).mkdir()
+        wm.run_attachment_workflow(["W001"], str(tmp_path / attachment_format), attachment_format=attachment_format)
+
+    workbook = pd.read_excel(tmp_path / "workbook" / "Attachments.xlsx", sheet_name=None)
+    for name in ("BOM", "Cablelabels", "WireLabels"):
+        separate = pd.read_excel(tmp_path / "xlsx" / f"{name}.xlsx")
+        tsv = pd.read_csv(tmp_path / "tsv" / f"{name}.tsv", sep="\t")
+        pd.testing.assert_frame_equal(workbook[name], separate)
+        # Excel reads whole floats back as ints; TSV keeps Python's "2.0"
+        pd.testing.assert_frame_equal(tsv, separate, check_dtype=False)
+
+
+def test_run_attachment_workflow_rejects_unknown_format(tmp_path):
+    wm = WorkflowManager(_build_mock_source([], [], [], []))
+    with pytest.raises(ConfigurationError, match="attachment format"):
+        wm.run_attachment_workflow(["W001"], str(tmp_path), attachment_format="ods")
+
+
+def test_run_yaml_workflow_reuses_connector_index(tmp_path):
+    """The connector index is built once per catalog snapshot, not once per cable."""
+    net_rows = [make_net_row(cable_des="W001"), make_net_row(cable_des="W002")]
+    source = _build_mock_source([], [make_designator_row()], [make_connector_row()], [make_cable_row()])
+    wm = WorkflowManager(source)
+
+    with patch("wireviz_yaml_generator.transformations.ConnectorIndex", wraps=ConnectorIndex) as index_cls:
+        for row in net_rows:
+            wm.run_yaml_workflow(row.cable_des, str(tmp_path / f"{row.cable_des}.yaml"), set(), net_rows=[row])
+        assert index_cls.call_count == 1
+
+        source.load_designator_table.return_value = [make_designator_row(conn_mpn="MPN-NEW")]
+        wm.run_yaml_workflow("W001", str(tmp_path / "W001.yaml"), set(), net_rows=net_rows[:1])
+        assert index_cls.call_count == 2
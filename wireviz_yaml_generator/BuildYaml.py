@@ -9,10 +9,15 @@ expects for generation.
 It uses Pure Functions for conversion to ensure testability.
 """
 
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
 from typing import Any
 
-import yaml
-
+from .exceptions import ConfigurationError
 from .models import Cable, Connection, Connector
 
 # --- Pure Conversion Functions ---
@@ -110,25 +115,137 @@ def connection_to_list(c: Connection) -> list[dict[str, Any]]:
     return [from_node, via_node, to_node]
 
 
+# --- Emitters ---
+# All produce the same YAML document (same data when loaded); only speed and
+# quoting style differ. "pyyaml" is the reference pure-Python writer.
+
+EMITTERS = ("auto", "libyaml", "schema", "pyyaml")
+
+# Plain (unquoted) scalars the schema emitter may write: designator-like words
+# that no YAML 1.1 resolver reads as anything but a string.
+_PLAIN_SAFE = re.compile(r"[A-Za-z_][A-Za-z0-9_./+-]*")
+_RESERVED_WORDS = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+# Printable text without line breaks or tabs, as PyYAML single-quotes it
+_SINGLE_QUOTABLE = re.compile("[\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]*")
+# Characters YAML cannot hold literally in a double-quoted scalar, or would fold
+_YAML_UNSAFE = re.compile("[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff]")
+
+
+def _schema_scalar(value: Any) -> str:
+    """Render one scalar the way the YAML loader will read it back."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        # Same rules as PyYAML's float representer
+        if value != value:
+            return ".nan"
+        if value in (float("inf"), float("-inf")):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value).lower()
+        if "." not in text and "e" in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if isinstance(value, str):
+        if _PLAIN_SAFE.fullmatch(value) and value.lower() not in _RESERVED_WORDS:
+            return value
+        if _SINGLE_QUOTABLE.fullmatch(value):
+            return "'" + value.replace("'", "''") + "'"
+        # A JSON string is a valid YAML double-quoted scalar
+        return _YAML_UNSAFE.sub(lambda m: f"\\u{ord(m.group()):04x}", json.dumps(value, ensure_ascii=False))
+    raise TypeError(f"Cannot emit {type(value).__name__} value {value!r} as YAML")
+
+
+def _schema_block(value: dict[Any, Any] | list[Any], indent: int, out: list[str]) -> None:
+    """Append a non-empty mapping or sequence in PyYAML's block layout."""
+    pad = " " * indent
+    if isinstance(value, dict):
+        for key, item in value.items():
+            head = f"{pad}{_schema_scalar(key)}:"
+            if isinstance(item, dict) and item:
+                out.append(head)
+                _schema_block(item, indent + 2, out)
+            elif isinstance(item, list) and item:
+                # Sequences in a mapping are not indented
+                out.append(head)
+                _schema_block(item, indent, out)
+            else:
+                out.append(f"{head} {_schema_inline(item)}")
+    else:
+        for item in value:
+            if isinstance(item, dict | list) and item:
+                # Nested block starts on the "- " line
+                start = len(out)
+                _schema_block(item, indent + 2, out)
+                out[start] = f"{pad}- {out[start][indent + 2 :]}"
+            else:
+                out.append(f"{pad}- {_schema_inline(item)}")
+
+
+def _schema_inline(value: Any) -> str:
+    if isinstance(value, dict):
+        return "{}"
+    if isinstance(value, list):
+        return "[]"
+    return _schema_scalar(value)
+
+
+def _emit_schema(data: dict[str, Any]) -> str:
+    """Streaming emitter for the generator's own output shape (dicts, lists, scalars)."""
+    if not data:
+        return "{}\n"
+    out: list[str] = []
+    _schema_block(data, 0, out)
+    out.append("")
+    return "\n".join(out)
+
+
+def _emit(data: dict[str, Any], emitter: str) -> str:
+    if emitter == "schema":
+        return _emit_schema(data)
+    if emitter not in EMITTERS:
+        raise ConfigurationError(f"Unknown YAML emitter '{emitter}'. Use one of: {', '.join(EMITTERS)}.")
+
+    # PyYAML is imported on first use; the schema emitter does not need it
+    import yaml
+
+    if emitter == "auto":
+        emitter = "libyaml" if yaml.__with_libyaml__ else "schema"
+    if emitter == "schema":
+        return _emit_schema(data)
+    if emitter == "libyaml":
+        if not yaml.__with_libyaml__:
+            raise ConfigurationError("emitter='libyaml' requires PyYAML built with libyaml.")
+        return yaml.dump(data, Dumper=yaml.CSafeDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    return yaml.dump(data, sort_keys=False, default_flow_style=False, allow_unicode=True)
+
+
 # --- Main Builder ---
 
+YAML_HEADER = "# WireViz YAML file generated by WireViz YAML Generator v01\n\n"
 
-def build_yaml_file(
-    connectors: list[Connector], cables: list[Cable], connections: list[Connection], yaml_filepath: str
-) -> None:
+
+def render_yaml(
+    connectors: list[Connector], cables: list[Cable], connections: list[Connection], emitter: str = "auto"
+) -> str:
     """
-    Orchestrates the creation of the final YAML file.
+    Renders the complete WireViz YAML document to a string.
 
     Steps:
     1.  Converts all Domain Objects to Dicts using pure converters.
     2.  Assembles the final root dictionary.
-    3.  Writes to filesystem using PyYAML.
+    3.  Emits it below the generator header.
 
     Args:
         connectors: List of Connector objects.
         cables: List of Cable objects.
         connections: List of Connection objects.
-        yaml_filepath: Destination path string.
+        emitter: "libyaml" (PyYAML's C dumper), "schema" (built-in emitter for
+                 this document shape), "pyyaml" (pure-Python dumper), or "auto":
+                 libyaml when available, else schema.
     """
 
     # 1. Convert to Dicts
@@ -147,7 +264,68 @@ def build_yaml_file(
     if formatted_connections:
         final_data["connections"] = formatted_connections
 
-    # 3. Write Output
-    with open(yaml_filepath, "w", encoding="utf-8") as f:
-        f.write("# WireViz YAML file generated by WireViz YAML Generator v01\n\n")
-        yaml.dump(final_data, f, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    # 3. Emit
+    return YAML_HEADER + _emit(final_data, emitter)
+
+
+def write_if_changed(filepath: str, text: str) -> bool:
+    """
+    Writes ``text`` to ``filepath`` only if the file's content would change.
+
+    The existing file is compared by size and SHA-256 digest. A changed file
+    is written to a temporary sibling and moved into place with ``os.replace``,
+    so readers never see a partial file. An unchanged file keeps its mtime,
+    which lets make-style tools downstream skip it.
+
+    Returns:
+        True if the file was created or replaced, False if it was already current.
+    """
+    # Same bytes a text-mode write would produce on this platform
+    data = text.replace("\n", os.linesep).encode("utf-8")
+    path = Path(filepath)
+
+    try:
+        if (
+            path.stat().st_size == len(data)
+            and hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(data).digest()
+        ):
+            return False
+    except FileNotFoundError:
+        pass
+
+    # Unique per process and thread; created like a normal file, so the umask applies
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def build_yaml_file(
+    connectors: list[Connector],
+    cables: list[Cable],
+    connections: list[Connection],
+    yaml_filepath: str,
+    emitter: str = "auto",
+) -> bool:
+    """
+    Orchestrates the creation of the final YAML file.
+
+    Renders the document in memory (``render_yaml``) and writes it only if it
+    differs from the file already on disk (``write_if_changed``).
+
+    Args:
+        connectors: List of Connector objects.
+        cables: List of Cable objects.
+        connections: List of Connection objects.
+        yaml_filepath: Destination path string.
+        emitter: YAML emitter, see ``render_yaml``.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    return write_if_changed(yaml_filepath, render_yaml(connectors, cables, connections, emitter))
@@ -24,6 +24,7 @@ import tomllib
 from pathlib import Path
 from typing import Any, Optional
 
+from .excel_writer import ATTACHMENT_FORMATS
 from .exceptions import ConfigurationError
 
 SCRIPT_PATH = Path(__file__).resolve()
@@ -158,3 +159,44 @@ class ConfigLoader:
             Path: Absolute path to the attachments output directory.
         """
         return self.base_path / str(self.get_value("attachments_path"))
+
+    @property
+    def max_workers(self) -> int | None:
+        """
+        Returns the number of parallel diagram renders, if configured.
+
+        This key is optional; without it the build uses one worker per CPU.
+
+        Returns:
+            int | None: The configured worker count, or None if not set.
+
+        Raises:
+            ConfigurationError: If the value is not a positive integer.
+        """
+        value = self._config.get("max_workers")
+        if value is None:
+            return None
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ConfigurationError(f"Configuration key 'max_workers' must be a positive integer, got {value!r}")
+        return value
+
+    @property
+    def attachment_format(self) -> str:
+        """
+        Returns the output format of the manufacturing attachments.
+
+        This key is optional and defaults to "xlsx" (one workbook per
+        attachment). See ``excel_writer.ATTACHMENT_FORMATS``.
+
+        Returns:
+            str: "xlsx", "workbook", "csv" or "tsv".
+
+        Raises:
+            ConfigurationError: If the value is not a known format.
+        """
+        value = self._config.get("attachment_format", "xlsx")
+        if value not in ATTACHMENT_FORMATS:
+            raise ConfigurationError(
+                f"Configuration key 'attachment_format' must be one of {', '.join(ATTACHMENT_FORMATS)}, got {value!r}"
+            )
+        return value
@@ -3,33 +3,64 @@ WireViz YAML Generator.
 
 A tool for generating WireViz YAML files and manufacturing documentation
 from SQLite electrical design databases.
+
+Public names are imported on first access (PEP 562), so that
+``import wireviz_yaml_generator`` stays cheap: pandas, PyYAML and Typst
+are only loaded by the code paths that use them.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Ole Johan Bondahl"
 __license__ = "MIT"
 
-from .csv_data_source import CsvDataSource
 from .exceptions import (
     ConfigurationError,
     DatabaseError,
     DataSourceError,
     WireVizError,
 )
-from .models import (
-    BomItem,
-    Cable,
-    CableRow,
-    Connection,
-    Connector,
-    ConnectorRow,
-    DesignatorRow,
-    NetRow,
-    Wire,
-)
-from .project import Project
-from .protocols import DataSourceProtocol
-from .workflow_manager import WorkflowManager
+
+if TYPE_CHECKING:
+    from .csv_data_source import CsvDataSource
+    from .diagnostics import Diagnostic, Diagnostics
+    from .models import (
+        BomItem,
+        Cable,
+        CableRow,
+        Connection,
+        Connector,
+        ConnectorRow,
+        DesignatorRow,
+        NetRow,
+        NetTable,
+        Wire,
+    )
+    from .project import Project
+    from .protocols import DataSourceProtocol
+    from .workflow_manager import WorkflowManager
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "Connector": "models",
+    "Cable": "models",
+    "Connection": "models",
+    "BomItem": "models",
+    "Wire": "models",
+    "NetRow": "models",
+    "NetTable": "models",
+    "DesignatorRow": "models",
+    "ConnectorRow": "models",
+    "CableRow": "models",
+    "DataSourceProtocol": "protocols",
+    "CsvDataSource": "csv_data_source",
+    "Diagnostic": "diagnostics",
+    "Diagnostics": "diagnostics",
+    "WorkflowManager": "workflow_manager",
+    "Project": "project",
+}
 
 __all__ = [
     "Connector",
@@ -38,6 +69,7 @@ __all__ = [
     "BomItem",
     "Wire",
     "NetRow",
+    "NetTable",
     "DesignatorRow",
     "ConnectorRow",
     "CableRow",
@@ -47,6 +79,21 @@ __all__ = [
     "DataSourceError",
     "DataSourceProtocol",
     "CsvDataSource",
+    "Diagnostic",
+    "Diagnostics",
     "WorkflowManager",
     "Project",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,190 @@
+"""
+Build Engine - Parallel Drawing Build.
+
+The drawing build shared by ``Project.build`` and the ``wireviz-generator``
+console script (main.py). It runs three things at once:
+
+    - the attachment workflow (BOM and labels), on its own worker thread;
+    - YAML generation, one cable after another on the calling thread;
+    - WireViz rendering, on a pool of workers. Each cable is queued as soon
+      as its YAML is written (see ``rendering.diagrams.RenderPipeline``).
+
+The result is a ``BuildSummary`` with the YAML and SVG outcome of every
+cable, including how long each render took.
+
+Example:
+    >>> summary = build_drawings(workflow, source, ["W001", "W002"], yaml_dir="src", drawings_dir="svg")
+    >>> summary.report()
+"""
+
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, TextIO
+
+from .protocols import DataSourceProtocol
+from .rendering import diagrams
+from .rendering.svg_cache import SvgCache
+from .workflow_manager import WorkflowManager
+
+# Number of slowest renders named in the summary line
+SLOWEST_SHOWN = 3
+
+
+@dataclass
+class BuildSummary:
+    """Outcome of one ``build_drawings`` run."""
+
+    drawings_dir: str
+    yaml_files: list[tuple[str, str]] = field(default_factory=list)  # (cable_des, yaml_path)
+    changed_cables: list[str] = field(default_factory=list)
+    skipped_cables: list[str] = field(default_factory=list)  # requested, but not in the data source
+    renders: list[diagrams.RenderResult] = field(default_factory=list)
+    rendered: bool = False  # False when no WireViz backend was available
+    cached: bool = False  # whether a render cache was used
+    seconds: float = 0.0
+
+    @property
+    def svg_paths(self) -> list[tuple[str, str]]:
+        """``(cable_des, svg_path)`` of every usable diagram, sorted by cable.
+
+        Without a backend, SVGs left by an earlier build are used where present.
+        """
+        if self.rendered:
+            return [(r.cable_des, r.svg_path) for r in self.renders if not r.error]
+        existing = ((cable_des, str(Path(self.drawings_dir) / f"{cable_des}.svg")) for cable_des, _ in self.yaml_files)
+        return [(cable_des, svg_path) for cable_des, svg_path in existing if Path(svg_path).exists()]
+
+    def report(self, verbose: bool = False, stream: TextIO | None = None) -> None:
+        """
+        Prints the build log: YAML counts, render failures and a timing summary.
+
+        With ``verbose``, skipped cables and every successful render (with its
+        time) are listed too.
+        """
+        out = stream if stream is not None else sys.stdout
+        if verbose:
+            for cable_des in self.skipped_cables:
+                print(f"   ⚠️ Skipping {cable_des}. No data found.", file=out)
+        print(
+            f"YAML generated for {len(self.yaml_files)} cables ({_summarize_changed(self.changed_cables)}).",
+            file=out,
+        )
+
+        if not self.rendered:
+            if self.yaml_files:
+                print("ℹ️  WireViz not available. Skipping diagram generation.", file=out)
+            return
+
+        for result in self.renders:
+            if result.error:
+                print(f"   ❌ WireViz error for {result.cable_des}: {result.error}", file=out)
+            elif verbose:
+                source = "cached" if result.cached else f"{result.seconds:.2f} s"
+                print(f"   ✅ Diagram generated for {result.cable_des} ({source})", file=out)
+
+        if self.renders:
+            print(f"SVG diagrams generated for {len(self.svg_paths)} cables{self._render_details()}.", file=out)
+
+    def _render_details(self) -> str:
+        successes = [r for r in self.renders if not r.error]
+        hits = sum(r.cached for r in successes)
+        details = f" ({hits} from cache, {len(successes) - hits} rendered)" if self.cached else ""
+        details += f" in {self.seconds:.1f} s"
+        slowest = sorted((r for r in successes if not r.cached), key=attrgetter("seconds"), reverse=True)
+        if slowest:
+            named = ", ".join(f"{r.cable_des} {r.seconds:.1f} s" for r in slowest[:SLOWEST_SHOWN])
+            details += f"; slowest: {named}"
+        return details
+
+
+def build_drawings(
+    workflow: WorkflowManager,
+    data_source: DataSourceProtocol,
+    cable_filters: Sequence[str],
+    *,
+    yaml_dir: str,
+    drawings_dir: str,
+    available_images: set[str] | None = None,
+    render_backend: str = "auto",
+    max_workers: int | None = None,
+    cache: SvgCache | None = None,
+    pins_last: list[str] | None = None,
+    connector_overrides: dict[str, dict] | None = None,
+    attachments: Callable[[], Any] | None = None,
+) -> BuildSummary:
+    """
+    Generates YAML for each cable and renders it, in parallel.
+
+    Args:
+        workflow: Runs the per-cable YAML workflow.
+        data_source: Provides the NetTable, read once and partitioned by cable.
+        cable_filters: Cable designators to build; those with no NetTable rows are skipped.
+        yaml_dir: Directory for the ``<cable>.yaml`` files.
+        drawings_dir: Directory for the ``<cable>.svg`` files.
+        available_images: Connector image filenames found in the resources directory.
+        render_backend: "python", "cli" or "auto" (see ``rendering.diagrams``).
+        max_workers: Parallel renders; defaults to one per CPU, never more than the cables.
+        cache: Render cache; unchanged cables are copied from it instead of rendered.
+        pins_last: Forwarded to ``WorkflowManager.run_yaml_workflow``.
+        connector_overrides: Forwarded to ``WorkflowManager.run_yaml_workflow``.
+        attachments: Attachment workflow to run on its own worker during the build
+                     (e.g. ``partial(workflow.run_attachment_workflow, ...)``).
+                     Its exceptions are re-raised.
+
+    Returns:
+        BuildSummary: The outcome of every cable; call ``report()`` to print it.
+    """
+    started = time.perf_counter()
+    summary = BuildSummary(drawings_dir=drawings_dir, cached=cache is not None)
+    Path(yaml_dir).mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="attachments") as attachment_worker:
+        attachment_job = attachment_worker.submit(attachments) if attachments is not None else None
+
+        # NetTable is read once and partitioned, rather than queried per cable.
+        # The partitions also say which cables exist, so no second scan is needed.
+        net_partitions = data_source.load_net_table_by_cable()
+        cables = [c for c in cable_filters if c in net_partitions]
+        summary.skipped_cables = [c for c in cable_filters if c not in net_partitions]
+
+        workers = diagrams.worker_count(max_workers, len(cables))
+        with diagrams.RenderPipeline(drawings_dir, backend=render_backend, max_workers=workers, cache=cache) as renders:
+            for cable_filter in cables:
+                yaml_filepath = str(Path(yaml_dir) / f"{cable_filter}.yaml")
+                changed = workflow.run_yaml_workflow(
+                    cable_filter,
+                    yaml_filepath,
+                    available_images or set(),
+                    pins_last=pins_last,
+                    connector_overrides=connector_overrides,
+                    net_rows=net_partitions[cable_filter],
+                )
+                summary.yaml_files.append((cable_filter, yaml_filepath))
+                if changed:
+                    summary.changed_cables.append(cable_filter)
+                # The workflow already counted the diagram's parts; no need to re-parse the YAML
+                renders.submit(cable_filter, yaml_filepath, cost=workflow.render_costs.get(cable_filter))
+
+        # Re-raises any error from the attachment worker
+        if attachment_job is not None:
+            attachment_job.result()
+
+    summary.rendered = renders.available
+    summary.renders = renders.results()
+    summary.seconds = time.perf_counter() - started
+    return summary
+
+
+def _summarize_changed(changed_cables: list[str], limit: int = 10) -> str:
+    """Short description of which cables' YAML changed, for the build log."""
+    if not changed_cables:
+        return "none changed"
+    names = ", ".join(changed_cables[:limit])
+    if len(changed_cables) > limit:
+        names += f", ... {len(changed_cables) - limit} more"
+    return f"{len(changed_cables)} changed: {names}"
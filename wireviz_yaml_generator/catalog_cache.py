@@ -0,0 +1,80 @@
+"""
+Catalog Snapshot Cache.
+
+Holds parsed catalog tables (DesignatorTable, ConnectorTable, CableTable)
+for the lifetime of the process, so that repeated loads - every cable in a
+build, or every build in a notebook or watch loop - skip re-reading and
+re-parsing tables that have not changed.
+
+Entries are keyed by source (e.g. the resolved database path) and tagged with
+a version token chosen by the data source: file signature and
+``PRAGMA data_version`` for SQLite, content hash for CSV. A lookup with a
+different version discards every table cached for that source.
+
+Example:
+    >>> rows = catalog_cache.get(("sqlite", path), version, "CableTable", read_cable_table)
+"""
+
+import threading
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class CatalogCache:
+    """
+    Thread-safe store of immutable table snapshots, one version per source.
+
+    Loaders run outside the lock, so a slow database read does not block
+    lookups for other sources.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, tuple[Hashable, dict[str, tuple[Any, ...]]]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        source: Hashable,
+        version: Hashable,
+        table: str,
+        loader: Callable[[], Iterable[T]],
+    ) -> tuple[T, ...]:
+        """
+        Returns the cached snapshot of ``table``, calling ``loader`` on a miss.
+
+        Args:
+            source: Identifies the data source (e.g. ``("sqlite", "/abs/master.db")``).
+            version: Token that changes whenever the source content changes.
+            table: Table name within the source.
+            loader: Produces the parsed rows when the snapshot is missing or stale.
+        """
+        with self._lock:
+            entry = self._entries.get(source)
+            if entry is None or entry[0] != version:
+                entry = (version, {})
+                self._entries[source] = entry
+            cached = entry[1].get(table)
+        if cached is not None:
+            return cached
+
+        rows = tuple(loader())
+        with self._lock:
+            entry = self._entries.get(source)
+            if entry is not None and entry[0] == version:
+                rows = entry[1].setdefault(table, rows)
+        return rows
+
+    def invalidate(self, source: Hashable) -> None:
+        """Drops every snapshot held for ``source``."""
+        with self._lock:
+            self._entries.pop(source, None)
+
+    def clear(self) -> None:
+        """Drops all snapshots."""
+        with self._lock:
+            self._entries.clear()
+
+
+catalog_cache = CatalogCache()
@@ -1,10 +1,23 @@
 """CSV Data Source — reads a denormalized CSV file as an alternative to SQLite."""
 
 import csv
+import hashlib
+import io
+import marshal
+import os
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import fields
+from itertools import starmap
+from operator import attrgetter
 from pathlib import Path
+from typing import Any, NamedTuple, Self, TypeVar
 
+from .catalog_cache import catalog_cache
 from .exceptions import DataSourceError
-from .models import CableRow, ConnectorRow, DesignatorRow, NetRow
+from .models import NET_FIELDS, CableRow, ConnectorRow, DesignatorRow, NetRow, NetTable
+
+T = TypeVar("T")
 
 REQUIRED_COLUMNS = frozenset(
     {
@@ -23,7 +36,14 @@ class CsvDataSource:
     """Reads a single denormalized CSV file and provides the same interface as SqliteDataSource.
 
     Each CSV row represents one wire connection with optional inline connector/cable metadata.
-    Data is parsed once at construction time and served from memory.
+    Data is parsed once at construction time and served from memory: net rows are indexed by
+    cable_des, so filtered loads cost O(rows in cable), and catalog tables are deduplicated
+    up front and returned as shared immutable tuples. Derived catalog tables are cached
+    process-wide by file content hash, so re-opening an unchanged CSV skips them.
+
+    With ``sidecar_cache=True`` the parsed result is also persisted to a compact binary
+    (``marshal``) sidecar file, so later processes skip CSV parsing altogether while the
+    file is unchanged.
 
     Required columns (must be present as headers):
         cable_des, comp_des_1, conn_des_1, pin_1, comp_des_2, conn_des_2, pin_2
@@ -46,34 +66,76 @@ class CsvDataSource:
         *,
         auto_generate_cable_des: bool = False,
         cable_prefix: str = "W",
+        sidecar_cache: bool = False,
+        cache_dir: str | None = None,
     ) -> None:
+        """
+        Args:
+            csv_filepath: Path to the denormalized CSV file.
+            auto_generate_cable_des: Assign designators to rows with an empty cable_des.
+            cable_prefix: Prefix for auto-generated designators.
+            sidecar_cache: Keep the parsed rows and derived tables in a binary sidecar
+                file, reused on later runs while the CSV's size, mtime (or, failing
+                that, content hash) still match.
+            cache_dir: Directory for the sidecar. Defaults to next to the CSV.
+        """
         path = Path(csv_filepath)
         if not path.exists():
             raise DataSourceError(f"CSV file not found: {csv_filepath}")
 
+        options = (auto_generate_cable_des, cable_prefix)
+        self._cache_key = ("csv", str(path.resolve()))
+
+        sidecar = _sidecar_path(path, cache_dir) if sidecar_cache else None
+        parsed = _read_sidecar(sidecar, path, options) if sidecar else None
+        if parsed is None:
+            # Stat before reading: if the CSV changes during the parse, the
+            # sidecar records the older mtime and is revalidated next time
+            stat = path.stat()
+            parsed = self._parse(path, options)
+            if sidecar:
+                _write_sidecar(sidecar, stat, options, parsed)
+
+        self._columns = set(parsed.columns)
+
+        # Net rows in file order (columnar), plus per-cable partitions for filtered loads
+        self._net_rows = parsed.net_rows
+        self._net_rows_by_cable = self._net_rows.partition()
+
+        # Catalog snapshots are shared across instances reading identical content
+        self._cache_version = (parsed.sha256, *options)
+        self._designator_table = self._load_catalog("DesignatorTable", lambda: parsed.designators)
+        self._connector_table = self._load_catalog("ConnectorTable", lambda: parsed.connectors)
+        self._cable_table = self._load_catalog("CableTable", lambda: parsed.cables)
+
+    def _parse(self, path: Path, options: tuple[bool, str]) -> "_ParsedCsv":
+        """Read, validate and normalize the CSV, then derive the net rows and catalog tables."""
+        auto_generate_cable_des, cable_prefix = options
+        csv_filepath = str(path)
+
         try:
-            with path.open(newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                if reader.fieldnames is None:
-                    raise DataSourceError(f"CSV file is empty: {csv_filepath}")
+            content = path.read_bytes()
+            reader = csv.DictReader(io.StringIO(content.decode("utf-8"), newline=""))
+            if reader.fieldnames is None:
+                raise DataSourceError(f"CSV file is empty: {csv_filepath}")
 
-                columns = set(reader.fieldnames)
-                missing = REQUIRED_COLUMNS - columns
-                if missing:
-                    raise DataSourceError(f"CSV is missing required columns: {', '.join(sorted(missing))}")
+            columns = set(reader.fieldnames)
+            missing = REQUIRED_COLUMNS - columns
+            if missing:
+                raise DataSourceError(f"CSV is missing required columns: {', '.join(sorted(missing))}")
 
-                self._rows: list[dict[str, str]] = list(reader)
+            rows: list[dict[str, str]] = list(reader)
         except DataSourceError:
             raise
         except Exception as e:
             raise DataSourceError(f"Failed to read CSV file '{csv_filepath}': {e}") from e
 
-        if not self._rows:
+        if not rows:
             raise DataSourceError(f"CSV file has no data rows: {csv_filepath}")
 
         auto_counter = 0
         prev_comp_des = None
-        for row in self._rows:
+        for row in rows:
             cable_des = row.get("cable_des", "").strip()
             if not cable_des:
                 if not auto_generate_cable_des:
@@ -90,40 +152,86 @@ class CsvDataSource:
                 row["cable_des"] = cable_des
                 prev_comp_des = None
 
-        self._columns = columns
+        net_rows = NetTable.from_columns([[r.get(name, "") for r in rows] for name in NET_FIELDS])
+
+        # Catalog derivation is skipped when identical content was parsed before
+        digest = hashlib.sha256(content).hexdigest()
+        version = (digest, *options)
+        return _ParsedCsv(
+            sha256=digest,
+            columns=tuple(sorted(columns)),
+            net_rows=net_rows,
+            designators=catalog_cache.get(
+                self._cache_key, version, "DesignatorTable", lambda: self._build_designator_table(rows)
+            ),
+            connectors=catalog_cache.get(
+                self._cache_key, version, "ConnectorTable", lambda: self._build_connector_table(rows)
+            ),
+            cables=catalog_cache.get(self._cache_key, version, "CableTable", lambda: self._build_cable_table(rows)),
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """No-op: the CSV is read fully at construction and holds no open handles."""
 
     def _get(self, row: dict[str, str], key: str) -> str:
         """Return stripped value or empty string if column is absent."""
         return row.get(key, "").strip()
 
+    def _load_catalog(self, table_name: str, builder: Callable[[], list[T]]) -> tuple[T, ...]:
+        """Serve a derived catalog table from the snapshot cache."""
+        return catalog_cache.get(self._cache_key, self._cache_version, table_name, builder)
+
     # --- DataSourceProtocol methods ---
 
     def check_cable_existence(self, cable_des: str) -> bool:
-        return any(row["cable_des"] == cable_des for row in self._rows)
+        return cable_des in self._net_rows_by_cable
+
+    def list_cables(self) -> list[str]:
+        return sorted(self._net_rows_by_cable)
+
+    def existing_cables(self, candidates: Iterable[str]) -> list[str]:
+        return [c for c in candidates if c in self._net_rows_by_cable]
 
     def load_net_table(self, cable_des_filter: str = "") -> list[NetRow]:
-        rows = self._rows
-        if cable_des_filter:
-            rows = [r for r in rows if r["cable_des"] == cable_des_filter]
-        return [
-            NetRow(
-                cable_des=r["cable_des"],
-                comp_des_1=r["comp_des_1"],
-                conn_des_1=r["conn_des_1"],
-                pin_1=r["pin_1"],
-                comp_des_2=r["comp_des_2"],
-                conn_des_2=r["conn_des_2"],
-                pin_2=r["pin_2"],
-                net_name=r.get("net_name", ""),
-            )
-            for r in rows
-        ]
+        return list(self.iter_net_rows(cable_des_filter))
+
+    def iter_net_rows(self, cable_des_filter: str = "", *, ordered: bool = False) -> Iterator[NetRow]:
+        """Yield NetRows one at a time instead of building a second full list.
+
+        With ``ordered=True`` rows arrive sorted by (cable_des, comp_des_1, conn_des_1, pin_1).
+        """
+        rows: Iterable[NetRow] = (
+            self._net_rows_by_cable.get(cable_des_filter, ()) if cable_des_filter else self._net_rows
+        )
+        if ordered:
+            rows = sorted(rows, key=lambda r: (r.cable_des, r.comp_des_1, r.conn_des_1, r.pin_1))
+        yield from rows
+
+    def load_net_table_by_cable(self) -> dict[str, Sequence[NetRow]]:
+        return dict(self._net_rows_by_cable)
+
+    def load_designator_table(self) -> Sequence[DesignatorRow]:
+        return self._designator_table
+
+    def load_connector_table(self) -> Sequence[ConnectorRow]:
+        return self._connector_table
+
+    def load_cable_table(self) -> Sequence[CableRow]:
+        return self._cable_table
+
+    # --- Catalog derivation (run once per distinct file content) ---
 
-    def load_designator_table(self) -> list[DesignatorRow]:
+    def _build_designator_table(self, rows: list[dict[str, str]]) -> list[DesignatorRow]:
         seen: set[tuple[str, str, str]] = set()
         result: list[DesignatorRow] = []
 
-        for row in self._rows:
+        for row in rows:
             for suffix in ("1", "2"):
                 comp_des = self._get(row, f"comp_des_{suffix}")
                 conn_des = self._get(row, f"conn_des_{suffix}")
@@ -137,10 +245,10 @@ class CsvDataSource:
 
         return result
 
-    def load_connector_table(self) -> list[ConnectorRow]:
+    def _build_connector_table(self, rows: list[dict[str, str]]) -> list[ConnectorRow]:
         seen: dict[str, ConnectorRow] = {}
 
-        for row in self._rows:
+        for row in rows:
             for suffix in ("1", "2"):
                 mpn = self._get(row, f"conn_mpn_{suffix}")
                 if not mpn or mpn in seen:
@@ -169,10 +277,10 @@ class CsvDataSource:
 
         return list(seen.values())
 
-    def load_cable_table(self) -> list[CableRow]:
+    def _build_cable_table(self, rows: list[dict[str, str]]) -> list[CableRow]:
         seen: dict[str, CableRow] = {}
 
-        for row in self._rows:
+        for row in rows:
             cable_des = row["cable_des"]
             if cable_des in seen:
                 continue
@@ -206,3 +314,98 @@ class CsvDataSource:
             )
 
         return list(seen.values())
+
+
+# --- Sidecar cache ---
+
+# Bump when the sidecar payload layout changes
+_SIDECAR_FORMAT = 2
+
+
+class _ParsedCsv(NamedTuple):
+    """Everything derived from one CSV file: what the sidecar stores."""
+
+    sha256: str
+    columns: tuple[str, ...]
+    net_rows: NetTable
+    designators: tuple[DesignatorRow, ...]
+    connectors: tuple[ConnectorRow, ...]
+    cables: tuple[CableRow, ...]
+
+
+def _row_getter(model: type) -> Callable[[Any], tuple[Any, ...]]:
+    """Return a callable extracting a model instance's fields as a tuple, in field order."""
+    return attrgetter(*(f.name for f in fields(model)))
+
+
+def _sidecar_path(path: Path, cache_dir: str | None) -> Path:
+    """Sidecar location: next to the CSV, or in cache_dir under a path-unique name."""
+    if cache_dir is None:
+        return path.with_name(f"{path.name}.wvcache")
+    path_hash = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:12]
+    return Path(cache_dir) / f"{path.name}.{path_hash}.wvcache"
+
+
+def _sidecar_header(options: tuple[bool, str]) -> tuple[Any, ...]:
+    # marshal's format is only stable within one Python version
+    return (_SIDECAR_FORMAT, tuple(sys.version_info[:2]), options)
+
+
+def _read_sidecar(sidecar: Path, path: Path, options: tuple[bool, str]) -> _ParsedCsv | None:
+    """Load a still-valid sidecar for ``path``, or return None to fall back to parsing.
+
+    A sidecar is valid when its header matches and the CSV's size and mtime are
+    unchanged. If only the mtime moved (file touched or re-saved), the content
+    hash decides, and a matching sidecar is refreshed with the new mtime.
+    """
+    try:
+        payload = marshal.loads(sidecar.read_bytes())
+        if not isinstance(payload, dict) or payload.get("header") != _sidecar_header(options):
+            return None
+        stat = path.stat()
+        if payload["size"] != stat.st_size:
+            return None
+        touched = payload["mtime_ns"] != stat.st_mtime_ns
+        if touched and hashlib.sha256(path.read_bytes()).hexdigest() != payload["sha256"]:
+            return None
+
+        parsed = _ParsedCsv(
+            sha256=payload["sha256"],
+            columns=payload["columns"],
+            net_rows=NetTable.from_columns(payload["net_columns"]),
+            designators=tuple(starmap(DesignatorRow, payload["designators"])),
+            connectors=tuple(starmap(ConnectorRow, payload["connectors"])),
+            cables=tuple(starmap(CableRow, payload["cables"])),
+        )
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        return None
+
+    if touched:
+        _write_sidecar(sidecar, stat, options, parsed)
+    return parsed
+
+
+def _write_sidecar(sidecar: Path, stat: os.stat_result, options: tuple[bool, str], parsed: _ParsedCsv) -> None:
+    """Atomically write the sidecar. Failures are ignored: the cache is best-effort.
+
+    ``stat`` must be taken before the CSV was read for ``parsed``, so a file
+    rewritten in between is never recorded as matching the older rows.
+    """
+    payload = {
+        "header": _sidecar_header(options),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": parsed.sha256,
+        "columns": parsed.columns,
+        "net_columns": parsed.net_rows.columns(),
+        "designators": tuple(map(_row_getter(DesignatorRow), parsed.designators)),
+        "connectors": tuple(map(_row_getter(ConnectorRow), parsed.connectors)),
+        "cables": tuple(map(_row_getter(CableRow), parsed.cables)),
+    }
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(marshal.dumps(payload))
+        os.replace(tmp, sidecar)
+    except OSError:
+        tmp.unlink(missing_ok=True)
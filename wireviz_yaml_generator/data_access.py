@@ -18,17 +18,55 @@ Database Schema:
     - ConnectorTable: Connector catalog (mpn, pincount, description, manufacturer)
     - CableTable: Cable physical properties (cable_des, wire_gauge, length, note)
 
+    Each loader selects only the columns its *Row model declares (in field
+    order) and builds the model positionally from plain tuples. Extra columns
+    are ignored; absent optional columns take the model's default.
+
+Connection Lifecycle:
+    Each thread gets one read-only connection, opened on first use and kept
+    for the lifetime of the data source. Call close() (or use the source as a
+    context manager) to release them.
+
+Catalog Caching:
+    DesignatorTable, ConnectorTable and CableTable are served from the shared
+    catalog_cache. Snapshots are reused until the database file (or its WAL)
+    changes on disk, or PRAGMA data_version reports a commit from another
+    connection. If the file is replaced (a new inode at the same path), the
+    pooled connection still reads the old file, so it is reopened before
+    the catalog is read.
+
 Example:
-    >>> source = SqliteDataSource("data/master.db")
-    >>> nets = source.load_net_table("W001")  # Get all connections for cable W001
-    >>> connectors = source.load_connector_table()  # Get full connector catalog
+    >>> with SqliteDataSource("data/master.db") as source:
+    ...     nets = source.load_net_table("W001")  # Get all connections for cable W001
+    ...     connectors = source.load_connector_table()  # Get full connector catalog
 """
 
 import sqlite3
-from typing import Any
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import MISSING, fields
+from pathlib import Path
+from typing import Any, Self, TypeVar
 
+from .catalog_cache import catalog_cache
 from .exceptions import DatabaseError
-from .models import CableRow, ConnectorRow, DesignatorRow, NetRow
+from .models import CableRow, ConnectorRow, DesignatorRow, NetRow, NetTable
+
+T = TypeVar("T")
+
+
+def _file_signature(path: Path) -> tuple[int, int, int, int] | None:
+    """Returns (st_dev, st_ino, mtime_ns, size) of ``path``, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _file_identity(signature: tuple[int, int, int, int] | None) -> tuple[int, int] | None:
+    """The (st_dev, st_ino) part of a ``_file_signature``: which file is at the path."""
+    return signature[:2] if signature is not None else None
 
 
 class SqliteDataSource:
@@ -38,39 +76,182 @@ class SqliteDataSource:
     Provides methods to load data from the electrical design database.
     All methods return domain objects (dataclasses) rather than raw SQL results.
 
+    Connections are opened read-only, one per thread, and reused across calls
+    so that a build issuing hundreds of queries only pays connection setup and
+    schema parsing once per thread.
+
     Attributes:
         db_filepath: Path to the SQLite database file.
 
     Example:
-        >>> db = SqliteDataSource("data/master.db")
-        >>> if db.check_cable_existence("W001"):
-        ...     connections = db.load_net_table("W001")
+        >>> with SqliteDataSource("data/master.db") as db:
+        ...     if db.check_cable_existence("W001"):
+        ...         connections = db.load_net_table("W001")
     """
 
     def __init__(self, db_filepath: str):
         self.db_filepath = db_filepath
+        self._local = threading.local()
+        self._pool: list[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._cache_key = ("sqlite", str(Path(db_filepath).resolve()))
+        self._projections: dict[str, tuple[str, tuple[Any, ...]]] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes every pooled connection. The source reconnects on next use."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+            self._local = threading.local()
+        for conn in pool:
+            conn.close()
 
-    def _fetch_dict_rows(self, query: str) -> list[dict[str, Any]]:
+    def _connection(self) -> sqlite3.Connection:
         """
-        Internal: Executes a raw SQL query and returns results as dictionaries.
+        Internal: Returns this thread's read-only connection, opening it on first use.
+
+        Raises:
+            sqlite3.OperationalError: If the database file cannot be opened.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Taken before connecting: if the file is replaced in between, the
+            # recorded identity is stale and the next catalog read reconnects
+            identity = _file_identity(_file_signature(Path(self.db_filepath)))
+            uri = f"{Path(self.db_filepath).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, detect_types=0, check_same_thread=False)
+            with self._pool_lock:
+                self._pool.append(conn)
+                self._local.conn = conn
+                self._local.identity = identity
+        return conn
+
+    def _reconnect_if_replaced(self, signature: tuple[int, int, int, int] | None) -> None:
+        """
+        Internal: Drops this thread's connection if the file at the path is no longer the one it opened.
+
+        The old connection stays in the pool until close(), since a stream on
+        this thread may still be reading from it.
+        """
+        if getattr(self._local, "conn", None) is None:
+            return
+        if _file_identity(signature) != self._local.identity:
+            self._local.conn = None
+            self._local.__dict__.pop("data_version", None)
+            self._projections.clear()  # the new file may have a different schema
+
+    def _projection(self, model: type, table_name: str) -> tuple[str, tuple[Any, ...]]:
+        """
+        Internal: Builds the SELECT list mapping ``table_name`` onto ``model``'s fields.
+
+        Columns are listed in dataclass field order, so each result tuple can be
+        passed to the model positionally. Extra table columns are never read.
+        Optional fields whose column is absent are filled with their default
+        via a bound parameter.
+
+        Returns:
+            (select list, parameters bound to the select list)
+
+        Raises:
+            DatabaseError: If the table or a required column is missing.
+        """
+        cached = self._projections.get(table_name)
+        if cached is not None:
+            return cached
+
+        try:
+            present = {info[1] for info in self._connection().execute(f"PRAGMA table_info({table_name})")}
+        except sqlite3.OperationalError as e:
+            raise DatabaseError(f"Database operation failed in '{self.db_filepath}': {e}") from e
+        if not present:
+            raise DatabaseError(f"Database operation failed in '{self.db_filepath}': no such table: {table_name}")
+
+        columns: list[str] = []
+        defaults: list[Any] = []
+        for field in fields(model):
+            if field.name in present:
+                columns.append(field.name)
+            elif field.default is not MISSING:
+                columns.append("?")
+                defaults.append(field.default)
+            else:
+                raise DatabaseError(
+                    f"Table '{table_name}' in '{self.db_filepath}' is missing required column '{field.name}'"
+                )
+
+        projection = (", ".join(columns), tuple(defaults))
+        self._projections[table_name] = projection
+        return projection
+
+    def _select(
+        self,
+        model: type[T],
+        table_name: str,
+        where_clause: str = "",
+        params: tuple[Any, ...] = (),
+        order_by: str = "",
+        batch_size: int = 1000,
+    ) -> Iterator[T]:
+        """
+        Internal: Streams ``table_name`` rows as ``model`` instances.
 
         Raises:
             DatabaseError: If database connection fails or query errors.
         """
+        select_list, defaults = self._projection(model, table_name)
+        query = self._build_query(table_name, select_list, where_clause)
+        if order_by:
+            query += f" ORDER BY {order_by}"
+
         try:
-            conn = sqlite3.connect(self.db_filepath, detect_types=0)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            conn.close()
-            return [dict(row) for row in rows]
+            cursor = self._connection().execute(query, defaults + params)
+            while batch := cursor.fetchmany(batch_size):
+                for row in batch:
+                    yield model(*row)
+        except sqlite3.OperationalError as e:
+            raise DatabaseError(f"Database operation failed in '{self.db_filepath}': {e}") from e
+
+    def _catalog_version(self) -> tuple[Any, ...]:
+        """
+        Internal: Returns a token that changes whenever the database content changes.
+
+        The token is the (device, inode, mtime, size) of the database file
+        and its WAL. If the file was replaced since this thread connected, the
+        connection is reopened first, so a snapshot is never read from one
+        file and stored under another's token. In addition, a change of PRAGMA
+        data_version on this thread's connection (a commit by another
+        connection) drops the cached snapshots outright, since such commits
+        need not touch the main file's mtime.
+
+        Raises:
+            DatabaseError: If the database cannot be opened.
+        """
+        signature = _file_signature(Path(self.db_filepath))
+        self._reconnect_if_replaced(signature)
+        try:
+            data_version = self._connection().execute("PRAGMA data_version").fetchone()[0]
         except sqlite3.OperationalError as e:
             raise DatabaseError(f"Database operation failed in '{self.db_filepath}': {e}") from e
 
-    def _build_query(self, table_name: str, where_clause: str = "") -> str:
-        """Helper to construct simple SELECT * queries."""
-        query = f"SELECT * FROM {table_name}"
+        last_seen = getattr(self._local, "data_version", data_version)
+        self._local.data_version = data_version
+        if last_seen != data_version:
+            catalog_cache.invalidate(self._cache_key)
+
+        return (signature, _file_signature(Path(f"{self.db_filepath}-wal")))
+
+    def _load_catalog(self, table_name: str, reader: Callable[[], list[T]]) -> tuple[T, ...]:
+        """Internal: Serves a catalog table as a shared immutable snapshot."""
+        return catalog_cache.get(self._cache_key, self._catalog_version(), table_name, reader)
+
+    def _build_query(self, table_name: str, select_list: str = "*", where_clause: str = "") -> str:
+        """Helper to construct simple SELECT queries."""
+        query = f"SELECT {select_list} FROM {table_name}"
         if where_clause:
             query += f" WHERE {where_clause}"
         return query
@@ -88,17 +269,44 @@ class SqliteDataSource:
         Returns:
             True if the cable has at least one connection in NetTable.
         """
-        query = f"SELECT 1 FROM NetTable WHERE cable_des = '{cable_des}' LIMIT 1"
+        query = "SELECT 1 FROM NetTable WHERE cable_des = ? LIMIT 1"
         try:
-            conn = sqlite3.connect(self.db_filepath)
-            cursor = conn.cursor()
-            cursor.execute(query)
-            result = cursor.fetchone()
-            conn.close()
+            result = self._connection().execute(query, (cable_des,)).fetchone()
             return bool(result)
         except sqlite3.OperationalError:
             return False
 
+    def list_cables(self) -> list[str]:
+        """
+        Lists every cable designator that has at least one connection.
+
+        Returns:
+            Distinct NetTable cable designators, sorted.
+
+        Raises:
+            DatabaseError: If NetTable cannot be queried.
+        """
+        query = "SELECT DISTINCT cable_des FROM NetTable ORDER BY cable_des"
+        try:
+            return [row[0] for row in self._connection().execute(query)]
+        except sqlite3.OperationalError as e:
+            raise DatabaseError(f"Database operation failed in '{self.db_filepath}': {e}") from e
+
+    def existing_cables(self, candidates: Iterable[str]) -> list[str]:
+        """
+        Filters candidate designators down to cables present in NetTable.
+
+        One query replaces a check_cable_existence() round trip per candidate.
+
+        Args:
+            candidates: Cable designators to check (e.g., ["W001", "W002"]).
+
+        Returns:
+            The candidates that exist, in their original order.
+        """
+        available = set(self.list_cables())
+        return [c for c in candidates if c in available]
+
     # --- Domain Loaders ---
 
     def load_net_table(self, cable_des_filter: str = "") -> list[NetRow]:
@@ -120,24 +328,55 @@ class SqliteDataSource:
             >>> for net in nets:
             ...     print(f"{net.net_name}: {net.conn_des_1}:{net.pin_1} -> {net.conn_des_2}:{net.pin_2}")
         """
-        where = f"cable_des = '{cable_des_filter}'" if cable_des_filter else ""
-        rows = self._fetch_dict_rows(self._build_query("NetTable", where))
-
-        return [
-            NetRow(
-                cable_des=row["cable_des"],
-                comp_des_1=row["comp_des_1"],
-                conn_des_1=row["conn_des_1"],
-                pin_1=row["pin_1"],
-                comp_des_2=row["comp_des_2"],
-                conn_des_2=row["conn_des_2"],
-                pin_2=row["pin_2"],
-                net_name=row["net_name"],
-            )
-            for row in rows
-        ]
-
-    def load_designator_table(self) -> list[DesignatorRow]:
+        return list(self.iter_net_rows(cable_des_filter))
+
+    def iter_net_rows(
+        self, cable_des_filter: str = "", *, ordered: bool = False, batch_size: int = 1000
+    ) -> Iterator[NetRow]:
+        """
+        Streams NetTable rows without materializing the whole table.
+
+        Rows are fetched in batches of ``batch_size``, so memory stays bounded
+        regardless of table size. Use this for single-pass consumers such as
+        transformations.iter_wire_labels() or generate_bom_data().
+
+        Args:
+            cable_des_filter: Optional cable designator to filter results.
+            ordered: If True, rows arrive sorted by (cable_des, comp_des_1,
+                     conn_des_1, pin_1) - the order the transformations use -
+                     with ties kept in table order.
+            batch_size: Number of rows fetched from SQLite per round trip.
+
+        Yields:
+            NetRow domain objects.
+
+        Raises:
+            DatabaseError: If the query fails.
+        """
+        yield from self._select(
+            NetRow,
+            "NetTable",
+            "cable_des = ?" if cable_des_filter else "",
+            (cable_des_filter,) if cable_des_filter else (),
+            order_by="cable_des, comp_des_1, conn_des_1, pin_1, rowid" if ordered else "",
+            batch_size=batch_size,
+        )
+
+    def load_net_table_by_cable(self) -> dict[str, Sequence[NetRow]]:
+        """
+        Loads the whole NetTable in one query, partitioned by cable designator.
+
+        Intended for whole-project builds: one table scan serves every cable,
+        instead of one filtered query per cable. Row order within each cable
+        matches load_net_table(cable_des). Partitions are columnar NetTables,
+        so holding the whole project in memory stays compact.
+
+        Returns:
+            Mapping of cable_des to that cable's rows.
+        """
+        return NetTable(self.iter_net_rows()).partition()
+
+    def load_designator_table(self) -> Sequence[DesignatorRow]:
         """
         Loads the component-to-connector mapping table.
 
@@ -145,14 +384,15 @@ class SqliteDataSource:
         Essential for enriching connectors with catalog metadata.
 
         Returns:
-            List of DesignatorRow objects with comp_des, conn_des, conn_mpn.
+            Immutable sequence of DesignatorRow objects with comp_des, conn_des, conn_mpn.
         """
-        rows = self._fetch_dict_rows(self._build_query("DesignatorTable"))
-        return [
-            DesignatorRow(comp_des=row["comp_des"], conn_des=row["conn_des"], conn_mpn=row["conn_mpn"]) for row in rows
-        ]
+        return self._load_catalog("DesignatorTable", self._read_designator_table)
+
+    def _read_designator_table(self) -> list[DesignatorRow]:
+        """Internal: Reads and parses DesignatorTable, bypassing the cache."""
+        return list(self._select(DesignatorRow, "DesignatorTable"))
 
-    def load_connector_table(self) -> list[ConnectorRow]:
+    def load_connector_table(self) -> Sequence[ConnectorRow]:
         """
         Loads the connector catalog with part numbers and specifications.
 
@@ -160,22 +400,15 @@ class SqliteDataSource:
         and other metadata for all connectors used in the design.
 
         Returns:
-            List of ConnectorRow objects with mpn, pincount, description, etc.
-        """
-        rows = self._fetch_dict_rows(self._build_query("ConnectorTable"))
-        return [
-            ConnectorRow(
-                mpn=row["mpn"],
-                pincount=row["pincount"],
-                mate_mpn=row["mate_mpn"],
-                pin_mpn=row["pin_mpn"],
-                description=row.get("description", ""),
-                manufacturer=row.get("manufacturer", ""),
-            )
-            for row in rows
-        ]
-
-    def load_cable_table(self) -> list[CableRow]:
+            Immutable sequence of ConnectorRow objects with mpn, pincount, description, etc.
+        """
+        return self._load_catalog("ConnectorTable", self._read_connector_table)
+
+    def _read_connector_table(self) -> list[ConnectorRow]:
+        """Internal: Reads and parses ConnectorTable, bypassing the cache."""
+        return list(self._select(ConnectorRow, "ConnectorTable"))
+
+    def load_cable_table(self) -> Sequence[CableRow]:
         """
         Loads cable physical properties (gauge, length, notes).
 
@@ -183,15 +416,11 @@ class SqliteDataSource:
         length, and construction notes.
 
         Returns:
-            List of CableRow objects with cable_des, wire_gauge, length, note.
-        """
-        rows = self._fetch_dict_rows(self._build_query("CableTable"))
-        return [
-            CableRow(
-                cable_des=row["cable_des"],
-                wire_gauge=row["wire_gauge"],
-                length=row["length"],
-                note=row["note"],
-            )
-            for row in rows
-        ]
+            Immutable sequence of CableRow objects with cable_des, wire_gauge, length, note
+            (plus category and colors when the table has those columns).
+        """
+        return self._load_catalog("CableTable", self._read_cable_table)
+
+    def _read_cable_table(self) -> list[CableRow]:
+        """Internal: Reads and parses CableTable, bypassing the cache."""
+        return list(self._select(CableRow, "CableTable"))
@@ -0,0 +1,90 @@
+"""
+Build Diagnostics.
+
+Collects warnings raised while a build runs, instead of printing them from
+inside the transformation loops. A warning is identified by a short code and
+the thing it is about (its subject); repeats of the same (code, subject) -
+e.g. one missing MPN seen again in every cable that uses the connector - are
+counted rather than repeated. A warning can also name what it affects
+(``detail``, e.g. each connector using a missing MPN); distinct details are
+collected on the one entry. The collector is reported once at the end of a
+build, as text or JSON.
+
+Example:
+    >>> diagnostics = Diagnostics()
+    >>> diagnostics.warn("missing-mpn", "ABC", "MPN 'ABC' not found ...", detail="J1-X1")
+    >>> diagnostics.report()
+    >>> diagnostics.to_json()
+"""
+
+import json
+import sys
+import threading
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from typing import TextIO
+
+# Diagnostic codes
+MISSING_MPN = "missing-mpn"
+
+
+@dataclass(frozen=True, slots=True)
+class Diagnostic:
+    """One distinct warning and how often it was raised."""
+
+    code: str
+    subject: str
+    message: str
+    count: int
+    details: tuple[str, ...] = ()  # distinct details, in first-seen order
+
+
+class Diagnostics:
+    """
+    Thread-safe, deduplicating collector of build warnings.
+
+    The first message recorded for a (code, subject) pair is kept; later
+    occurrences only increase its count and add their detail, if new.
+    Entries keep first-seen order.
+    """
+
+    def __init__(self) -> None:
+        # (code, subject) -> [message, count, {detail: None}]
+        self._entries: dict[tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def warn(self, code: str, subject: str, message: str, detail: str | None = None) -> None:
+        """Record one occurrence of a warning, optionally naming what it affects."""
+        with self._lock:
+            entry = self._entries.get((code, subject))
+            if entry is None:
+                entry = self._entries[(code, subject)] = [message, 0, {}]
+            entry[1] += 1
+            if detail is not None:
+                entry[2][detail] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Diagnostic]:
+        with self._lock:
+            items = [(key, message, count, tuple(details)) for key, (message, count, details) in self._entries.items()]
+        for (code, subject), message, count, details in items:
+            yield Diagnostic(code=code, subject=subject, message=message, count=count, details=details)
+
+    def clear(self) -> None:
+        """Forget all recorded warnings."""
+        with self._lock:
+            self._entries.clear()
+
+    def report(self, stream: TextIO | None = None) -> None:
+        """Print each distinct warning once, with what it affects and its repeat count."""
+        out = stream if stream is not None else sys.stdout
+        for diagnostic in self:
+            affected = f" Affected: {', '.join(diagnostic.details)}." if diagnostic.details else ""
+            repeats = f" ({diagnostic.count}x)" if diagnostic.count > 1 else ""
+            print(f"⚠️  Warning: {diagnostic.message}{affected}{repeats}", file=out)
+
+    def to_json(self) -> str:
+        """Serialize the warnings as a JSON list of {code, subject, message, count, details}."""
+        return json.dumps([asdict(diagnostic) for diagnostic in self], indent=2)
@@ -1,9 +1,11 @@
 """
 Excel Output Adapter.
 
-This module handles writing structured data to Excel (.xlsx) files using pandas.
-It serves as an adapter layer isolating the core business logic from the pandas
-library and file I/O operations, following the Dependency Inversion Principle.
+This module handles writing structured data to Excel (.xlsx) files, and to
+CSV/TSV files for machine consumers.
+It serves as an adapter layer isolating the core business logic from the
+spreadsheet libraries and file I/O operations, following the Dependency
+Inversion Principle.
 
 Design Philosophy:
     - Separation of Concerns: Core logic doesn't know about Excel or pandas
@@ -11,7 +13,7 @@ Design Philosophy:
     - Error Handling: Gracefully handles empty data and missing files
 
 Data Format:
-    Functions expect data as: List[Dict[str, Any]]
+    Functions expect data as: Iterable[Dict[str, Any]]
     Example:
         [
             {"MPN": "123-456", "Description": "Connector", "Quantity": 5},
@@ -19,30 +21,74 @@ Data Format:
         ]
     Each dict represents a row, keys become column headers.
 
+Engines:
+    - "openpyxl": streams rows into a write-only workbook, one row at a time.
+      Rows may come from a generator; memory stays constant in the row count.
+    - "pandas": builds a DataFrame and calls ``to_excel``. Kept as a fallback.
+    - "auto" (default): openpyxl when installed, otherwise pandas.
+    Both engines write the same cells: a header row, then one row per dict.
+
+Attachment formats (``write_attachments``):
+    - "xlsx" (default): one workbook per attachment (BOM.xlsx, ...).
+    - "workbook": a single Attachments.xlsx with one sheet per attachment.
+    - "csv" / "tsv": one delimited text file per attachment (BOM.csv, ...).
+
 Example:
     >>> bom_data = [{"MPN": "X123", "Qty": 10}]
     >>> write_xlsx(bom_data, "BOM", "output/")
 """
 
 import csv
+import math
 import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from importlib.util import find_spec
+from itertools import chain
 from typing import Any
 
-import pandas as pd
+from .exceptions import ConfigurationError
+
+XLSX_ENGINES = ("auto", "openpyxl", "pandas")
+ATTACHMENT_FORMATS = ("xlsx", "workbook", "csv", "tsv")
+
+# Sheet name pandas gives a single-sheet workbook
+SHEET_NAME = "Sheet1"
+# File name of the single workbook written by attachment_format="workbook"
+ATTACHMENTS_WORKBOOK = "Attachments"
 
+_DELIMITERS = {"csv": ",", "tsv": "\t"}
 
-def write_xlsx(data: list[dict[str, Any]], filename: str, output_path: str) -> None:
+# A sheet ready to write: (sheet name, columns, row values)
+_Table = tuple[str, list[str], Iterator[list[Any]]]
+
+
+def write_xlsx(
+    data: Iterable[dict[str, Any]],
+    filename: str,
+    output_path: str,
+    columns: Sequence[str] | None = None,
+    engine: str = "auto",
+) -> None:
     """
-    Writes a list of dictionaries to an Excel file.
+    Writes rows of dictionaries to an Excel file.
 
     Each dictionary represents a row, and dictionary keys become column headers.
-    If the data list is empty, prints a warning and skips file creation.
+    If there are no rows, prints a warning and skips file creation.
 
     Args:
-        data: List of dictionaries where each dict is a row of data.
-              Keys are column names, values are cell values.
+        data: Rows as dictionaries (a list, or a generator to stream them).
+              Keys are column names, values are cell values; missing keys
+              and NaN values are written as empty cells.
         filename: Base name for the output file (without .xlsx extension).
         output_path: Directory path where the file will be written.
+        columns: Column headers, in order. Defaults to every key of a list's
+                 rows in order of first appearance (as pandas does), or the
+                 first row's keys when ``data`` is a generator.
+        engine: "openpyxl" (streaming), "pandas" or "auto".
+
+    Raises:
+        ConfigurationError: If ``engine`` is unknown.
+        ValueError: If a row has a key that is not one of the columns.
 
     Example:
         >>> data = [
@@ -51,13 +97,193 @@ def write_xlsx(data: list[dict[str, Any]], filename: str, output_path: str) -> N
         ... ]
         >>> write_xlsx(data, "BOM", "attachments/")
     """
-    if not data:
+    engine = _resolve_engine(engine)
+    table = _table(SHEET_NAME, data, filename, columns)
+    if table is not None:
+        _write_workbook([table], os.path.join(output_path, f"{filename}.xlsx"), engine)
+
+
+def write_workbook(
+    sheets: Mapping[str, Iterable[dict[str, Any]]],
+    filename: str,
+    output_path: str,
+    engine: str = "auto",
+) -> None:
+    """
+    Writes several tables to one Excel file, one sheet per table.
+
+    Sheets are written in mapping order, each streamed like ``write_xlsx``
+    (with the same default columns). Empty tables are skipped with a
+    warning; if all are empty, no file is created.
+
+    Args:
+        sheets: Sheet name -> rows as dictionaries.
+        filename: Base name for the output file (without .xlsx extension).
+        output_path: Directory path where the file will be written.
+        engine: "openpyxl" (streaming), "pandas" or "auto".
+
+    Raises:
+        ConfigurationError: If ``engine`` is unknown.
+        ValueError: If a row has a key that is not one of its sheet's columns.
+
+    Example:
+        >>> write_workbook({"BOM": bom_data, "WireLabels": wire_labels}, "Attachments", "attachments/")
+    """
+    engine = _resolve_engine(engine)
+    tables = [table for name, data in sheets.items() if (table := _table(name, data, name)) is not None]
+    if not tables:
         print(f"⚠️ Warning: No data to write for {filename}")
         return
+    _write_workbook(tables, os.path.join(output_path, f"{filename}.xlsx"), engine)
+
+
+def write_csv(
+    data: Iterable[dict[str, Any]],
+    filename: str,
+    output_path: str,
+    columns: Sequence[str] | None = None,
+    delimiter: str = ",",
+) -> None:
+    """
+    Writes rows of dictionaries to a UTF-8 CSV file (TSV with ``delimiter="\\t"``).
+
+    Rows are streamed with the same header and column rules as ``write_xlsx``;
+    missing keys, None and NaN are written as empty fields. The file is named
+    ``<filename>.tsv`` for tab-delimited output, ``<filename>.csv`` otherwise.
+
+    Args:
+        data: Rows as dictionaries (a list, or a generator to stream them).
+        filename: Base name for the output file (without extension).
+        output_path: Directory path where the file will be written.
+        columns: Column headers, in order (see ``write_xlsx``).
+        delimiter: Field separator.
+
+    Raises:
+        ValueError: If a row has a key that is not one of the columns.
+
+    Example:
+        >>> write_csv(wire_labels, "WireLabels", "attachments/", delimiter="\\t")
+    """
+    table = _table(filename, data, filename, columns)
+    if table is None:
+        return
+    _, header, values = table
+    extension = "tsv" if delimiter == "\t" else "csv"
+    output_file = os.path.join(output_path, f"{filename}.{extension}")
+    with open(output_file, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        writer.writerow(header)
+        writer.writerows(values)
+
+
+def write_attachments(
+    attachments: Mapping[str, Iterable[dict[str, Any]]],
+    output_path: str,
+    attachment_format: str = "xlsx",
+    engine: str = "auto",
+) -> None:
+    """
+    Writes manufacturing attachments (name -> rows) in the chosen format.
+
+    Args:
+        attachments: Attachment name (e.g. "BOM") -> rows as dictionaries.
+        output_path: Directory path where the files will be written.
+        attachment_format: "xlsx" (a workbook per attachment), "workbook"
+                           (one Attachments.xlsx, a sheet per attachment),
+                           "csv" or "tsv" (a text file per attachment).
+        engine: XLSX engine for the "xlsx" and "workbook" formats.
+
+    Raises:
+        ConfigurationError: If ``attachment_format`` or ``engine`` is unknown.
+    """
+    check_attachment_format(attachment_format)
+    if attachment_format == "workbook":
+        write_workbook(attachments, ATTACHMENTS_WORKBOOK, output_path, engine=engine)
+        return
+    for name, data in attachments.items():
+        if attachment_format == "xlsx":
+            write_xlsx(data, name, output_path, engine=engine)
+        else:
+            write_csv(data, name, output_path, delimiter=_DELIMITERS[attachment_format])
+
+
+def check_attachment_format(attachment_format: str) -> None:
+    """Raises ConfigurationError unless ``attachment_format`` is one of ATTACHMENT_FORMATS."""
+    if attachment_format not in ATTACHMENT_FORMATS:
+        raise ConfigurationError(
+            f"Unknown attachment format '{attachment_format}'. Use one of: {', '.join(ATTACHMENT_FORMATS)}."
+        )
+
+
+def _resolve_engine(engine: str) -> str:
+    if engine not in XLSX_ENGINES:
+        raise ConfigurationError(f"Unknown xlsx engine '{engine}'. Use one of: {', '.join(XLSX_ENGINES)}.")
+    if engine == "auto":
+        return "openpyxl" if find_spec("openpyxl") is not None else "pandas"
+    return engine
+
+
+def _table(
+    sheet_name: str, data: Iterable[dict[str, Any]], label: str, columns: Sequence[str] | None = None
+) -> _Table | None:
+    """Header and lazily produced row values of ``data``; None (with a warning) when it is empty."""
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
+        print(f"⚠️ Warning: No data to write for {label}")
+        return None
+
+    if columns is None:
+        # A list is scanned for every key, as pandas does; a generator is not re-read
+        columns = list(dict.fromkeys(key for row in data for key in row)) if isinstance(data, Sequence) else list(first)
+    return sheet_name, list(columns), _row_values(chain([first], rows), columns)
+
+
+def _row_values(rows: Iterable[dict[str, Any]], columns: Sequence[str]) -> Iterator[list[Any]]:
+    """Cell values of each row, in column order."""
+    known = set(columns)
+    for row in rows:
+        if not row.keys() <= known:
+            unknown = ", ".join(repr(key) for key in row if key not in known)
+            raise ValueError(f"Row has keys that are not columns: {unknown}")
+        yield [None if isinstance(value, float) and math.isnan(value) else value for value in map(row.get, columns)]
+
+
+def _write_workbook(tables: Iterable[_Table], output_file: str, engine: str) -> None:
+    if engine == "openpyxl":
+        _write_with_openpyxl(tables, output_file)
+    else:
+        _write_with_pandas(tables, output_file)
+
+
+def _write_with_openpyxl(tables: Iterable[_Table], output_file: str) -> None:
+    # openpyxl is only imported when a file is written
+    from openpyxl import Workbook
+
+    # Write-only mode streams each row to the file instead of keeping a cell grid
+    workbook = Workbook(write_only=True)
+    try:
+        for sheet_name, columns, values in tables:
+            sheet = workbook.create_sheet(sheet_name)
+            sheet.append(columns)
+            for row in values:
+                sheet.append(row)
+    except BaseException:
+        for sheet in workbook.worksheets:
+            sheet.close()  # releases the sheet's temporary file; nothing is saved
+        raise
+    workbook.save(output_file)
+
+
+def _write_with_pandas(tables: Iterable[_Table], output_file: str) -> None:
+    # pandas (and openpyxl, which it uses for .xlsx) is only imported when a file is written
+    import pandas as pd
 
-    output_file = os.path.join(output_path, f"{filename}.xlsx")
-    df = pd.DataFrame(data)
-    df.to_excel(output_file, index=False)
+    # Frames are built before the file is opened, so a bad row leaves no partial workbook
+    frames = [(sheet_name, pd.DataFrame(list(values), columns=columns)) for sheet_name, columns, values in tables]
+    with pd.ExcelWriter(output_file) as writer:
+        for sheet_name, df in frames:
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
 
 
 def add_misc_bom_items(bom_data: list[dict[str, Any]], filename: str, output_path: str) -> list[dict[str, Any]]:
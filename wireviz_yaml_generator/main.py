@@ -6,11 +6,11 @@ This script orchestrates the complete workflow from database to wiring diagrams:
 2. Connects to SQLite database
 3. Generates manufacturing attachments (BOM, Labels)
 4. Creates WireViz YAML files
-5. Invokes WireViz CLI to generate diagram images
+5. Renders diagram images in parallel with the WireViz CLI
 
 Architecture:
     - Pure Core: Business logic is in transformations.py (pure functions)
-    - Imperative Shell: This module handles I/O, subprocess calls, errors
+    - Imperative Shell: This module handles I/O, rendering, errors
     - Dependency Injection: WorkflowManager receives DataSource via constructor
 
 Error Handling:
@@ -22,11 +22,11 @@ Example:
     $ python src/main.py
 """
 
-import shutil
-import subprocess
 import sys
+from functools import partial
 from pathlib import Path
 
+from .build_engine import build_drawings
 from .data_access import SqliteDataSource
 from .exceptions import WireVizError
 from .ReadConfig import ConfigLoader
@@ -62,7 +62,8 @@ def main() -> None:
     2. Initializes database connection and workflow manager
     3. Scans for available connector images
     4. Generates manufacturing attachments (BOM and Labels)
-    5. For each cable, generates YAML and invokes WireViz CLI
+    5. Builds the drawings with the shared build engine (build_engine.py):
+       YAML per cable, rendered in parallel while attachments are generated
 
     Configuration:
         Edit constants in this function to control:
@@ -71,6 +72,9 @@ def main() -> None:
         - CREATE_DRAWINGS: Generate diagram images
         - FROM_CABLE_NR, TO_CABLE_NR: Range of cables to process
         - DONT_INCLUDE_FILTER: Specific cables to skip
+        The number of parallel renders is read from ``max_workers`` in
+        config.toml (default: one per CPU), the attachment format from
+        ``attachment_format`` (default: "xlsx").
 
     Workflow:
         Attachments are generated once for all cables (BOM aggregates).
@@ -95,57 +99,50 @@ def main() -> None:
         db_source = SqliteDataSource(str(config.db_path))
         workflow = WorkflowManager(db_source)
 
-        # 3. Prepare Environment
-        # Scan images once (IO) -> Pass to logic (Pure)
-        # Assuming resources are in parent of output path (legacy logic)
-        resource_path = config.output_path.parent / "resources"
-        available_images = get_available_images(resource_path)
-
-        # 4. Build Filters
-        cable_filters = [f"W{i:03d}" for i in range(FROM_CABLE_NR, TO_CABLE_NR + 1) if i not in DONT_INCLUDE_FILTER]
-
-        if not cable_filters:
-            print("ℹ️  The 'cable_filters' list is empty. No diagrams will be generated.")
-            return
-
-        # 5. Execute Workflows
-
-        # A. Attachments (BOM / Labels)
-        workflow.run_attachment_workflow(
-            cable_filters, str(config.attachments_path), create_bom=CREATE_BOM, create_labels=CREATE_LABELS
-        )
-
-        # B. Drawings (YAML + WireViz CLI)
-        if CREATE_DRAWINGS:
-            wireviz_executable = shutil.which("wireviz")
-            if not wireviz_executable:
-                # Log warning if the external tool is missing
-                print("❌ 'wireviz' not found. Skipping diagram generation.")
+        with db_source:
+            # 3. Prepare Environment
+            # Scan images once (IO) -> Pass to logic (Pure)
+            # Assuming resources are in parent of output path (legacy logic)
+            resource_path = config.output_path.parent / "resources"
+            available_images = get_available_images(resource_path)
+
+            # 4. Build Filters
+            cable_filters = [f"W{i:03d}" for i in range(FROM_CABLE_NR, TO_CABLE_NR + 1) if i not in DONT_INCLUDE_FILTER]
+
+            if not cable_filters:
+                print("ℹ️  The 'cable_filters' list is empty. No diagrams will be generated.")
+                return
+
+            # 5. Execute Workflows
+            # Attachments (BOM / Labels) run on their own worker while the
+            # drawings are built: YAML per cable, rendered in parallel as
+            # soon as each file is written.
+            attachments = partial(
+                workflow.run_attachment_workflow,
+                cable_filters,
+                str(config.attachments_path),
+                create_bom=CREATE_BOM,
+                create_labels=CREATE_LABELS,
+                attachment_format=config.attachment_format,
+            )
+
+            if CREATE_DRAWINGS:
+                summary = build_drawings(
+                    workflow,
+                    db_source,
+                    cable_filters,
+                    yaml_dir=str(config.output_path),
+                    drawings_dir=str(config.drawings_path),
+                    available_images=available_images,
+                    max_workers=config.max_workers,
+                    attachments=attachments,
+                )
+                summary.report(verbose=True)
             else:
-                for cable_filter in cable_filters:
-                    # Check existence
-                    if not db_source.check_cable_existence(cable_filter):
-                        print(f"   ⚠️ Skipping {cable_filter}. No data found.")
-                        continue
-
-                    yaml_filepath = config.output_path / f"{cable_filter}.yaml"
-
-                    workflow.run_yaml_workflow(cable_filter, str(yaml_filepath), available_images)
-
-                    # External CLI Call
-                    command = [
-                        wireviz_executable,
-                        str(yaml_filepath),
-                        "--format",
-                        "s",
-                        "--output-dir",
-                        str(config.drawings_path),
-                    ]
-                    try:
-                        subprocess.run(command, check=True, capture_output=True, text=True)
-                        print(f"   ✅ Diagram generated for {cable_filter}")
-                    except subprocess.CalledProcessError as e:
-                        print(f"   ❌ WireViz Error for {cable_filter}: {e.stderr}")
+                attachments()
+
+        # Warnings collected during the run, each reported once
+        workflow.diagnostics.report()
 
     except WireVizError as e:
         print(f"❌ Application Error: {e}")
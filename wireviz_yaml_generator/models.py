@@ -8,13 +8,20 @@ the Transformation Layer, and the Output Layer.
 Design Philosophy:
 - Data-Oriented: These classes are pure data carriers.
 - Immutability: All classes are frozen dataclasses to prevent accidental mutation.
+- Compactness: Dataclasses use __slots__ (no per-instance __dict__), and large
+  net tables can be held column-wise in a NetTable.
 - Type Safety: All fields are typed, ensuring robustness.
 """
 
-from dataclasses import dataclass
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, fields
+from itertools import chain
+from typing import Any, Self, overload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Connector:
     """
     Represents a physical connector in the design.
@@ -49,7 +56,7 @@ class Connector:
     loops: list[list[int | str]] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Wire:
     """
     Represents the physical properties of a single wire strand.
@@ -62,7 +69,7 @@ class Wire:
     manufacturer: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Cable:
     """
     Represents a cable bundle containing multiple wires.
@@ -91,7 +98,7 @@ class Cable:
     notes: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Connection:
     """
     Represents a point-to-point electrical connection.
@@ -115,7 +122,7 @@ class Connection:
     net_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BomItem:
     """
     Represents a Bill of Materials line item.
@@ -132,7 +139,7 @@ class BomItem:
 # These mirror the exact schema of the SQLite tables.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NetRow:
     """Raw row from NetTable."""
 
@@ -146,7 +153,7 @@ class NetRow:
     net_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DesignatorRow:
     """Raw row from DesignatorTable."""
 
@@ -155,7 +162,7 @@ class DesignatorRow:
     conn_mpn: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectorRow:
     """Raw row from ConnectorTable."""
 
@@ -167,7 +174,7 @@ class ConnectorRow:
     manufacturer: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CableRow:
     """Raw row from CableTable."""
 
@@ -177,3 +184,140 @@ class CableRow:
     note: str = ""
     category: str = "bundle"
     colors: str = ""
+
+
+# --- Columnar Net Table ---
+
+NET_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(NetRow))
+_CABLE_COLUMN = NET_FIELDS.index("cable_des")
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class NetTable(Sequence[NetRow]):
+    """
+    Column-oriented, immutable collection of NetRow.
+
+    Holds one tuple per NetRow field instead of one object per row, and interns
+    every string, so the designators, pins and net names repeated across
+    thousands of wires are stored once. Rows are materialized as NetRow on access.
+
+    Being a ``Sequence[NetRow]``, a NetTable can be passed wherever the
+    transformations accept a list of rows. Building a NetRow per access is
+    slower than iterating a list, so the transformations' hot loops read the
+    columns directly instead. It also indexes rows by ``cable_des``.
+
+    Example:
+        >>> table = NetTable(source.iter_net_rows())
+        >>> table.for_cable("W001")        # NetTable with that cable's rows
+        >>> table.column("net_name")       # tuple of net names, file order
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, rows: Iterable[NetRow] = ()) -> None:
+        columns: tuple[list[Any], ...] = tuple([] for _ in NET_FIELDS)
+        appends = [column.append for column in columns]
+        for row in rows:
+            for append, name in zip(appends, NET_FIELDS, strict=True):
+                append(_intern(getattr(row, name)))
+        self._columns: tuple[tuple[Any, ...], ...] = tuple(map(tuple, columns))
+        self._index: dict[str, array] | None = None
+
+    @classmethod
+    def from_columns(cls, columns: Sequence[Sequence[Any]]) -> Self:
+        """Build a table from one sequence per NetRow field, in field order."""
+        if len(columns) != len(NET_FIELDS) or len({len(c) for c in columns}) > 1:
+            raise ValueError(f"Expected {len(NET_FIELDS)} columns of equal length")
+        table = cls.__new__(cls)
+        table._columns = tuple(tuple(map(_intern, column)) for column in columns)
+        table._index = None
+        return table
+
+    @staticmethod
+    def concat(tables: Iterable[Sequence[NetRow]]) -> "NetTable":
+        """The rows of several tables, one table after the other."""
+        parts = [table._columns if isinstance(table, NetTable) else NetTable(table)._columns for table in tables]
+        if not parts:
+            return NetTable()
+        return NetTable._wrap(tuple(tuple(chain.from_iterable(column)) for column in zip(*parts, strict=True)))
+
+    def columns(self) -> tuple[tuple[Any, ...], ...]:
+        """All columns, in NetRow field order."""
+        return self._columns
+
+    def column(self, name: str) -> tuple[Any, ...]:
+        """One column by NetRow field name."""
+        try:
+            return self._columns[NET_FIELDS.index(name)]
+        except ValueError:
+            raise KeyError(name) from None
+
+    def _cable_index(self) -> dict[str, array]:
+        # Built on first use: cable_des -> row positions, in first-appearance order
+        if self._index is None:
+            index: dict[str, array] = {}
+            for position, cable_des in enumerate(self._columns[_CABLE_COLUMN]):
+                rows = index.get(cable_des)
+                if rows is None:
+                    rows = index[cable_des] = array("L")
+                rows.append(position)
+            self._index = index
+        return self._index
+
+    def cables(self) -> list[str]:
+        """Distinct cable designators, in order of first appearance."""
+        return list(self._cable_index())
+
+    def for_cable(self, cable_des: str) -> "NetTable":
+        """The rows of one cable, in table order. Empty if the cable is absent."""
+        positions = self._cable_index().get(cable_des, ())
+        return self._take(positions)
+
+    def partition(self) -> dict[str, "NetTable"]:
+        """Split into one table per cable, keyed by cable_des."""
+        return {cable_des: self._take(positions) for cable_des, positions in self._cable_index().items()}
+
+    def take(self, positions: Iterable[int]) -> "NetTable":
+        """The rows at ``positions``, in that order."""
+        return self._take(tuple(positions))
+
+    def _take(self, positions: Sequence[int]) -> "NetTable":
+        return NetTable._wrap(tuple(tuple(column[i] for i in positions) for column in self._columns))
+
+    @staticmethod
+    def _wrap(columns: tuple[tuple[Any, ...], ...]) -> "NetTable":
+        # Columns are already interned tuples of one table
+        table = NetTable.__new__(NetTable)
+        table._columns = columns
+        table._index = None
+        return table
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    @overload
+    def __getitem__(self, index: int) -> NetRow: ...
+    @overload
+    def __getitem__(self, index: slice) -> "NetTable": ...
+    def __getitem__(self, index: int | slice) -> "NetRow | NetTable":
+        if isinstance(index, slice):
+            return NetTable._wrap(tuple(column[index] for column in self._columns))
+        return NetRow(*(column[index] for column in self._columns))
+
+    def __iter__(self) -> Iterator[NetRow]:
+        return map(NetRow, *self._columns)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NetTable):
+            return self._columns == other._columns
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"NetTable({len(self)} rows, {len(self._cable_index())} cables)"
@@ -5,15 +5,19 @@ Orchestrates the entire pipeline: data source -> YAML -> WireViz SVG -> PDF.
 
 from __future__ import annotations
 
-import os
-import shutil
-import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
+from wireviz_yaml_generator.build_engine import build_drawings
+from wireviz_yaml_generator.diagnostics import Diagnostics
 from wireviz_yaml_generator.exceptions import ConfigurationError
+from wireviz_yaml_generator.protocols import DataSourceProtocol
+from wireviz_yaml_generator.rendering.svg_cache import SvgCache
 from wireviz_yaml_generator.workflow_manager import WorkflowManager
 
+# Directory name of the default render cache, created beside drawings_dir
+RENDER_CACHE_NAME = ".wireviz_cache"
+
 
 class Project:
     """High-level orchestrator for harness documentation generation.
@@ -22,22 +26,26 @@ class Project:
     manufacturing attachments (BOM, labels), and optionally compiles
     everything into a PDF document via Typst.
 
+    Keep the build under ``if __name__ == "__main__":``: with
+    ``render_backend="python"`` the render workers import the calling script.
+
     Example::
 
-        project = Project(
-            title="Juicebox Cabinet Harness Documentation",
-            version="02",
-            date="19/01/2026",
-            logo="src/ZENLogo.png",
-            db="data/master.db", # choose between db or csv
-            csv="data/master.csv",
-            cable_start=1,
-            cable_end=44,
-            skip_cables=[10, 21, 32, 43],
-        )
-        project.front_page("docs/front.md")
-        project.content_page("docs/description.md")
-        project.build(pdf_path="output/harness_doc.pdf")
+        if __name__ == "__main__":
+            project = Project(
+                title="Juicebox Cabinet Harness Documentation",
+                version="02",
+                date="19/01/2026",
+                logo="src/ZENLogo.png",
+                db="data/master.db", # choose between db or csv
+                csv="data/master.csv",
+                cable_start=1,
+                cable_end=44,
+                skip_cables=[10, 21, 32, 43],
+            )
+            project.front_page("docs/front.md")
+            project.content_page("docs/description.md")
+            project.build(pdf_path="output/harness_doc.pdf")
     """
 
     def __init__(
@@ -53,6 +61,7 @@ class Project:
         db: str | None = None,
         csv: str | None = None,
         auto_generate_cable_des: bool = False,
+        csv_cache: bool = False,
         # Cable selection
         cable_prefix: str = "W",
         cable_start: int = 0,
@@ -65,6 +74,13 @@ class Project:
         terminal_connector: dict[str, str] | None = None,
         # Display
         cable_titles: dict[str, str] | None = None,
+        # BOM
+        xlsx_engine: str = "auto",
+        attachment_format: str = "xlsx",
+        # SVG rendering
+        render_backend: str = "auto",
+        render_cache_dir: str | None = "auto",
+        render_workers: int | None = None,
         # Output directories
         yaml_dir: str = "drawings/src",
         drawings_dir: str = "drawings/harness",
@@ -86,11 +102,17 @@ class Project:
         self._db = db
         self._csv = csv
         self._auto_generate_cable_des = auto_generate_cable_des
+        self._csv_cache = csv_cache
         self._cable_prefix = cable_prefix
         self._pins_last = pins_last
         self._connector_overrides = connector_overrides or {}
         self._terminal_connector = terminal_connector
         self._cable_titles = cable_titles or {}
+        self._xlsx_engine = xlsx_engine
+        self._attachment_format = attachment_format
+        self._render_backend = render_backend
+        self._render_cache_dir = render_cache_dir
+        self._render_workers = render_workers
 
         self.cable_start = cable_start
         self.cable_end = cable_end
@@ -104,6 +126,18 @@ class Project:
         self._front_page_md: str | None = None
         self._content_pages: list[str] = []
 
+    def _render_cache(self) -> SvgCache | None:
+        """Returns the SVG render cache in ``render_cache_dir``, or None if it is disabled.
+
+        "auto" puts the cache beside ``drawings_dir``, so it does not depend on
+        the current directory and each project has its own.
+        """
+        if not self._render_cache_dir:
+            return None
+        if self._render_cache_dir == "auto":
+            return SvgCache(Path(self.drawings_dir).parent / RENDER_CACHE_NAME)
+        return SvgCache(self._render_cache_dir)
+
     def front_page(self, md_path: str) -> None:
         """Set the front page markdown file."""
         self._front_page_md = md_path
@@ -117,11 +151,40 @@ class Project:
         pdf_path: str | None = None,
         create_bom: bool = True,
         create_labels: bool = True,
+        diagnostics: Diagnostics | None = None,
     ) -> None:
-        """Run the full pipeline: YAML -> SVG -> attachments -> PDF."""
+        """Run the full pipeline: YAML -> SVG -> attachments -> PDF.
+
+        Warnings (e.g. connector MPNs missing from the catalog) are collected
+        and deduplicated. Without a ``diagnostics`` collector they are printed
+        once at the end; with one, they are left in it for the caller to
+        report or export (``to_json()``).
+        """
+        collector = diagnostics if diagnostics is not None else Diagnostics()
         data_source = self._create_data_source()
+        try:
+            svg_paths = self._generate(
+                data_source, create_bom=create_bom, create_labels=create_labels, diagnostics=collector
+            )
+        finally:
+            data_source.close()
+            if diagnostics is None:
+                collector.report()
+
+        # PDF generation
+        if pdf_path is not None:
+            self._build_pdf(pdf_path, svg_paths)
+
+    def _generate(
+        self,
+        data_source: DataSourceProtocol,
+        create_bom: bool,
+        create_labels: bool,
+        diagnostics: Diagnostics | None = None,
+    ) -> list[tuple[str, str]]:
+        """Generate attachments, YAML and SVG files; returns ``(cable_des, svg_path)`` pairs."""
         cable_filters = self._build_cable_filters()
-        workflow = WorkflowManager(data_source)
+        workflow = WorkflowManager(data_source, diagnostics)
 
         # Scan for available connector images
         resource_path = Path(self.resources_dir)
@@ -132,57 +195,42 @@ class Project:
         Path(self.drawings_dir).mkdir(parents=True, exist_ok=True)
         Path(self.attachments_dir).mkdir(parents=True, exist_ok=True)
 
-        # Attachments (BOM / Labels)
+        # Attachments (BOM / Labels) run on their own worker during the drawing build
+        attachments = None
         if create_bom or create_labels:
-            workflow.run_attachment_workflow(
+            attachments = partial(
+                workflow.run_attachment_workflow,
                 cable_filters,
                 self.attachments_dir,
                 create_bom=create_bom,
                 create_labels=create_labels,
+                xlsx_engine=self._xlsx_engine,
+                attachment_format=self._attachment_format,
             )
 
-        # Phase 1: YAML generation (sequential — fast, in-memory work)
-        wireviz_executable = shutil.which("wireviz")
-        yaml_files: list[tuple[str, str]] = []  # (cable_des, yaml_filepath)
-
-        for cable_filter in cable_filters:
-            if not data_source.check_cable_existence(cable_filter):
-                continue
-
-            yaml_filepath = str(Path(self.yaml_dir) / f"{cable_filter}.yaml")
-
-            # Build per-cable connector overrides by filtering the project-level overrides
-            cable_overrides = (
-                {des: ovr for des, ovr in self._connector_overrides.items()} if self._connector_overrides else None
-            )
-
-            workflow.run_yaml_workflow(
-                cable_filter,
-                yaml_filepath,
-                available_images,
-                pins_last=self._pins_last,
-                connector_overrides=cable_overrides,
-            )
-            yaml_files.append((cable_filter, yaml_filepath))
-
-        print(f"YAML generated for {len(yaml_files)} cables.")
-
-        # Phase 2: WireViz SVG generation (parallel subprocess calls)
-        svg_paths: list[tuple[str, str]] = []
-        if wireviz_executable and yaml_files:
-            svg_paths = self._run_wireviz_parallel(wireviz_executable, yaml_files)
-            print(f"SVG diagrams generated for {len(svg_paths)} cables.")
-        elif not wireviz_executable:
-            for cable_filter, _ in yaml_files:
-                svg_path = str(Path(self.drawings_dir) / f"{cable_filter}.svg")
-                if Path(svg_path).exists():
-                    svg_paths.append((cable_filter, svg_path))
+        # Build per-cable connector overrides by filtering the project-level overrides
+        cable_overrides = (
+            {des: ovr for des, ovr in self._connector_overrides.items()} if self._connector_overrides else None
+        )
 
-        # PDF generation
-        if pdf_path is not None:
-            self._build_pdf(pdf_path, svg_paths)
+        summary = build_drawings(
+            workflow,
+            data_source,
+            cable_filters,
+            yaml_dir=self.yaml_dir,
+            drawings_dir=self.drawings_dir,
+            available_images=available_images,
+            render_backend=self._render_backend,
+            max_workers=self._render_workers,
+            cache=self._render_cache(),
+            pins_last=self._pins_last,
+            connector_overrides=cable_overrides,
+            attachments=attachments,
+        )
+        summary.report()
+        return summary.svg_paths
 
-    def _create_data_source(self):
+    def _create_data_source(self) -> DataSourceProtocol:
         """Create the appropriate data source."""
         if self._db:
             from wireviz_yaml_generator.data_access import SqliteDataSource
@@ -196,6 +244,7 @@ class Project:
                 self._csv,
                 auto_generate_cable_des=self._auto_generate_cable_des,
                 cable_prefix=self._cable_prefix,
+                sidecar_cache=self._csv_cache,
             )
 
     def _build_cable_filters(self) -> list[str]:
@@ -212,36 +261,6 @@ class Project:
             return set()
         return {f.name for f in resource_path.glob("*.png")}
 
-    def _run_wireviz_parallel(
-        self,
-        executable: str,
-        yaml_files: list[tuple[str, str]],
-    ) -> list[tuple[str, str]]:
-        """Run WireViz CLI on multiple YAML files in parallel."""
-        max_workers = min(8, os.cpu_count() or 4)
-
-        def _invoke(cable_filter: str, yaml_filepath: str) -> tuple[str, str, str | None]:
-            svg_path = str(Path(self.drawings_dir) / f"{cable_filter}.svg")
-            command = [executable, yaml_filepath, "--format", "s", "--output-dir", self.drawings_dir]
-            try:
-                subprocess.run(command, check=True, capture_output=True, text=True)
-                return (cable_filter, svg_path, None)
-            except subprocess.CalledProcessError as e:
-                return (cable_filter, svg_path, e.stderr)
-
-        svg_paths: list[tuple[str, str]] = []
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            futures = {pool.submit(_invoke, cf, yf): cf for cf, yf in yaml_files}
-            for future in as_completed(futures):
-                cable_filter, svg_path, error = future.result()
-                if error:
-                    print(f"WireViz error for {cable_filter}: {error}")
-                else:
-                    svg_paths.append((cable_filter, svg_path))
-
-        svg_paths.sort(key=lambda x: x[0])
-        return svg_paths
-
     def _build_pdf(self, pdf_path: str, svg_paths: list[tuple[str, str]]) -> None:
         """Compile the PDF document from collected content."""
         from wireviz_yaml_generator.rendering.typst.compiler import (
@@ -1,5 +1,6 @@
 """Data Source Protocol — structural interface for data providers."""
 
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Protocol
 
 from .models import CableRow, ConnectorRow, DesignatorRow, NetRow
@@ -10,10 +11,20 @@ class DataSourceProtocol(Protocol):
 
     def check_cable_existence(self, cable_des: str) -> bool: ...
 
+    def list_cables(self) -> list[str]: ...
+
+    def existing_cables(self, candidates: Iterable[str]) -> list[str]: ...
+
     def load_net_table(self, cable_des_filter: str = "") -> list[NetRow]: ...
 
-    def load_designator_table(self) -> list[DesignatorRow]: ...
+    def load_net_table_by_cable(self) -> dict[str, Sequence[NetRow]]: ...
+
+    def iter_net_rows(self, cable_des_filter: str = "", *, ordered: bool = False) -> Iterator[NetRow]: ...
+
+    def load_designator_table(self) -> Sequence[DesignatorRow]: ...
+
+    def load_connector_table(self) -> Sequence[ConnectorRow]: ...
 
-    def load_connector_table(self) -> list[ConnectorRow]: ...
+    def load_cable_table(self) -> Sequence[CableRow]: ...
 
-    def load_cable_table(self) -> list[CableRow]: ...
+    def close(self) -> None: ...
@@ -0,0 +1,433 @@
+"""WireViz diagram rendering.
+
+Turns generated YAML files into SVG diagrams using one of two backends:
+
+- ``"python"``: calls WireViz's Python API (``wireviz.wireviz.parse``) in a
+  pool of worker processes. Each worker imports WireViz and Graphviz once,
+  when it starts, then renders many cables. The YAML is passed to the worker
+  as a string.
+- ``"cli"``: runs the ``wireviz`` executable once per cable, which starts a
+  fresh interpreter every time.
+
+``"auto"`` uses the CLI. The Python backend is opt-in because its worker
+processes are started with forkserver/spawn, which re-import the calling
+script's ``__main__`` module: a script that uses it must keep its top-level
+code under ``if __name__ == "__main__":``, or each worker re-runs the build.
+
+Rendering runs on a ``RenderPipeline``. Cables can be submitted while their
+YAML is still being produced; ``render_svgs`` is the one-shot form for a
+finished list.
+
+Example::
+
+    results = render_svgs([("W001", "drawings/src/W001.yaml")], "drawings/harness")
+"""
+
+from __future__ import annotations
+
+import heapq
+import importlib.util
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from operator import attrgetter
+from pathlib import Path
+from typing import NamedTuple
+
+from wireviz_yaml_generator.exceptions import ConfigurationError
+from wireviz_yaml_generator.rendering.svg_cache import SvgCache
+
+logger = logging.getLogger(__name__)
+
+RENDER_BACKENDS = ("auto", "python", "cli")
+
+# Relative render cost of the parts of a diagram (see render_cost)
+COST_PER_CONNECTION = 1
+COST_PER_CONNECTOR = 4
+COST_PER_IMAGE = 10
+
+# ProcessPoolExecutor's limit on Windows
+_WINDOWS_MAX_WORKERS = 61
+
+
+class _Job(NamedTuple):
+    """A cable waiting to be rendered."""
+
+    cable_des: str
+    yaml_path: str
+    yaml_text: str
+    cost: int
+
+
+@dataclass(frozen=True, slots=True)
+class RenderResult:
+    """Outcome of rendering one cable; ``error`` is None on success."""
+
+    cable_des: str
+    svg_path: str
+    error: str | None = None
+    cached: bool = False
+    seconds: float = 0.0  # time spent rendering, on the worker
+
+
+def default_workers() -> int:
+    """Worker count used when none is given: one per CPU available to this process."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on Windows/macOS
+        cpus = os.cpu_count() or 4
+    return min(cpus, _WINDOWS_MAX_WORKERS) if sys.platform == "win32" else cpus
+
+
+def worker_count(max_workers: int | None, jobs: int) -> int:
+    """Workers to start for ``jobs`` cables: ``max_workers`` (default one per CPU), at most one per job.
+
+    Raises:
+        ConfigurationError: If ``max_workers`` is less than 1.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ConfigurationError(f"render workers must be at least 1, got {max_workers}.")
+    return min(max_workers or default_workers(), max(jobs, 1))
+
+
+def render_cost(connections: int, connectors: int, images: int) -> int:
+    """
+    Rough relative render cost of a WireViz diagram.
+
+    Graphviz layout time grows with the number of edges (connections) and
+    nodes (connectors), and embedding images adds a fixed cost each.
+    """
+    return COST_PER_CONNECTION * connections + COST_PER_CONNECTOR * connectors + COST_PER_IMAGE * images
+
+
+def estimate_cost(yaml_text: str) -> int:
+    """``render_cost`` of a generated WireViz document, counted by parsing it.
+
+    Producers that still hold the counts should pass ``render_cost(...)`` to
+    ``RenderPipeline.submit`` instead; parsing is the fallback.
+    """
+    import yaml
+
+    data = yaml.load(yaml_text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    if not isinstance(data, dict):
+        return 0
+    connectors = data.get("connectors") or {}
+    images = sum(1 for connector in connectors.values() if isinstance(connector, dict) and connector.get("image"))
+    return render_cost(len(data.get("connections") or ()), len(connectors), images)
+
+
+def resolve_backend(backend: str = "auto") -> str | None:
+    """Returns the backend to use (``"python"`` or ``"cli"``), or None if neither is available.
+
+    Raises:
+        ConfigurationError: If ``backend`` is unknown, or ``"python"`` is
+            requested but WireViz cannot be imported.
+    """
+    if backend not in RENDER_BACKENDS:
+        raise ConfigurationError(f"Unknown render_backend '{backend}'. Use 'auto', 'python' or 'cli'.")
+
+    if backend == "python":
+        if importlib.util.find_spec("wireviz") is None:
+            raise ConfigurationError("render_backend='python' requires the wireviz package.")
+        return "python"
+    # "auto" never picks the process pool: its workers re-import __main__ (see module docstring)
+    return "cli" if shutil.which("wireviz") else None
+
+
+def render_svgs(
+    yaml_files: Sequence[tuple[str, str]],
+    output_dir: str,
+    *,
+    backend: str = "auto",
+    max_workers: int | None = None,
+    cache: SvgCache | None = None,
+) -> list[RenderResult]:
+    """
+    Renders ``(cable_des, yaml_path)`` pairs to ``<output_dir>/<cable_des>.svg``.
+
+    With a ``cache``, cables whose YAML, images and WireViz version match an
+    earlier render are copied from it (``cached=True``), and new renders are
+    stored in it.
+
+    A cable that fails to render produces a result with ``error`` set. It
+    does not stop the other cables. Results are sorted by cable designator.
+    If no backend is available, an empty list is returned.
+
+    Cables are handed to the workers largest first (by ``estimate_cost``),
+    so a few big harnesses do not end up running alone at the end of the
+    build. ``max_workers`` defaults to one per CPU.
+    """
+    workers = worker_count(max_workers, len(yaml_files))
+    with (
+        RenderPipeline(output_dir, backend=backend, max_workers=workers, cache=cache) as pipeline,
+        pipeline.batch(),
+    ):
+        for cable_des, yaml_path in yaml_files:
+            pipeline.submit(cable_des, yaml_path)
+    return pipeline.results()
+
+
+class RenderPipeline:
+    """
+    Renders cables while the caller is still producing them.
+
+    ``submit`` queues a cable as soon as its YAML is written and returns
+    immediately. A dispatcher thread feeds the queued jobs to the worker
+    pool. At most ``max_workers`` jobs run at a time, and a free worker
+    always takes the most expensive job waiting (by ``estimate_cost``).
+    Inside ``batch()``, dispatch waits until the whole batch is queued, so
+    the batch runs largest-first.
+
+    Cache hits are resolved in ``submit`` and never reach the pool. If no
+    backend is available, ``submit`` does nothing (see ``available``).
+
+    Example::
+
+        with RenderPipeline("drawings/harness") as renders:
+            for cable_des, yaml_path in produce_yaml():
+                renders.submit(cable_des, yaml_path)
+        results = renders.results()
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        *,
+        backend: str = "auto",
+        max_workers: int | None = None,
+        cache: SvgCache | None = None,
+    ) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ConfigurationError(f"render workers must be at least 1, got {max_workers}.")
+        self.backend = resolve_backend(backend)
+        self.output_dir = output_dir
+        self._workers = max_workers or default_workers()
+        self._cache = cache
+        self._keys: dict[str, str] = {}
+        self._results: list[RenderResult] = []
+
+        # Shared with the dispatcher thread and completion callbacks
+        self._cond = threading.Condition()
+        self._queue: list[tuple[int, int, _Job]] = []  # heap of (-cost, submission order, job)
+        self._submitted = 0
+        self._running = 0
+        self._held = False
+        self._closing = False
+
+        self._pool: Executor | None = None
+        self._dispatcher: threading.Thread | None = None
+        if self.backend is not None:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            if self.backend == "python":
+                self._pool = _process_pool(self._workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="wireviz")
+            self._dispatcher = threading.Thread(target=self._dispatch, name="wireviz-dispatch", daemon=True)
+            self._dispatcher.start()
+
+    @property
+    def available(self) -> bool:
+        """Whether a rendering backend was found."""
+        return self.backend is not None
+
+    def __enter__(self) -> RenderPipeline:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        # On an error in the producer, queued (not yet started) jobs are dropped
+        self.close(cancel=exc_type is not None)
+
+    def submit(self, cable_des: str, yaml_path: str, cost: int | None = None) -> None:
+        """Queues one cable for rendering, or serves it from the cache.
+
+        ``cost`` orders the queue (see ``render_cost``); if omitted, it is
+        estimated by parsing the YAML.
+        """
+        if self.backend is None:
+            return
+        if self._cache is not None:
+            svg_path = str(Path(self.output_dir) / f"{cable_des}.svg")
+            key = self._cache.key(yaml_path)
+            if self._cache.fetch(key, svg_path):
+                with self._cond:
+                    self._results.append(RenderResult(cable_des, svg_path, cached=True))
+                return
+            self._keys[cable_des] = key
+
+        yaml_text = Path(yaml_path).read_text(encoding="utf-8")
+        job = _Job(cable_des, yaml_path, yaml_text, estimate_cost(yaml_text) if cost is None else cost)
+        with self._cond:
+            heapq.heappush(self._queue, (-job.cost, self._submitted, job))
+            self._submitted += 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Holds dispatch until every job submitted in the block is queued."""
+        with self._cond:
+            self._held = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._held = False
+                self._cond.notify_all()
+
+    def close(self, cancel: bool = False) -> None:
+        """Waits for every queued job to finish (or drops queued ones with ``cancel``)."""
+        if self._dispatcher is None:
+            return
+        with self._cond:
+            if cancel:
+                self._queue.clear()
+            self._closing = True
+            self._held = False
+            self._cond.notify_all()
+        self._dispatcher.join()
+        with self._cond:
+            self._cond.wait_for(lambda: self._running == 0)
+        assert self._pool is not None
+        self._pool.shutdown()
+        self._dispatcher = None
+
+    def results(self) -> list[RenderResult]:
+        """Results so far (all of them after ``close``), sorted by cable designator."""
+        with self._cond:
+            return sorted(self._results, key=attrgetter("cable_des"))
+
+    def _dispatch(self) -> None:
+        """Dispatcher thread: hands the largest waiting job to each free worker."""
+        assert self._pool is not None
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: (
+                        (self._queue and not self._held and self._running < self._workers)
+                        or (self._closing and not self._queue)
+                    )
+                )
+                if not self._queue:
+                    return
+                _, _, job = heapq.heappop(self._queue)
+                self._running += 1
+
+            try:
+                if self.backend == "python":
+                    image_dir = str(Path(job.yaml_path).resolve().parent)
+                    future = self._pool.submit(
+                        _render_yaml_text, job.cable_des, job.yaml_text, self.output_dir, image_dir
+                    )
+                else:
+                    executable = shutil.which("wireviz") or "wireviz"
+                    future = self._pool.submit(
+                        _render_with_cli, executable, job.cable_des, job.yaml_path, self.output_dir
+                    )
+            except Exception as e:  # e.g. BrokenProcessPool after a worker died
+                self._fail_queued(job, e)
+                continue
+            future.add_done_callback(partial(self._finished, job))
+
+    def _fail_queued(self, job: _Job, error: Exception) -> None:
+        """Records ``job`` and every job still queued as failed, after the pool refused ``job``."""
+        message = f"{type(error).__name__}: {error}"
+        with self._cond:
+            failed = [job, *(queued for _, _, queued in self._queue)]
+            self._queue.clear()
+            self._results.extend(
+                RenderResult(j.cable_des, str(Path(self.output_dir) / f"{j.cable_des}.svg"), message) for j in failed
+            )
+            self._running -= 1
+            self._cond.notify_all()
+
+    def _finished(self, job: _Job, future: Future[RenderResult]) -> None:
+        """Completion callback: records the result and stores new renders in the cache.
+
+        The result is always recorded and the worker slot released, even if
+        caching fails: an exception escaping a callback is only logged by
+        concurrent.futures, and close() would wait for the slot forever.
+        """
+        try:
+            result = future.result()
+        except Exception as e:  # e.g. a worker process died
+            svg_path = str(Path(self.output_dir) / f"{job.cable_des}.svg")
+            result = RenderResult(job.cable_des, svg_path, f"{type(e).__name__}: {e}")
+
+        try:
+            if self._cache is not None and not result.error and Path(result.svg_path).is_file():
+                self._cache.store(self._keys[job.cable_des], result.svg_path)
+        except Exception as e:
+            logger.warning("Could not cache the diagram for %s: %s", job.cable_des, e)
+        finally:
+            with self._cond:
+                self._results.append(result)
+                self._running -= 1
+                self._cond.notify_all()
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    """Worker pool of the Python backend.
+
+    Workers are started with forkserver (spawn where it is unavailable), not
+    fork: the build is multi-threaded when they start (attachments, SQLite
+    connections), and a forked child can inherit a held import lock or mutex.
+    The initializer pays the imports a fresh worker needs anyway.
+
+    Both start methods import the parent's ``__main__`` in each worker, so
+    the calling script needs a main guard; that is why "auto" does not use
+    this backend.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context(method), initializer=_warm_worker
+    )
+
+
+# --- Backends (run on the pool's workers) ---
+
+
+def _warm_worker() -> None:
+    """Process pool initializer: pays the WireViz/Graphviz import once per worker."""
+    import wireviz.wireviz  # noqa: F401
+
+
+def _render_yaml_text(cable_des: str, yaml_text: str, output_dir: str, image_dir: str) -> RenderResult:
+    """Python backend: renders one cable with WireViz's API in the current process."""
+    from wireviz.wireviz import parse
+
+    svg_path = str(Path(output_dir) / f"{cable_des}.svg")
+    started = time.perf_counter()
+    try:
+        # image_paths stands in for the YAML file's directory, which the CLI
+        # adds itself, so that "../resources/..." image paths resolve
+        parse(
+            yaml_text,
+            output_formats=("svg",),
+            output_dir=output_dir,
+            output_name=cable_des,
+            image_paths=[image_dir],
+        )
+    except Exception as e:
+        return RenderResult(cable_des, svg_path, f"{type(e).__name__}: {e}", seconds=time.perf_counter() - started)
+    return RenderResult(cable_des, svg_path, seconds=time.perf_counter() - started)
+
+
+def _render_with_cli(executable: str, cable_des: str, yaml_path: str, output_dir: str) -> RenderResult:
+    """CLI backend: renders one cable in a new ``wireviz`` process."""
+    svg_path = str(Path(output_dir) / f"{cable_des}.svg")
+    command = [executable, yaml_path, "--format", "s", "--output-dir", output_dir]
+    started = time.perf_counter()
+    try:
+        subprocess.run(command, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        return RenderResult(cable_des, svg_path, e.stderr, seconds=time.perf_counter() - started)
+    return RenderResult(cable_des, svg_path, seconds=time.perf_counter() - started)
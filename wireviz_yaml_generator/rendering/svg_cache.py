@@ -0,0 +1,165 @@
+"""Persistent cache of rendered WireViz SVGs.
+
+A render is keyed by a SHA-256 over the YAML text, the content of every image
+the YAML references and the installed WireViz version. When the key matches,
+the stored SVG is copied into place instead of rendering the cable again.
+
+Entries are plain ``<key>.svg`` files in the cache directory. The total size
+is capped: when a store exceeds the limit, the least recently used entries
+are deleted until the cache is back under ``EVICT_TO`` of it. A hit
+refreshes the entry's modification time, and that time serves as the "last
+used" stamp. The directory is scanned on the first store only; after that a
+running total is kept, and rescanned only when evicting.
+
+The cache is best-effort: a read-only, full or vanished cache directory
+turns fetches into misses and stores into no-ops, never build errors.
+
+Example::
+
+    cache = SvgCache("drawings/.svg_cache")
+    key = cache.key("drawings/src/W001.yaml")
+    if not cache.fetch(key, "drawings/harness/W001.svg"):
+        ...  # render, then
+        cache.store(key, "drawings/harness/W001.svg")
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import re
+import shutil
+import threading
+from functools import cache
+from pathlib import Path
+
+# Default size limit of the cache directory
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Eviction frees space down to this fraction of max_bytes, so that a full
+# cache is not rescanned on every store
+EVICT_TO = 0.9
+
+# "src: <path>" lines of image blocks, as emitted by BuildYaml
+_IMAGE_SRC = re.compile(r"^\s*src:[ \t]*(.+?)[ \t]*$", re.MULTILINE)
+
+
+@cache
+def _wireviz_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("wireviz")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SvgCache:
+    """Content-addressed SVG store with a size limit and LRU eviction."""
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._total: int | None = None  # bytes in the cache; None until the first store
+        self._lock = threading.Lock()  # stores run on concurrent completion callbacks
+
+    def key(self, yaml_path: str | os.PathLike[str]) -> str:
+        """Cache key for rendering ``yaml_path`` with the installed WireViz."""
+        path = Path(yaml_path)
+        text = path.read_bytes()
+        digest = hashlib.sha256()
+        digest.update(_wireviz_version().encode())
+        digest.update(b"\0")
+        digest.update(text)
+        # Images resolve relative to the YAML file, as WireViz does
+        for src in sorted(set(_image_sources(text.decode("utf-8")))):
+            digest.update(b"\0")
+            digest.update(src.encode())
+            image = path.parent / src
+            digest.update(hashlib.sha256(image.read_bytes()).digest() if image.is_file() else b"missing")
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / f"{key}.svg"
+
+    def fetch(self, key: str, svg_path: str | os.PathLike[str]) -> bool:
+        """Copies the SVG stored under ``key`` to ``svg_path``; False on a miss or any I/O error."""
+        entry = self._entry(key)
+        try:
+            shutil.copyfile(entry, svg_path)
+            os.utime(entry)
+        except OSError:
+            return False
+        return True
+
+    def store(self, key: str, svg_path: str | os.PathLike[str]) -> None:
+        """Stores a freshly rendered SVG under ``key``, then enforces the size limit.
+
+        I/O errors leave the cache unchanged; the render itself is unaffected.
+        """
+        entry = self._entry(key)
+        tmp = entry.with_name(f".{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(svg_path, tmp)
+            size = tmp.stat().st_size
+            try:
+                replaced = entry.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp, entry)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            if self._total is None:
+                self._total = self._size()
+            else:
+                self._total += size - replaced
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) of every entry."""
+        entries = []
+        try:
+            for entry in self.directory.glob("*.svg"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry))
+        except OSError:
+            pass
+        return entries
+
+    def _evict(self) -> None:
+        """Deletes least recently used entries until the cache fits in ``EVICT_TO`` of ``max_bytes``."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes * EVICT_TO:
+                break
+            try:
+                entry.unlink(missing_ok=True)
+            except OSError:
+                continue
+            total -= size
+        self._total = total
+
+
+def _image_sources(yaml_text: str) -> list[str]:
+    """Image paths referenced by a generated YAML document."""
+    import yaml
+
+    sources = []
+    for match in _IMAGE_SRC.finditer(yaml_text):
+        value = yaml.safe_load(match.group(1))
+        if isinstance(value, str) and value:
+            sources.append(value)
+    return sources
@@ -6,8 +6,12 @@ It includes no I/O operations (no database access, no file writing).
 """
 
 import re
-from typing import Any
+from collections.abc import Iterable, Iterator, Sequence
+from functools import _CacheInfo, lru_cache
+from operator import attrgetter
+from typing import Any, overload
 
+from .diagnostics import MISSING_MPN, Diagnostics
 from .models import (
     Cable,
     CableRow,
@@ -16,22 +20,160 @@ from .models import (
     ConnectorRow,
     DesignatorRow,
     NetRow,
+    NetTable,
 )
 
+_DIGIT_RUNS = re.compile("([0-9]+)")
 
-def _natural_sort_key(s: str | None) -> list[Any]:
-    """Helper for 'human' sorting."""
+
+@lru_cache(maxsize=8192)
+def _natural_key(s: str) -> tuple[Any, ...]:
+    return tuple(int(text) if text.isdigit() else text.lower() for text in _DIGIT_RUNS.split(s))
+
+
+def _natural_sort_key(s: str | None) -> tuple[Any, ...]:
+    """Helper for 'human' sorting.
+
+    Keys are memoized (bounded LRU, shared process-wide): the same designators
+    and pin names are sorted again for every cable in a build.
+    """
     if s is None:
-        return []
-    return [int(text) if text.isdigit() else text.lower() for text in re.split("([0-9]+)", str(s))]
+        return ()
+    return _natural_key(str(s))
+
+
+def natural_sort_cache_info() -> _CacheInfo:
+    """Hit/miss statistics of the natural sort key cache."""
+    return _natural_key.cache_info()
+
+
+# Canonical wire order. Via-pin numbering, cable wire_labels and wire labels
+# all follow it, which is why every consumer reads one SortedNetView.
+_WIRE_ORDER = ("cable_des", "comp_des_1", "conn_des_1", "pin_1")
+_wire_order = attrgetter(*_WIRE_ORDER)
+
+
+class SortedNetView(Sequence[NetRow]):
+    """
+    Net rows sorted once into canonical wire order, with per-cable group boundaries.
+
+    ``process_cables``, ``process_connections`` and ``generate_wire_labels``
+    all consume this view, so a cable's wire i is the same row everywhere.
+    Passing a view to them (see ``sort_net_rows``) skips re-sorting.
+
+    A NetTable is sorted through its key columns and stays a NetTable, so
+    the consumers read its columns without building a NetRow per wire.
+    """
+
+    __slots__ = ("_rows", "_groups")
+
+    def __init__(self, net_rows: Iterable[NetRow]) -> None:
+        self._rows: Sequence[NetRow]
+        if isinstance(net_rows, NetTable):
+            keys = list(zip(*map(net_rows.column, _WIRE_ORDER), strict=True))
+            self._rows = net_rows.take(sorted(range(len(keys)), key=keys.__getitem__))
+            cables: Sequence[str] = self._rows.column("cable_des")
+        else:
+            self._rows = tuple(sorted(net_rows, key=_wire_order))
+            cables = [row.cable_des for row in self._rows]
+
+        # cable_des -> (start, stop); sorted rows keep each cable contiguous
+        self._groups: dict[str, tuple[int, int]] = {}
+        start = 0
+        for position, cable_des in enumerate(cables):
+            if cable_des != cables[start]:
+                self._groups[cables[start]] = (start, position)
+                start = position
+        if cables:
+            self._groups[cables[start]] = (start, len(cables))
+
+    def groups(self) -> Iterator[tuple[str, Sequence[NetRow]]]:
+        """Yield (cable_des, rows) per cable, in sorted order."""
+        for cable_des, (start, stop) in self._groups.items():
+            yield cable_des, self._rows[start:stop]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> NetRow: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[NetRow]: ...
+    def __getitem__(self, index: int | slice) -> NetRow | Sequence[NetRow]:
+        return self._rows[index]
+
+    def __iter__(self) -> Iterator[NetRow]:
+        return iter(self._rows)
+
+
+def sort_net_rows(net_rows: Iterable[NetRow]) -> SortedNetView:
+    """Return net rows as a SortedNetView, sorting only if they are not one already."""
+    if isinstance(net_rows, SortedNetView):
+        return net_rows
+    return SortedNetView(net_rows)
+
+
+def _net_fields(net_rows: Iterable[NetRow], *names: str) -> Iterator[Any]:
+    """``attrgetter(*names)`` of each row; a NetTable is read from its columns, without NetRows."""
+    if isinstance(net_rows, SortedNetView):
+        net_rows = net_rows._rows
+    if isinstance(net_rows, NetTable):
+        columns = map(net_rows.column, names)
+        return zip(*columns, strict=True) if len(names) > 1 else iter(next(columns))
+    return map(attrgetter(*names), net_rows)
+
+
+class ConnectorIndex:
+    """
+    Precomputed lookups over the designator and connector catalogs.
+
+    Built once per catalog snapshot and reused for every cable, so that
+    ``process_connectors`` touches only the endpoints a cable uses instead
+    of scanning the whole DesignatorTable and rebuilding the MPN map.
+
+    Attributes:
+        connectors: ``mpn -> ConnectorRow`` (last row wins, as before).
+    """
+
+    __slots__ = ("_by_endpoint", "_entries", "connectors")
+
+    def __init__(self, designator_rows: Iterable[DesignatorRow], connector_rows: Iterable[ConnectorRow]) -> None:
+        # (natural sort key, catalog position, row); position keeps ties in catalog order
+        self._entries = [
+            ((_natural_sort_key(row.comp_des), _natural_sort_key(row.conn_des)), position, row)
+            for position, row in enumerate(designator_rows)
+        ]
+        self._by_endpoint: dict[str, list[tuple[Any, int, DesignatorRow]]] = {}
+        for entry in self._entries:
+            row = entry[2]
+            self._by_endpoint.setdefault(f"{row.comp_des}-{row.conn_des}", []).append(entry)
+        self._entries.sort(key=_entry_order)
+        self.connectors: dict[str, ConnectorRow] = {c.mpn: c for c in connector_rows}
+
+    def designators_for(self, endpoints: Iterable[str]) -> list[DesignatorRow]:
+        """Designator rows for the given ``comp_des-conn_des`` endpoints, naturally sorted."""
+        entries = [entry for endpoint in endpoints for entry in self._by_endpoint.get(endpoint, ())]
+        entries.sort(key=_entry_order)
+        return [entry[2] for entry in entries]
+
+    def all_designators(self) -> list[DesignatorRow]:
+        """Every designator row, naturally sorted."""
+        return [entry[2] for entry in self._entries]
+
+
+def _entry_order(entry: tuple[Any, int, DesignatorRow]) -> tuple[Any, int]:
+    return entry[0], entry[1]
 
 
 def process_connectors(
-    net_rows: list[NetRow],
-    designator_rows: list[DesignatorRow],
-    connector_rows: list[ConnectorRow],
+    net_rows: Sequence[NetRow],
+    designator_rows: Sequence[DesignatorRow],
+    connector_rows: Sequence[ConnectorRow],
     available_images: set[str],
     filter_active: bool,
+    *,
+    index: ConnectorIndex | None = None,
+    diagnostics: Diagnostics | None = None,
 ) -> list[Connector]:
     """
     Transforms raw DB rows into Connector domain objects.
@@ -42,26 +184,27 @@ def process_connectors(
         connector_rows: Catalog of MPN metadata.
         available_images: Set of filenames (e.g. {'connector_a.png'}) present in resources.
         filter_active: If True, only returns connectors present in `net_rows`.
+        index: Prebuilt ConnectorIndex over ``designator_rows``/``connector_rows``.
+               Pass one when processing many cables against the same catalog.
+        diagnostics: Collector for warnings (e.g. MPNs missing from the catalog).
     """
+    if index is None:
+        index = ConnectorIndex(designator_rows, connector_rows)
 
-    # 1. Filter Designators if needed
-    required_connectors: set[str] = set()
-    filtered_designators = designator_rows
-
+    # 1.+2. Designators in use (or all of them), naturally sorted
     if filter_active:
-        for row in net_rows:
-            required_connectors.add(f"{row.comp_des_1}-{row.conn_des_1}")
-            required_connectors.add(f"{row.comp_des_2}-{row.conn_des_2}")
-
-        filtered_designators = [
-            row for row in designator_rows if f"{row.comp_des}-{row.conn_des}" in required_connectors
-        ]
-
-    # 2. Sort naturally
-    filtered_designators.sort(key=lambda x: (_natural_sort_key(x.comp_des), _natural_sort_key(x.conn_des)))
+        required_connectors: set[str] = set()
+        for comp_des_1, conn_des_1, comp_des_2, conn_des_2 in _net_fields(
+            net_rows, "comp_des_1", "conn_des_1", "comp_des_2", "conn_des_2"
+        ):
+            required_connectors.add(f"{comp_des_1}-{conn_des_1}")
+            required_connectors.add(f"{comp_des_2}-{conn_des_2}")
+        filtered_designators = index.designators_for(required_connectors)
+    else:
+        filtered_designators = index.all_designators()
 
     # 3. Enrich with ConnectorTable data
-    connector_map = {c.mpn: c for c in connector_rows}
+    connector_map = index.connectors
     result_data: list[Connector] = []
 
     for row in filtered_designators:
@@ -96,10 +239,14 @@ def process_connectors(
                 image_src = f"../resources/{image_filename}"
                 image_caption = "ISO view"
         else:
-            print(
-                f"⚠️  Warning: MPN '{conn_mpn}' for connector '{name}'"
-                " not found in ConnectorTable. Using default values."
-            )
+            if diagnostics is not None:
+                # One warning per missing part, listing every connector that uses it
+                diagnostics.warn(
+                    MISSING_MPN,
+                    conn_mpn,
+                    f"MPN '{conn_mpn}' not found in ConnectorTable. Using default values.",
+                    detail=name,
+                )
             mpn = "NotFound"
             hide_disconnected = True
 
@@ -119,18 +266,14 @@ def process_connectors(
     return result_data
 
 
-def process_cables(net_rows: list[NetRow], cable_rows: list[CableRow]) -> list[Cable]:
+def process_cables(net_rows: Sequence[NetRow], cable_rows: Sequence[CableRow]) -> list[Cable]:
     """Aggregates wires into Cables."""
-    # CRITICAL: Sort rows in the SAME order as process_connections()
-    # This ensures wire_labels[i] corresponds to via_pin = i+1 in connections.
-    sorted_rows = sorted(net_rows, key=lambda x: (x.cable_des, x.comp_des_1, x.conn_des_1, x.pin_1))
+    # CRITICAL: Same sorted view as process_connections(), so that
+    # wire_labels[i] corresponds to via_pin = i+1 in connections.
+    sorted_view = sort_net_rows(net_rows)
 
     # 1. Aggregate wires by cable_des (in sorted order)
-    aggregated_wires: dict[str, list[str]] = {}
-    for row in sorted_rows:
-        if row.cable_des not in aggregated_wires:
-            aggregated_wires[row.cable_des] = []
-        aggregated_wires[row.cable_des].append(row.net_name)
+    aggregated_wires = {cable_des: list(_net_fields(rows, "net_name")) for cable_des, rows in sorted_view.groups()}
 
     # 2. Pre-process Cable Metadata for O(1) lookup
     cable_meta_map = {c.cable_des: c for c in cable_rows}
@@ -167,32 +310,27 @@ def process_cables(net_rows: list[NetRow], cable_rows: list[CableRow]) -> list[C
     return cable_data
 
 
-def process_connections(net_rows: list[NetRow]) -> list[Connection]:
+def process_connections(net_rows: Sequence[NetRow]) -> list[Connection]:
     """Maps net table rows to Connection objects with Via Pin assignment."""
-    # 1. Sort to ensure consistent pinout order (Critical for determinism)
-    sorted_rows = sorted(net_rows, key=lambda x: (x.cable_des, x.comp_des_1, x.conn_des_1, x.pin_1))
-
+    # Sorted view fixes the pinout order (Critical for determinism)
     connection_data: list[Connection] = []
-    cable_pin_counters: dict[str, int] = {}
-
-    for row in sorted_rows:
-        via_name = row.cable_des
-        if via_name not in cable_pin_counters:
-            cable_pin_counters[via_name] = 0
-        cable_pin_counters[via_name] += 1
-        via_pin = cable_pin_counters[via_name]
-
-        connection_data.append(
-            Connection(
-                from_designator=f"{row.comp_des_1}-{row.conn_des_1}" if row.conn_des_1 else f"{row.comp_des_1}",
-                from_pin=row.pin_1,
-                to_designator=f"{row.comp_des_2}-{row.conn_des_2}" if row.conn_des_2 else f"{row.comp_des_2}",
-                to_pin=row.pin_2,
-                via_cable=via_name,
-                via_pin=via_pin,
-                net_name=row.net_name,
+
+    for via_name, rows in sort_net_rows(net_rows).groups():
+        wires = _net_fields(rows, "comp_des_1", "conn_des_1", "pin_1", "comp_des_2", "conn_des_2", "pin_2", "net_name")
+        for via_pin, (comp_des_1, conn_des_1, pin_1, comp_des_2, conn_des_2, pin_2, net_name) in enumerate(
+            wires, start=1
+        ):
+            connection_data.append(
+                Connection(
+                    from_designator=f"{comp_des_1}-{conn_des_1}" if conn_des_1 else f"{comp_des_1}",
+                    from_pin=pin_1,
+                    to_designator=f"{comp_des_2}-{conn_des_2}" if conn_des_2 else f"{comp_des_2}",
+                    to_pin=pin_2,
+                    via_cable=via_name,
+                    via_pin=via_pin,
+                    net_name=net_name,
+                )
             )
-        )
 
     return connection_data
 
@@ -212,7 +350,7 @@ def _to_pin_value(pin: str) -> int | str:
 def _pin_sort_key(
     pin: int | str,
     pins_last: list[str] | None = None,
-) -> tuple[int, list[Any]]:
+) -> tuple[int, tuple[Any, ...]]:
     """Sort key that places pins matching *pins_last* patterns after all others."""
     s = str(pin)
     if pins_last:
@@ -250,7 +388,7 @@ def fill_missing_connectors(
         pin_sets.setdefault(conn.from_designator, set()).add(conn.from_pin)
         pin_sets.setdefault(conn.to_designator, set()).add(conn.to_pin)
 
-    missing: list[str] = sorted(pin_sets.keys() - existing, key=lambda s: _natural_sort_key(s))
+    missing: list[str] = sorted(pin_sets.keys() - existing, key=_natural_sort_key)
     result: list[Connector] = []
     for d in missing:
         ovr = overrides.get(d, {})
@@ -278,20 +416,37 @@ def fill_missing_connectors(
 
 
 def generate_bom_data(
-    net_rows: list[NetRow],
-    designator_rows: list[DesignatorRow],
-    connector_rows: list[ConnectorRow],
-    cable_rows: list[CableRow],
+    net_rows: Iterable[NetRow],
+    designator_rows: Sequence[DesignatorRow],
+    connector_rows: Sequence[ConnectorRow],
+    cable_rows: Sequence[CableRow],
 ) -> list[dict[str, Any]]:
-    """Calculates the Bill of Materials (BOM)."""
+    """Calculates the Bill of Materials (BOM).
+
+    ``net_rows`` is consumed in a single pass, so it may be a stream such as
+    ``iter_net_rows()``; memory then scales with distinct endpoints, not wires.
+    """
     bom_data: list[dict[str, Any]] = []
 
-    # --- Connectors Section ---
+    # Single pass over the nets: used endpoints and wire counts per cable/colour
     conn_set = set()
-    for row in net_rows:
-        conn_set.add(f"{row.comp_des_1}-{row.conn_des_1}")
-        conn_set.add(f"{row.comp_des_2}-{row.conn_des_2}")
+    wire_counter: dict[str, int] = {}
+    for cable_des, comp_des_1, conn_des_1, comp_des_2, conn_des_2, net_name in _net_fields(
+        net_rows, "cable_des", "comp_des_1", "conn_des_1", "comp_des_2", "conn_des_2", "net_name"
+    ):
+        conn_set.add(f"{comp_des_1}-{conn_des_1}")
+        conn_set.add(f"{comp_des_2}-{conn_des_2}")
 
+        key_suffix = "White"
+        if "24V" in net_name:
+            key_suffix = "Red"
+        elif "gnd" in net_name:
+            key_suffix = "Black"
+
+        key = f"{cable_des}{key_suffix}"
+        wire_counter[key] = wire_counter.get(key, 0) + 1
+
+    # --- Connectors Section ---
     part_counter: dict[str, int] = {}
     for row in designator_rows:
         full_des = f"{row.comp_des}-{row.conn_des}"
@@ -311,17 +466,6 @@ def generate_bom_data(
             )
 
     # --- Wires Section ---
-    wire_counter: dict[str, int] = {}
-    for row in net_rows:
-        key_suffix = "White"
-        if "24V" in row.net_name:
-            key_suffix = "Red"
-        elif "gnd" in row.net_name:
-            key_suffix = "Black"
-
-        key = f"{row.cable_des}{key_suffix}"
-        wire_counter[key] = wire_counter.get(key, 0) + 1
-
     wire_rows: list[dict[str, Any]] = []
     DESCRIPTION = "Radox 125"
     MANUFACTURER = ""
@@ -365,52 +509,63 @@ def generate_bom_data(
     return bom_data
 
 
-def generate_cable_labels(net_rows: list[NetRow]) -> list[dict[str, str]]:
-    """Generates cable tags/labels formatted for printing."""
-    cable_set = set(r.cable_des for r in net_rows)
-    cable_dict: dict[str, list[str]] = {c: [] for c in cable_set}
-
-    for row in net_rows:
-        # Side 1
-        c1 = row.conn_des_1
-        label_1 = f"{row.comp_des_1}-{c1} : {row.cable_des}" if c1 else f"{row.comp_des_1} : {row.cable_des}"
+def generate_cable_labels(net_rows: Iterable[NetRow]) -> list[dict[str, str]]:
+    """Generates cable tags/labels formatted for printing.
 
-        # Side 2
-        c2 = row.conn_des_2
-        label_2 = f"{row.comp_des_2}-{c2} : {row.cable_des}" if c2 else f"{row.comp_des_2} : {row.cable_des}"
-
-        if label_1 not in cable_dict[row.cable_des]:
-            cable_dict[row.cable_des].append(label_1)
-        if label_2 not in cable_dict[row.cable_des]:
-            cable_dict[row.cable_des].append(label_2)
+    One label per distinct cable end, in order of first appearance. Runs in
+    linear time: endpoints are deduplicated with insertion-ordered dicts
+    before any label string is formatted.
+    """
+    # cable_des -> {(comp_des, conn_des): None}; a dict is an ordered set
+    endpoints: dict[str, dict[tuple[str, str], None]] = {}
+    for cable_des, comp_des_1, conn_des_1, comp_des_2, conn_des_2 in _net_fields(
+        net_rows, "cable_des", "comp_des_1", "conn_des_1", "comp_des_2", "conn_des_2"
+    ):
+        seen = endpoints.get(cable_des)
+        if seen is None:
+            seen = endpoints[cable_des] = {}
+        seen[(comp_des_1, conn_des_1)] = None
+        seen[(comp_des_2, conn_des_2)] = None
 
     label_data = ["Cable Labels:"]
-    for _cable, label_list in cable_dict.items():
-        label_data.extend(label_list)
+    for cable_des, ends in endpoints.items():
+        # Dedupe on the text too: ("J1-X1", "") and ("J1", "X1") print the same label
+        label_data.extend(
+            dict.fromkeys(
+                f"{comp_des}-{conn_des} : {cable_des}" if conn_des else f"{comp_des} : {cable_des}"
+                for comp_des, conn_des in ends
+            )
+        )
 
     return [{"Label": item} for item in label_data]
 
 
-def generate_wire_labels(net_rows: list[NetRow]) -> list[dict[str, str]]:
+def generate_wire_labels(net_rows: Sequence[NetRow]) -> list[dict[str, str]]:
     """Generates wire end-point labels formatted for printing."""
-    # Sort for grouping by cable
-    sorted_rows = sorted(net_rows, key=lambda x: (x.cable_des, x.comp_des_1, x.conn_des_1, x.pin_1))
+    return list(iter_wire_labels(sort_net_rows(net_rows)))
 
-    wire_data = ["Wire Labels:"]
+
+def iter_wire_labels(sorted_net_rows: Iterable[NetRow]) -> Iterator[dict[str, str]]:
+    """Streams wire end-point labels from rows already sorted by cable.
+
+    Rows must arrive in (cable_des, comp_des_1, conn_des_1, pin_1) order, e.g.
+    from ``iter_net_rows(ordered=True)``. Only the current row is held, so
+    memory stays bounded for arbitrarily large tables.
+    """
+    yield {"Label": "Wire Labels:"}
     previous_cable = None
 
-    for row in sorted_rows:
-        current_cable = row.cable_des
+    for current_cable, comp_des_1, conn_des_1, pin_1, comp_des_2, conn_des_2, pin_2 in _net_fields(
+        sorted_net_rows, "cable_des", "comp_des_1", "conn_des_1", "pin_1", "comp_des_2", "conn_des_2", "pin_2"
+    ):
         if current_cable != previous_cable:
-            wire_data.append(f"Labels: {current_cable}")
+            yield {"Label": f"Labels: {current_cable}"}
             previous_cable = current_cable
 
         # Side 1
-        d1 = row.conn_des_1 if row.conn_des_1 else row.comp_des_1
-        wire_data.append(f"{d1} : {row.pin_1}")
+        d1 = conn_des_1 if conn_des_1 else comp_des_1
+        yield {"Label": f"{d1} : {pin_1}"}
 
         # Side 2
-        d2 = row.conn_des_2 if row.conn_des_2 else row.comp_des_2
-        wire_data.append(f"{d2} : {row.pin_2}")
-
-    return [{"Label": item} for item in wire_data]
+        d2 = conn_des_2 if conn_des_2 else comp_des_2
+        yield {"Label": f"{d2} : {pin_2}"}
@@ -21,8 +21,14 @@ Architecture:
            └-> BuildYaml.py / excel_writer.py
 """
 
+from collections.abc import Iterable, Sequence
+from typing import Any
+
 from . import BuildYaml, excel_writer, transformations
+from .diagnostics import Diagnostics
+from .models import ConnectorRow, DesignatorRow, NetRow, NetTable
 from .protocols import DataSourceProtocol
+from .rendering.diagrams import render_cost
 
 
 class WorkflowManager:
@@ -42,34 +48,67 @@ class WorkflowManager:
         >>> workflow.run_attachment_workflow(["W001", "W002"], "output/")
     """
 
-    def __init__(self, data_source: DataSourceProtocol):
+    def __init__(self, data_source: DataSourceProtocol, diagnostics: Diagnostics | None = None):
         """
         Initializes the workflow manager with a data source.
 
         Args:
             data_source: Repository providing access to the electrical design database.
+            diagnostics: Collector for warnings raised by the workflows. A new one
+                         is created if omitted; report it when the build is done.
         """
         self._source = data_source
-
-    def _load_and_filter_data(self, cable_des_filter: str = ""):
+        self.diagnostics = diagnostics if diagnostics is not None else Diagnostics()
+        # Render cost of each cable's diagram, recorded when its YAML is generated
+        self.render_costs: dict[str, int] = {}
+        # ConnectorIndex and the catalog snapshots it was built from
+        self._connector_index: (
+            tuple[Sequence[DesignatorRow], Sequence[ConnectorRow], transformations.ConnectorIndex] | None
+        ) = None
+
+    def _load_and_filter_data(self, cable_des_filter: str = "", net_rows: Sequence[NetRow] | None = None):
         """
         Internal helper: Loads all required tables and filters NetTable
         based on the cable designator.
+
+        If ``net_rows`` is given (e.g. one partition from
+        ``load_net_table_by_cable()``), NetTable is not queried again.
         """
-        net_rows = self._source.load_net_table(cable_des_filter)
+        if net_rows is None:
+            net_rows = self._source.load_net_table(cable_des_filter)
         connector_rows = self._source.load_connector_table()
         designator_rows = self._source.load_designator_table()
         cable_rows = self._source.load_cable_table()
 
         return net_rows, connector_rows, designator_rows, cable_rows
 
+    def _get_connector_index(
+        self, designator_rows: Sequence[DesignatorRow], connector_rows: Sequence[ConnectorRow]
+    ) -> transformations.ConnectorIndex:
+        """Return the ConnectorIndex for these catalog rows, reusing it across cables.
+
+        Catalog loaders return the same snapshot object until the source
+        changes, so object identity tells whether the index is still valid.
+        """
+        cached = self._connector_index
+        if cached is None or cached[0] is not designator_rows or cached[1] is not connector_rows:
+            cached = (designator_rows, connector_rows, transformations.ConnectorIndex(designator_rows, connector_rows))
+            self._connector_index = cached
+        return cached[2]
+
     def run_attachment_workflow(
-        self, cable_filters: list[str], output_path: str, create_bom: bool = True, create_labels: bool = True
+        self,
+        cable_filters: list[str],
+        output_path: str,
+        create_bom: bool = True,
+        create_labels: bool = True,
+        xlsx_engine: str = "auto",
+        attachment_format: str = "xlsx",
     ) -> None:
         """
         Generates manufacturing attachments (BOM and Labels) for specified cables.
 
-        This workflow creates Excel files for manufacturing and assembly:
+        This workflow creates Excel (or CSV/TSV) files for manufacturing and assembly:
         - BOM (Bill of Materials): Consolidated parts list with quantities
         - Cable Labels: Cut-list with cable designators and lengths
         - Wire Labels: End-point labels showing connection information
@@ -82,6 +121,11 @@ class WorkflowManager:
             output_path: Directory where Excel files will be written.
             create_bom: Whether to generate the Bill of Materials.
             create_labels: Whether to generate cable and wire label lists.
+            xlsx_engine: "openpyxl" (streaming), "pandas" or "auto"; see
+                         ``excel_writer.write_xlsx``.
+            attachment_format: "xlsx" (BOM.xlsx, Cablelabels.xlsx, WireLabels.xlsx),
+                               "workbook" (one Attachments.xlsx with a sheet for each),
+                               "csv" or "tsv" (BOM.csv, ... for machine consumers).
 
         Example:
             >>> workflow.run_attachment_workflow(
@@ -94,15 +138,23 @@ class WorkflowManager:
         # Load all data upfront to ensure complete coverage for BOM generation.
         # This approach avoids partial data loading issues when cables interact.
 
-        all_net_rows = self._source.load_net_table()
-        # Filter Logic
-        net_rows = [r for r in all_net_rows if r.cable_des in cable_filters]
-        cable_rows_filtered = [r for r in self._source.load_cable_table() if r.cable_des in cable_filters]
+        # Filter Logic: the selected cables' partitions, joined into one columnar
+        # NetTable that the transformations read without building a NetRow per wire
+        wanted = set(cable_filters)
+        net_rows = NetTable.concat(
+            rows for cable_des, rows in self._source.load_net_table_by_cable().items() if cable_des in wanted
+        )
+        cable_rows_filtered = [r for r in self._source.load_cable_table() if r.cable_des in wanted]
 
         # Load others fully
         connector_rows = self._source.load_connector_table()
         designator_rows = self._source.load_designator_table()
 
+        excel_writer.check_attachment_format(attachment_format)
+
+        # Attachment name -> rows, written together once all are ready
+        attachments: dict[str, Iterable[dict[str, Any]]] = {}
+
         if create_bom:
             bom_data = transformations.generate_bom_data(
                 net_rows=net_rows,
@@ -111,14 +163,14 @@ class WorkflowManager:
                 cable_rows=cable_rows_filtered,
             )
             bom_data = excel_writer.add_misc_bom_items(bom_data, "MiscBOM", output_path)
-            excel_writer.write_xlsx(bom_data, "BOM", output_path)
+            attachments["BOM"] = bom_data
 
         if create_labels:
-            cable_labels = transformations.generate_cable_labels(net_rows)
-            wire_labels = transformations.generate_wire_labels(net_rows)
+            attachments["Cablelabels"] = transformations.generate_cable_labels(net_rows)
+            # Wire labels are streamed to the writer as they are generated
+            attachments["WireLabels"] = transformations.iter_wire_labels(transformations.sort_net_rows(net_rows))
 
-            excel_writer.write_xlsx(cable_labels, "Cablelabels", output_path)
-            excel_writer.write_xlsx(wire_labels, "WireLabels", output_path)
+        excel_writer.write_attachments(attachments, output_path, attachment_format, engine=xlsx_engine)
 
         parts = []
         if create_bom:
@@ -135,7 +187,8 @@ class WorkflowManager:
         available_images: set[str],
         pins_last: list[str] | None = None,
         connector_overrides: dict[str, dict] | None = None,
-    ) -> None:
+        net_rows: Sequence[NetRow] | None = None,
+    ) -> bool:
         """
         Generates a WireViz YAML file for a single cable.
 
@@ -151,6 +204,14 @@ class WorkflowManager:
             cable_filter: Single cable designator (e.g., "W001").
             yaml_filepath: Full path where YAML file should be written.
             available_images: Set of image filenames available for connector images.
+            net_rows: Pre-loaded NetTable rows for this cable. When building many
+                      cables, pass partitions from ``load_net_table_by_cable()`` to
+                      avoid one NetTable query per cable.
+
+        Returns:
+            True if the YAML file was written, False if its content was unchanged
+            (the file, and its mtime, are then left alone).
+            The diagram's render cost is recorded in ``render_costs[cable_filter]``.
 
         Example:
             >>> images = {"terminal.png", "connector_x1.png"}
@@ -161,7 +222,10 @@ class WorkflowManager:
             ... )
         """
         # Load & Filter
-        net_rows, connector_rows, designator_rows, cable_rows = self._load_and_filter_data(cable_filter)
+        net_rows, connector_rows, designator_rows, cable_rows = self._load_and_filter_data(cable_filter, net_rows)
+
+        # Sort once: cables and connections share the same wire order
+        net_rows = transformations.sort_net_rows(net_rows)
 
         # Transform
         connector_data = transformations.process_connectors(
@@ -170,6 +234,8 @@ class WorkflowManager:
             connector_rows=connector_rows,
             available_images=available_images,
             filter_active=True,
+            index=self._get_connector_index(designator_rows, connector_rows),
+            diagnostics=self.diagnostics,
         )
 
         cable_data = transformations.process_cables(net_rows=net_rows, cable_rows=cable_rows)
@@ -182,7 +248,10 @@ class WorkflowManager:
             connector_data, connection_data, pins_last=pins_last, connector_overrides=connector_overrides
         )
 
+        images = sum(1 for connector in connector_data if connector.image_src)
+        self.render_costs[cable_filter] = render_cost(len(connection_data), len(connector_data), images)
+
         # Build View
-        BuildYaml.build_yaml_file(
+        return BuildYaml.build_yaml_file(
             connectors=connector_data, cables=cable_data, connections=connection_data, yaml_filepath=yaml_filepath
         )